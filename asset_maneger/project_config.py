@@ -2,5 +2,14 @@
 
 CONFIG_DATA = {
     "project_name": "grow",
-    "project_path": r"E:"
+    "project_path": r"E:",
+    "use_content_store": False,  # Deduplicate published scenes (see publish_tool/core/content_store.py)
+    "use_delta_chain": False,  # Store scenes as keyframes + deltas (see publish_tool/core/delta_store.py)
+    "delta_keyframe_interval": 10,
+    "compression": None,  # Compress published scenes: "zlib", "lzma" or "bz2", optionally with ":<level>"
+    "department_compression": {},  # Per-department override, e.g. {"modeling": "lzma:6", "rigging": "zlib:1"}
+    "use_local_staging": False,  # Save publishes locally and upload them in the background (see publish_tool/core/upload_queue.py)
+    "gather_dependencies": False,  # Copy textures and references into the publish (see publish_tool/core/dependency_utils.py)
+    "validators": {},  # Pre-publish checks -> "error" or "warning", e.g. {"naming": "warning", "mesh_uvs": "error"} (see publish_tool/core/validation.py)
+    "profile_publish": False  # Save a cProfile/tracemalloc profile next to every publish (see publish_tool/core/trace_utils.py)
 }
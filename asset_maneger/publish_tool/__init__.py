@@ -0,0 +1,131 @@
+# File: asset_manager/publish_tool/__init__.py
+"""
+Asset publishing tools for Maya.
+
+Importing the package is cheap: PySide2, the Maya UI modules and the core
+modules are only imported on first use, either through show() or through
+attribute access (PEP 562), e.g. `publish_tool.asset_maneger_ui`.
+
+Set ASSET_PIPELINE_ENV=development to reload the core modules, the project
+config and the UI every time the tool is opened. Without it, modules are
+imported once per session.
+
+Import times of lazily loaded modules are recorded; print them with:
+
+    import publish_tool
+    publish_tool.show()
+    print(publish_tool.format_import_timings())
+"""
+
+import importlib
+import os
+import sys
+import time
+
+DEV_ENV_VAR = "ASSET_PIPELINE_ENV"
+
+# Reloaded in this order in development mode: dependencies first
+RELOAD_ORDER = (
+    "project_config",
+    "publish_tool.core.trace_utils",
+    "publish_tool.core.scene_adapter",
+    "publish_tool.core.asset_scene_utils",
+    "publish_tool.core.user_utils",
+    "publish_tool.core.file_utils",
+    "publish_tool.core.version_utils",
+    "publish_tool.core.json_utils",
+    "publish_tool.core.publish_pipeline",
+    "publish_tool.core.preview_utils",
+    "publish_tool.core.catalog",
+    "publish_tool.core.content_store",
+    "publish_tool.core.delta_store",
+    "publish_tool.core.compression_utils",
+    "publish_tool.core.asset_resolver",
+    "publish_tool.core.publish_watcher",
+    "publish_tool.core.metadata_service",
+    "publish_tool.core.upload_queue",
+    "publish_tool.core.dependency_utils",
+    "publish_tool.core.validation",
+    "publish_tool.core.thumbnail_utils",
+    "publish_tool.core.publisher_logic",
+)
+
+_LAZY_SUBMODULES = {"asset_maneger_ui", "asset_browser_ui", "core", "testing", "tools", "benchmarks"}
+
+_import_timings = {}
+
+
+def is_dev_mode() -> bool:
+    """
+    Returns True if ASSET_PIPELINE_ENV is set to 'development'.
+    """
+    return os.environ.get(DEV_ENV_VAR, "").strip().lower() == "development"
+
+
+def timed_import(module_name: str):
+    """
+    Imports a module and records how long the first import took.
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    _import_timings.setdefault(module_name, time.perf_counter() - start)
+    return module
+
+
+def import_timings() -> dict:
+    """
+    Returns {module name: seconds} for modules loaded through timed_import or reload_modules.
+    """
+    return dict(_import_timings)
+
+
+def format_import_timings() -> str:
+    lines = [f"{seconds * 1000:>9.2f} ms  {name}" for name, seconds in
+             sorted(_import_timings.items(), key=lambda item: item[1], reverse=True)]
+    return "\n".join(lines)
+
+
+def reload_modules() -> None:
+    """
+    Reloads the already imported core modules and the project config (development mode).
+    """
+    for module_name in RELOAD_ORDER:
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        start = time.perf_counter()
+        importlib.reload(module)
+        _import_timings[f"reload {module_name}"] = time.perf_counter() - start
+
+
+def show():
+    """
+    Opens the Asset Publisher window, importing the UI on first use.
+    """
+    already_imported = "publish_tool.asset_maneger_ui" in sys.modules
+    ui_module = timed_import("publish_tool.asset_maneger_ui")
+    if already_imported and is_dev_mode():
+        # Reloading the UI module reloads the core modules first (see asset_maneger_ui)
+        start = time.perf_counter()
+        ui_module = importlib.reload(ui_module)
+        _import_timings["reload publish_tool.asset_maneger_ui"] = time.perf_counter() - start
+    return ui_module.show_ui()
+
+
+def show_browser():
+    """
+    Opens the Asset Browser window over the whole publish tree.
+    """
+    already_imported = "publish_tool.asset_browser_ui" in sys.modules
+    ui_module = timed_import("publish_tool.asset_browser_ui")
+    if already_imported and is_dev_mode():
+        start = time.perf_counter()
+        ui_module = importlib.reload(ui_module)
+        _import_timings["reload publish_tool.asset_browser_ui"] = time.perf_counter() - start
+    return ui_module.show_ui()
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return timed_import(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
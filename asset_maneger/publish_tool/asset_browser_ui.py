@@ -0,0 +1,521 @@
+from PySide2 import QtWidgets, QtCore, QtGui
+import shiboken2
+import collections
+import os
+
+import publish_tool
+import project_config as config
+
+# Development mode only: see asset_maneger_ui
+if publish_tool.is_dev_mode() and "AssetBrowserUI" in globals():
+    publish_tool.reload_modules()
+
+import publish_tool.core.metadata_service as metadata_service_module
+import publish_tool.core.publish_watcher as publish_watcher_module
+import publish_tool.core.publisher_logic as publisher_logic_module
+import publish_tool.core.thumbnail_utils as thumbnail_utils_module
+
+FETCH_BATCH = 200  # rows added to the view each time it scrolls near the end
+THUMBNAIL_SIZE = QtCore.QSize(160, 120)
+PIXMAP_CACHE_BYTES = 64 * 1024 * 1024
+MAX_PENDING_THUMBNAILS = 256  # older requests are dropped once rows scroll away
+FILTER_DELAY_MS = 150
+
+
+def get_maya_main_window():
+    try:
+        import maya.OpenMayaUI as omui
+        from shiboken2 import wrapInstance
+    except ImportError:
+        return None
+    main_window_ptr = omui.MQtUtil.mainWindow()
+    return wrapInstance(int(main_window_ptr), QtWidgets.QWidget) if main_window_ptr else None
+
+
+class PixmapCache:
+    """
+    LRU cache of QPixmaps bounded by their decoded size in bytes.
+    """
+
+    def __init__(self, max_bytes=PIXMAP_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._pixmaps = collections.OrderedDict()
+
+    @staticmethod
+    def cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key):
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key, pixmap):
+        previous = self._pixmaps.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= self.cost(previous)
+        self._pixmaps[key] = pixmap
+        self.total_bytes += self.cost(pixmap)
+        while self.total_bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self.total_bytes -= self.cost(evicted)
+
+    def clear(self):
+        self._pixmaps.clear()
+        self.total_bytes = 0
+
+
+class BrowserSignals(QtCore.QObject):
+    """
+    Signals of the browser's background jobs. Created on the main thread, so
+    emits from pool threads are queued to it.
+    """
+    thumbnail_loaded = QtCore.Signal(object, object)  # key, QImage or None
+    rows_loaded = QtCore.Signal(object)  # list of row dicts
+    rows_failed = QtCore.Signal(str)
+    filtered = QtCore.Signal(int, object)  # generation, row indices
+    changes_detected = QtCore.Signal(object)  # list of PublishWatcher change dicts
+
+
+class ThumbnailJob(QtCore.QRunnable):
+    """
+    Decodes one thumbnail at THUMBNAIL_SIZE. QImage is safe to use off the
+    main thread; the QPixmap is made from it on the main thread.
+    """
+
+    def __init__(self, key, paths, signals):
+        super(ThumbnailJob, self).__init__()
+        self.key = key
+        self.paths = paths
+        self.signals = signals
+
+    def run(self):
+        for path in self.paths:
+            if not path or not os.path.isfile(path):
+                continue
+            reader = QtGui.QImageReader(path)
+            size = reader.size()
+            if size.isValid() and (size.width() > THUMBNAIL_SIZE.width() or size.height() > THUMBNAIL_SIZE.height()):
+                # JPEGs are then decoded at a reduced scale instead of in full
+                reader.setScaledSize(size.scaled(THUMBNAIL_SIZE, QtCore.Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                self.signals.thumbnail_loaded.emit(self.key, image)
+                return
+        self.signals.thumbnail_loaded.emit(self.key, None)
+
+
+def add_search_text(row):
+    """
+    Adds the lower case text the search box matches against to a catalog row.
+    """
+    row["search_text"] = " ".join(
+        str(row.get(key) or "") for key in
+        ("asset_name", "asset_type", "department", "version", "publisher", "comment")
+    ).lower()
+    return row
+
+
+class RowsJob(QtCore.QRunnable):
+    """
+    Refreshes the project catalog (which indexes every metadata.json and
+    history log under publish/) and reads the latest version of every asset
+    and department, through the workstation's metadata service when one runs.
+    """
+
+    def __init__(self, project_root, signals):
+        super(RowsJob, self).__init__()
+        self.project_root = project_root
+        self.signals = signals
+
+    def run(self):
+        try:
+            client = metadata_service_module.MetadataClient.for_project(self.project_root)
+            rows = [add_search_text(row) for row in client.latest_versions(refresh=True)]
+            self.signals.rows_loaded.emit(rows)
+        except Exception as e:
+            self.signals.rows_failed.emit(str(e))
+
+
+class FilterJob(QtCore.QRunnable):
+    """
+    Matches rows against the search words and the type/department filters.
+    """
+
+    def __init__(self, generation, rows, text, asset_type, department, signals):
+        super(FilterJob, self).__init__()
+        self.generation = generation
+        self.rows = rows
+        self.words = text.lower().split()
+        self.asset_type = asset_type
+        self.department = department
+        self.signals = signals
+
+    def run(self):
+        indices = [
+            index for index, row in enumerate(self.rows)
+            if (not self.asset_type or row["asset_type"] == self.asset_type)
+            and (not self.department or row["department"] == self.department)
+            and all(word in row["search_text"] for word in self.words)
+        ]
+        self.signals.filtered.emit(self.generation, indices)
+
+
+class ThumbnailLoader(QtCore.QObject):
+    """
+    Loads thumbnails on a thread pool into a PixmapCache.
+
+    Requests are served newest first, so the rows on screen are decoded
+    before the ones that were scrolled past, and at most
+    MAX_PENDING_THUMBNAILS requests are kept waiting.
+    """
+    thumbnail_ready = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super(ThumbnailLoader, self).__init__(parent)
+        self.cache = PixmapCache()
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, min(4, QtCore.QThread.idealThreadCount())))
+        self.signals = BrowserSignals(self)
+        self.signals.thumbnail_loaded.connect(self._on_loaded)
+        self._pending = collections.OrderedDict()
+        self._in_flight = set()
+        self._missing = set()
+
+    def pixmap(self, key, paths):
+        """
+        Returns the cached pixmap for key, or None after queueing it.
+        """
+        pixmap = self.cache.get(key)
+        if pixmap is not None or key in self._missing or key in self._in_flight:
+            return pixmap
+        self._pending.pop(key, None)
+        self._pending[key] = paths
+        while len(self._pending) > MAX_PENDING_THUMBNAILS:
+            self._pending.popitem(last=False)
+        self._pump()
+        return None
+
+    def _pump(self):
+        while self._pending and len(self._in_flight) < self.pool.maxThreadCount():
+            key, paths = self._pending.popitem(last=True)
+            self._in_flight.add(key)
+            self.pool.start(ThumbnailJob(key, paths, self.signals))
+
+    def _on_loaded(self, key, image):
+        self._in_flight.discard(key)
+        if image is None:
+            self._missing.add(key)
+        else:
+            self.cache.insert(key, QtGui.QPixmap.fromImage(image))
+            self.thumbnail_ready.emit(key)
+        self._pump()
+
+    def clear(self):
+        self._pending.clear()
+        self._missing.clear()
+        self.cache.clear()
+
+
+class AssetListModel(QtCore.QAbstractListModel):
+    """
+    List of the latest publish of every asset and department.
+
+    Holds all rows but exposes them to the view FETCH_BATCH at a time
+    through canFetchMore/fetchMore, so the view only lays out rows that
+    have been scrolled into range.
+    """
+    RowRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super(AssetListModel, self).__init__(parent)
+        self._rows = []
+        self._visible = []
+        self._positions = {}
+        self._row_keys = {}
+        self._row_positions = {}
+        self._fetched = 0
+        self.thumbnails = ThumbnailLoader(self)
+        self.thumbnails.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._placeholder = QtGui.QPixmap(THUMBNAIL_SIZE)
+        self._placeholder.fill(QtGui.QColor("#3a3a3a"))
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self._row_keys = {self._row_key(row): index for index, row in enumerate(rows)}
+        self._visible = list(range(len(rows)))
+        self._fetched = min(FETCH_BATCH, len(self._visible))
+        self._update_positions()
+        self.thumbnails.clear()
+        self.endResetModel()
+
+    def set_visible(self, indices):
+        """
+        Shows only the rows at these indices of the full row list.
+        """
+        self.beginResetModel()
+        self._visible = indices
+        self._fetched = min(FETCH_BATCH, len(self._visible))
+        self._update_positions()
+        self.endResetModel()
+
+    @staticmethod
+    def _row_key(row):
+        return row["asset_type"], row["asset_name"], row["department"]
+
+    def update_rows(self, rows):
+        """
+        Replaces the rows of the same asset and department in place and
+        appends new ones, without resetting the view.
+
+        Returns:
+            bool: True if rows were appended; they show up after the next filter.
+        """
+        appended = False
+        changed = []
+        for row in rows:
+            index = self._row_keys.get(self._row_key(row))
+            if index is None:
+                self._row_keys[self._row_key(row)] = len(self._rows)
+                self._rows.append(row)
+                appended = True
+            else:
+                self._rows[index] = row
+                changed.append(index)
+        if changed:
+            self._update_positions()
+            for index in changed:
+                position = self._row_positions.get(index)
+                if position is not None and position < self._fetched:
+                    model_index = self.index(position)
+                    self.dataChanged.emit(model_index, model_index)
+        return appended
+
+    def _update_positions(self):
+        self._positions = {}
+        self._row_positions = {}
+        for position, index in enumerate(self._visible):
+            self._positions.setdefault(self._rows[index].get("preview_image"), []).append(position)
+            self._row_positions[index] = position
+
+    def visible_count(self):
+        return len(self._visible)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._visible)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        count = min(FETCH_BATCH, len(self._visible) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        row = self._rows[self._visible[index.row()]]
+        if role == QtCore.Qt.DisplayRole:
+            return f"{row['asset_name']}\n{row['department']} · {row['version']}"
+        if role == QtCore.Qt.DecorationRole:
+            preview = row.get("preview_image")
+            if not preview:
+                return self._placeholder
+            paths = [thumbnail_utils_module.thumbnail_path(preview, "medium"), preview]
+            return self.thumbnails.pixmap(preview, paths) or self._placeholder
+        if role == QtCore.Qt.ToolTipRole:
+            return (f"{row['asset_type']}/{row['asset_name']} ({row['department']} {row['version']})\n"
+                    f"{row.get('publisher') or ''}  {row.get('publish_date') or ''}\n{row.get('comment') or ''}")
+        if role == self.RowRole:
+            return row
+        return None
+
+    def _on_thumbnail_ready(self, key):
+        for position in self._positions.get(key, ()):
+            if position < self._fetched:
+                model_index = self.index(position)
+                self.dataChanged.emit(model_index, model_index, [QtCore.Qt.DecorationRole])
+
+
+class AssetBrowserUI(QtWidgets.QWidget):
+    def __init__(self, parent=None):
+        super(AssetBrowserUI, self).__init__(parent)
+        self.setWindowTitle("Asset Browser")
+        self.setWindowFlags(QtCore.Qt.Window)
+        self.resize(900, 640)
+
+        self.config = getattr(config, "CONFIG_DATA", {})
+        self.project_name = self.config.get("project_name", "Unknown Project")
+        self.project_root = os.path.join(self.config.get("project_path", "N/A"), self.project_name)
+
+        self.model = AssetListModel(self)
+        self.pool = QtCore.QThreadPool(self)
+        self.signals = BrowserSignals(self)
+        self.signals.rows_loaded.connect(self.on_rows_loaded)
+        self.signals.rows_failed.connect(self.on_rows_failed)
+        self.signals.filtered.connect(self.on_filtered)
+        self.signals.changes_detected.connect(self.on_changes_detected)
+        self.filter_generation = 0
+        self.filter_timer = QtCore.QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+
+        self.setStyleSheet("""
+            QWidget {
+                background-color: #444444;
+                color: #e0e0e0;
+                font-family: 'Segoe UI', 'Arial';
+                font-size: 10.5pt;
+            }
+            QLineEdit, QComboBox, QListView {
+                background-color: #3B3B3B;
+                border: none;
+                padding: 6px;
+                color: #e0e0e0;
+            }
+            QListView::item:selected { background-color: #3a79c5; }
+        """)
+        self.build_ui()
+        QtCore.QTimer.singleShot(0, self.refresh_action)
+
+        # New publishes show up without a rescan; see on_changes_detected
+        self.watcher = publish_watcher_module.PublishWatcher.for_project(self.project_root)
+        self._watcher_callback = self.signals.changes_detected.emit
+        self.watcher.subscribe(self._watcher_callback)
+
+    def build_ui(self):
+        main_layout = QtWidgets.QVBoxLayout(self)
+
+        filter_row = QtWidgets.QHBoxLayout()
+        self.search_input = QtWidgets.QLineEdit()
+        self.search_input.setPlaceholderText("Search assets, departments, publishers, comments...")
+        self.search_input.textChanged.connect(self.filter_timer.start)
+        self.type_dropdown = QtWidgets.QComboBox()
+        self.type_dropdown.setMinimumWidth(130)
+        self.type_dropdown.currentIndexChanged.connect(self.filter_timer.start)
+        self.department_dropdown = QtWidgets.QComboBox()
+        self.department_dropdown.setMinimumWidth(130)
+        self.department_dropdown.currentIndexChanged.connect(self.filter_timer.start)
+        self.refresh_btn = QtWidgets.QPushButton()
+        self.refresh_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_BrowserReload))
+        self.refresh_btn.setToolTip("Rescan the publish folder.")
+        self.refresh_btn.clicked.connect(self.refresh_action)
+        filter_row.addWidget(self.search_input, 1)
+        filter_row.addWidget(self.type_dropdown)
+        filter_row.addWidget(self.department_dropdown)
+        filter_row.addWidget(self.refresh_btn)
+        main_layout.addLayout(filter_row)
+
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setViewMode(QtWidgets.QListView.IconMode)
+        self.list_view.setResizeMode(QtWidgets.QListView.Adjust)
+        self.list_view.setMovement(QtWidgets.QListView.Static)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setIconSize(THUMBNAIL_SIZE)
+        self.list_view.setGridSize(QtCore.QSize(THUMBNAIL_SIZE.width() + 24, THUMBNAIL_SIZE.height() + 52))
+        self.list_view.setWordWrap(True)
+        self.list_view.setModel(self.model)
+        self.list_view.selectionModel().currentChanged.connect(self.on_current_changed)
+        main_layout.addWidget(self.list_view, 1)
+
+        self.status_label = QtWidgets.QLabel("Loading...")
+        self.status_label.setStyleSheet("QLabel { color: #a0a0a0; font-size: 9pt; }")
+        self.status_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        main_layout.addWidget(self.status_label)
+
+    def _fill_dropdown(self, dropdown, all_label, items):
+        current = dropdown.currentData()
+        dropdown.blockSignals(True)
+        dropdown.clear()
+        dropdown.addItem(all_label, "")
+        for label, value in items:
+            dropdown.addItem(label, value)
+        position = dropdown.findData(current)
+        dropdown.setCurrentIndex(position if position >= 0 else 0)
+        dropdown.blockSignals(False)
+
+    def refresh_action(self):
+        """Rescans the publish tree on a background thread."""
+        self.refresh_btn.setEnabled(False)
+        self.status_label.setText("Scanning publishes...")
+        self.pool.start(RowsJob(self.project_root, self.signals))
+
+    def on_rows_loaded(self, rows):
+        self.refresh_btn.setEnabled(True)
+        asset_types = sorted({row["asset_type"] for row in rows})
+        departments = sorted({row["department"] for row in rows})
+        self._fill_dropdown(self.type_dropdown, "All types", [(name, name) for name in asset_types])
+        self._fill_dropdown(self.department_dropdown, "All departments", [
+            (publisher_logic_module.AssetPublisherLogic.get_department_name(code) or code, code)
+            for code in departments
+        ])
+        self.model.set_rows(rows)
+        self.apply_filter()
+
+    def on_changes_detected(self, changes):
+        """Applies the publishes the watcher reported to the loaded rows."""
+        if any("rescan" in change["kinds"] for change in changes):
+            self.refresh_action()
+            return
+        rows = [add_search_text(dict(change["row"])) for change in changes if change.get("row")]
+        if rows and self.model.update_rows(rows):
+            self.apply_filter()
+
+    def on_rows_failed(self, error):
+        self.refresh_btn.setEnabled(True)
+        self.status_label.setText("")
+        QtWidgets.QMessageBox.critical(self, "Asset Browser", f"❌ Failed to read the publish catalog:\n{error}")
+
+    def apply_filter(self):
+        """Filters the rows on a background thread; results of older filters are ignored."""
+        self.filter_generation += 1
+        self.pool.start(FilterJob(
+            self.filter_generation, self.model.rows, self.search_input.text(),
+            self.type_dropdown.currentData(), self.department_dropdown.currentData(), self.signals
+        ))
+
+    def on_filtered(self, generation, indices):
+        if generation != self.filter_generation:
+            return
+        self.model.set_visible(indices)
+        self.status_label.setText(f"{len(indices)} of {len(self.model.rows)} published assets")
+
+    def on_current_changed(self, current, previous):
+        row = self.model.data(current, AssetListModel.RowRole)
+        if row:
+            self.status_label.setText(row.get("file_path") or "")
+
+    def closeEvent(self, event):
+        self.watcher.unsubscribe(self._watcher_callback)
+        self.filter_timer.stop()
+        self.model.thumbnails.clear()
+        super(AssetBrowserUI, self).closeEvent(event)
+
+
+# Open browser windows, kept across development reloads (see asset_maneger_ui)
+_ui_registry = globals().get("_ui_registry", {})
+
+def show_ui(parent=None):
+    """
+    Opens the Asset Browser, replacing a window that is already open.
+    """
+    previous = _ui_registry.pop("AssetBrowserUI", None)
+    if previous is not None and shiboken2.isValid(previous):
+        previous.close()
+        previous.deleteLater()
+    ui = AssetBrowserUI(parent=parent or get_maya_main_window())
+    _ui_registry["AssetBrowserUI"] = ui
+    ui.show()
+    return ui
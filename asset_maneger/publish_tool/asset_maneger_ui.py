@@ -1,29 +1,26 @@
 from PySide2 import QtWidgets, QtCore, QtGui
+import shiboken2
 from shiboken2 import wrapInstance
 import maya.OpenMayaUI as omui
-import maya.cmds as mc
-import importlib
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaUI as omui2
+import ctypes
+import logging
 import tempfile
 import os
-import shutil  # 🔧 Required for copying preview images
 
-
-
-# Import and reload utility modules
+import publish_tool
 import project_config as config
-import publish_tool.core.asset_scene_utils as asset_scene_utils_module
-import publish_tool.core.user_utils as user_utils_module
-import publish_tool.core.file_utils as file_utils_module
-import publish_tool.core.version_utils as version_utils_module
-import publish_tool.core.json_utils as json_utils_module
 
+# Development mode only: a reload of this module (importlib.reload or
+# publish_tool.show()) first reloads the core modules and the config.
+# globals() still holds the previous definitions during a reload.
+if publish_tool.is_dev_mode() and "AssetPublisherUI" in globals():
+    publish_tool.reload_modules()
 
-importlib.reload(asset_scene_utils_module)
-importlib.reload(user_utils_module)
-importlib.reload(file_utils_module)
-importlib.reload(version_utils_module)
-importlib.reload(json_utils_module)
-importlib.reload(config)
+import publish_tool.core.asset_scene_utils as asset_scene_utils_module
+import publish_tool.core.publisher_logic as publisher_logic_module
+import publish_tool.core.upload_queue as upload_queue_module
 
 def get_maya_main_window():
     main_window_ptr = omui.MQtUtil.mainWindow()
@@ -77,6 +74,28 @@ class CreateAssetDialog(QtWidgets.QDialog):
     def get_data(self):
         return self.asset_name_input.text().strip(), self.asset_type_dropdown.currentText()
 
+class PublishSignals(QtCore.QObject):
+    """
+    Qt bridge for PublishPipeline callbacks.
+
+    Must be created on the main thread. Signals emitted from pipeline worker
+    threads are queued to the main thread, and run_on_main is used as the
+    pipeline's main thread dispatcher for Maya steps.
+    """
+    step_started = QtCore.Signal(int, int, str)
+    step_finished = QtCore.Signal(int, int, str, float)
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(str, str)
+    cancelled = QtCore.Signal()
+    run_on_main = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super(PublishSignals, self).__init__(parent)
+        self.run_on_main.connect(self._call, QtCore.Qt.QueuedConnection)
+
+    def _call(self, func):
+        func()
+
 class AssetPublisherUI(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super(AssetPublisherUI, self).__init__(parent)
@@ -91,20 +110,19 @@ class AssetPublisherUI(QtWidgets.QWidget):
         self.project_name = self.config.get("project_name", "Unknown Project")
         self.project_root = self.config.get("project_path", "N/A")
 
-        # Initialize logic class
-        self.logic = AssetPublisherLogic(self.project_root, self.project_name)
-
-        # Load initial metadata using logic class
-        metadata = self.logic.load_asset_metadata()
-        self.asset_name = metadata.get("asset_name", "Unnamed")
-        self.asset_type = metadata.get("asset_type", "Unknown")
-        self.version = metadata.get("version", "v001")
-        self.creator = metadata.get("creator_name", "Unknown")
-
-        if self.project_root != "N/A" and self.asset_name != "Unnamed" and self.asset_type != "Unknown":
-            self.publish_dir = os.path.join(self.project_root, self.asset_type, self.asset_name, "publish").replace("\\", "/")
-        else:
-            self.publish_dir = metadata.get("publish_path", "N/A")
+        # Initialize logic class; the scene metadata is read once, after first paint
+        self.logic = AssetPublisherLogic(
+            self.project_root,
+            self.project_name,
+            load_metadata=False,
+            **publisher_logic_module.storage_options_from_config(self.config)
+        )
+        self.publish_pipeline = None
+        self.publish_signals = PublishSignals(self)
+        self.publish_signals.step_started.connect(self.on_publish_step_started)
+        self.publish_signals.finished.connect(self.on_publish_finished)
+        self.publish_signals.failed.connect(self.on_publish_failed)
+        self.publish_signals.cancelled.connect(self.on_publish_cancelled)
 
         self.setStyleSheet("""
             QWidget {
@@ -125,6 +143,50 @@ class AssetPublisherUI(QtWidgets.QWidget):
         """)
         self.build_ui()
 
+        # Labels and dropdowns are filled right after the window is painted
+        QtCore.QTimer.singleShot(0, self.populate_from_scene)
+
+    def populate_from_scene(self):
+        """
+        Reads the scene metadata once and fills the metadata labels and the
+        department dropdown.
+        """
+        metadata = self.logic.refresh_metadata(self.metadata_labels)
+        if not self.department_dropdown.count():
+            self.department_dropdown.addItems(list(publisher_logic_module.DEPARTMENTS))
+        department_name = self.logic.get_department_name(metadata.get("department"))
+        self.department_dropdown.setCurrentText(department_name or "modeling")
+        self.publish_btn.setEnabled(True)
+
+        if self.logic.use_local_staging:
+            # Uploads interrupted by an earlier Maya session continue now
+            upload_queue_module.UploadQueue.instance().resume()
+            self.upload_timer.start()
+            self.update_upload_status()
+
+    def closeEvent(self, event):
+        if self.logic.validation:
+            # Its node change callbacks would otherwise outlive the window;
+            # they are registered again by the next validation run
+            self.logic.validation.stop_tracking()
+        super(AssetPublisherUI, self).closeEvent(event)
+
+    def update_upload_status(self):
+        """
+        Shows the background upload queue state below the publish button.
+        """
+        status = upload_queue_module.UploadQueue.instance().status()
+        parts = []
+        if status["uploading"]:
+            percent = status["bytes_done"] * 100 // status["bytes_total"] if status["bytes_total"] else 0
+            parts.append(f"Uploading {status['uploading']} ({percent}%)")
+        if status["pending"]:
+            parts.append(f"{status['pending']} queued")
+        if status["failed"]:
+            parts.append(f"<span style='color:#e06c6c'>{status['failed']} failed</span>")
+        self.upload_status_label.setText(" · ".join(parts) if parts else "All uploads finished")
+        self.upload_status_label.setVisible(bool(parts))
+
     def build_ui(self):
         main_layout = QtWidgets.QVBoxLayout(self)
         artist_name = os.environ.get("USERNAME") or os.environ.get("USER") or "JohnDoe"
@@ -164,8 +226,6 @@ class AssetPublisherUI(QtWidgets.QWidget):
         dept_label = QtWidgets.QLabel("Department:")
         dept_label.setStyleSheet("font-weight: bold; font-size: 11pt;")
         self.department_dropdown = QtWidgets.QComboBox()
-        self.department_dropdown.addItems(["modeling", "rigging", "texturing"])
-        self.department_dropdown.setCurrentText("modeling")
         self.department_dropdown.setFixedHeight(34)
         self.department_dropdown.setMinimumWidth(480)
         self.department_dropdown.setStyleSheet("""
@@ -208,15 +268,8 @@ class AssetPublisherUI(QtWidgets.QWidget):
         preview_layout.setSpacing(8)
         preview_layout.addWidget(self.preview_label)
 
-        info_fields = {
-            "Asset Name": self.asset_name,
-            "Asset Type": self.asset_type,
-            "Version": self.version,
-            "Artist": self.creator,
-            "Publish Path": self.publish_dir
-        }
-        for key, value in info_fields.items():
-            label = QtWidgets.QLabel(f"<b>{key}:</b> {value}")
+        for key in self.logic.get_display_fields():
+            label = QtWidgets.QLabel(f"<b>{key}:</b> ...")
             label.setStyleSheet("color: #bbb; font-size: 10.5pt;")
             if key == "Publish Path":
                 label.setWordWrap(True)
@@ -227,7 +280,26 @@ class AssetPublisherUI(QtWidgets.QWidget):
         comment_row.addLayout(preview_layout)
         main_layout.addLayout(comment_row)
 
-        publish_btn = QtWidgets.QPushButton("Publish")
+        self.publish_progress = QtWidgets.QProgressBar()
+        self.publish_progress.setFixedHeight(18)
+        self.publish_progress.setTextVisible(True)
+        self.publish_progress.hide()
+        self.cancel_publish_btn = QtWidgets.QPushButton("Cancel")
+        self.cancel_publish_btn.setFixedHeight(22)
+        self.cancel_publish_btn.clicked.connect(self.cancel_publish_action)
+        self.cancel_publish_btn.hide()
+        progress_row = QtWidgets.QHBoxLayout()
+        progress_row.addWidget(self.publish_progress)
+        progress_row.addWidget(self.cancel_publish_btn)
+        main_layout.addLayout(progress_row)
+
+        self.validation_label = QtWidgets.QLabel("")
+        self.validation_label.setStyleSheet("QLabel { color: #a0a0a0; font-size: 9pt; }")
+        self.validation_label.setTextFormat(QtCore.Qt.RichText)
+        self.validation_label.hide()
+        main_layout.addWidget(self.validation_label)
+
+        self.publish_btn = publish_btn = QtWidgets.QPushButton("Publish")
         publish_btn.setFixedSize(200, 46)
         publish_btn.setStyleSheet("""
             QPushButton {
@@ -243,14 +315,96 @@ class AssetPublisherUI(QtWidgets.QWidget):
             }
         """)
         publish_btn.clicked.connect(self.publish_asset_action) # Connect to UI action method
+        publish_btn.setEnabled(False)  # Enabled once the scene metadata is loaded
         main_layout.addSpacing(10)
         main_layout.addWidget(publish_btn, alignment=QtCore.Qt.AlignHCenter)
 
+        self.upload_status_label = QtWidgets.QLabel("")
+        self.upload_status_label.setStyleSheet("QLabel { color: #a0a0a0; font-size: 9pt; }")
+        self.upload_status_label.hide()
+        main_layout.addWidget(self.upload_status_label, alignment=QtCore.Qt.AlignHCenter)
+        self.upload_timer = QtCore.QTimer(self)
+        self.upload_timer.setInterval(500)
+        self.upload_timer.timeout.connect(self.update_upload_status)
+
     def publish_asset_action(self):
         """Action method to trigger logic publish."""
         comment = self.comment_box.toPlainText().strip()
         department = self.department_dropdown.currentText().lower()
-        self.logic.publish_asset(comment, department, self.metadata_labels, self.preview_label) # Pass UI data/elements
+        self.publish_btn.setEnabled(False)
+        self.publish_progress.setValue(0)
+        self.publish_progress.show()
+        self.cancel_publish_btn.setEnabled(True)
+        self.cancel_publish_btn.show()
+        self.publish_pipeline = self.logic.publish_asset(comment, department, self.publish_signals)
+
+    def cancel_publish_action(self):
+        """Requests cancellation of the running publish."""
+        if self.publish_pipeline and not self.publish_pipeline.done:
+            self.publish_pipeline.cancel()
+            self.cancel_publish_btn.setEnabled(False)
+            self.publish_progress.setFormat("Cancelling...")
+
+    def on_publish_step_started(self, index, total, name):
+        self.publish_progress.setMaximum(total)
+        self.publish_progress.setValue(index)
+        self.publish_progress.setFormat(f"{name} ({index + 1}/{total})")
+
+    def show_validation_report(self, report):
+        """
+        Lists each validator's time, node counts and issues below the progress bar.
+        """
+        if report is None:
+            self.validation_label.hide()
+            return
+        lines = []
+        for result in report.results:
+            errors = sum(1 for issue in result.issues if issue.severity == "error")
+            warnings = len(result.issues) - errors
+            status = "✓"
+            if errors:
+                status = f"<span style='color:#e06c6c'>{errors} error(s)</span>"
+            elif warnings:
+                status = f"<span style='color:#e0b46c'>{warnings} warning(s)</span>"
+            lines.append(
+                f"{result.label}: {result.seconds * 1000:.1f} ms · {result.nodes} node(s), "
+                f"{result.cached} unchanged · {status}"
+            )
+        lines.append(f"<b>Validation: {report.seconds * 1000:.1f} ms</b>")
+        self.validation_label.setText("<br>".join(lines))
+        self.validation_label.show()
+
+    def _end_publish(self):
+        self.publish_pipeline = None
+        self.publish_btn.setEnabled(True)
+        self.publish_progress.hide()
+        self.cancel_publish_btn.hide()
+
+    def on_publish_finished(self, context):
+        self._end_publish()
+        if self.logic.validation:
+            self.show_validation_report(self.logic.validation.last_report)
+        self.logic.refresh_metadata(self.metadata_labels)
+        self.logic.show_preview_image(self.preview_label)
+        if context.get("upload_job_id"):
+            self.update_upload_status()
+            QtWidgets.QMessageBox.information(
+                self, "Publish Queued",
+                f"✅ Saved {self.logic.version} for {context['department']}; it is uploading to the project "
+                f"in the background and appears in the history once it is there."
+            )
+            return
+        QtWidgets.QMessageBox.information(self, "Publish Success", f"✅ Published to {context['department']} with comment:\n{context['comment']}")
+
+    def on_publish_failed(self, step_name, error):
+        self._end_publish()
+        if self.logic.validation:
+            self.show_validation_report(self.logic.validation.last_report)
+        QtWidgets.QMessageBox.critical(self, "Publish Failed", f"❌ Publish failed at '{step_name}':\n{error}")
+
+    def on_publish_cancelled(self):
+        self._end_publish()
+        QtWidgets.QMessageBox.warning(self, "Publish Cancelled", "Publish was cancelled.")
 
     def show_menu(self):
         menu = QtWidgets.QMenu(self)
@@ -259,6 +413,19 @@ class AssetPublisherUI(QtWidgets.QWidget):
         close_icon = self.style().standardIcon(QtWidgets.QStyle.SP_DialogCloseButton)
         menu.addAction(new_icon, "Create New Asset", self.create_new_asset_action) # Connect to UI action method
         menu.addAction(refresh_icon, "Refresh Metadata", self.refresh_metadata_action) # Connect to UI action method
+        browse_icon = self.style().standardIcon(QtWidgets.QStyle.SP_DirIcon)
+        menu.addAction(browse_icon, "Browse Assets", publish_tool.show_browser)
+        if self.logic.validation:
+            validate_icon = self.style().standardIcon(QtWidgets.QStyle.SP_DialogApplyButton)
+            menu.addAction(validate_icon, "Run Validators", self.run_validators_action)
+        if self.logic.use_local_staging:
+            retry_icon = self.style().standardIcon(QtWidgets.QStyle.SP_ArrowUp)
+            menu.addAction(retry_icon, "Retry Failed Uploads", self.retry_uploads_action)
+        profile_action = menu.addAction("Profile Publishes")
+        profile_action.setCheckable(True)
+        profile_action.setChecked(self.logic.profile_publish)
+        profile_action.setToolTip("Save a cProfile/tracemalloc profile next to each publish.")
+        profile_action.toggled.connect(self.toggle_profiling_action)
         menu.addSeparator()
         menu.addAction(close_icon, "Close", self.close)
         pos = self.hamburger_btn.mapToGlobal(QtCore.QPoint(0, self.hamburger_btn.height()))
@@ -279,56 +446,93 @@ class AssetPublisherUI(QtWidgets.QWidget):
         """Action method to trigger logic for refreshing metadata."""
         self.logic.refresh_metadata(self.metadata_labels) # Pass UI element
 
-class AssetPublisherLogic:
-    def __init__(self, project_root, project_name):
-        self.project_root = os.path.join(project_root, project_name) if project_root != "N/A" else "N/A"
-        self.project_name = project_name
-        self.asset_name = "Unnamed"
-        self.asset_type = "Unknown"
-        self.version = "v001"
-        self.creator = "Unknown"
-        self.publish_dir = "N/A"
-        self.preview_image_path = ""
-
-        # Load initial metadata
-        metadata = self.load_asset_metadata()
-        self.update_attributes_from_metadata(metadata)
-
-
-    def update_attributes_from_metadata(self, metadata):
-        """Updates logic attributes based on metadata."""
-        self.asset_name = metadata.get("asset_name", "Unnamed")
-        self.asset_type = metadata.get("asset_type", "Unknown")
-        self.version = metadata.get("version", "v001")
-        self.creator = metadata.get("creator_name", "Unknown")
-        self.publish_dir = metadata.get("publish_path", "N/A")
-        if self.project_root != "N/A" and self.asset_name != "Unnamed" and self.asset_type != "Unknown":
-             self.publish_dir = os.path.join(self.project_root, self.asset_type, self.asset_name, "publish").replace("\\", "/")
+    def toggle_profiling_action(self, checked):
+        """Turns publish profiling on or off for this session."""
+        self.logic.profile_publish = checked
 
-
-    def get_internal_department(self, department_name):
-        """
-        Returns the internal short code for the selected department.
-        """
-        mapping = {
-            "modeling": "mod",
-            "rigging": "rig",
-            "texturing": "tex"
-        }
-        return mapping.get(department_name.lower(), "mod")  # Default to 'mod'
+    def run_validators_action(self):
+        """Runs the pre-publish validators without publishing."""
+        report = self.logic.validation.run()
+        self.show_validation_report(report)
+        if report.issues:
+            QtWidgets.QMessageBox.warning(self, "Validation", report.format_issues())
+        else:
+            QtWidgets.QMessageBox.information(self, "Validation", "✅ All validators passed.")
+
+    def retry_uploads_action(self):
+        """Puts failed background uploads back in the queue."""
+        uploads = upload_queue_module.UploadQueue.instance()
+        failed = [job for job in uploads.jobs() if job["state"] == "failed"]
+        if not failed:
+            QtWidgets.QMessageBox.information(self, "Uploads", "No failed uploads.")
+            return
+        errors = "\n".join(f"{job['id']}: {job['error']}" for job in failed)
+        uploads.retry_failed()
+        self.update_upload_status()
+        QtWidgets.QMessageBox.information(self, "Uploads", f"Retrying {len(failed)} upload(s):\n{errors}")
+
+class AssetPublisherLogic(publisher_logic_module.AssetPublisherLogic):
+    """
+    Publisher logic with the Qt pieces the UI needs: viewport capture,
+    preview display and publish progress reported through PublishSignals.
+    """
+
+    def __init__(self, project_root, project_name, load_metadata=True, **storage_options):
+        self.preview_image = None
+        super(AssetPublisherLogic, self).__init__(
+            project_root, project_name, load_metadata=load_metadata, **storage_options
+        )
 
     def capture_viewport(self, preview_label):
         """
         Temporary preview only; doesn't save to file system or create directories.
         Requires preview_label to update the UI.
+
+        The capture is kept in memory together with the viewport state it was
+        taken in, so publishing without further changes reuses it.
         """
         if not self.asset_name or not self.asset_type or not self.creator:
             QtWidgets.QMessageBox.warning(None, "Missing Information", "Asset metadata is missing. Cannot capture preview.")
             return
 
-        # Save a temporary preview in temp directory
-        temp_path = os.path.join(tempfile.gettempdir(), f"{self.asset_name}_temp_preview.jpg").replace("\\", "/")
-        self.save_preview_image(temp_path, preview_label)
+        try:
+            state_key = asset_scene_utils_module.AssetSceneUtils.get_viewport_state_key()
+            image = self.grab_viewport_image()
+            temp_path = None
+            if image is None:
+                # Save a temporary preview in temp directory
+                temp_path = os.path.join(tempfile.gettempdir(), f"{self.asset_name}_temp_preview.jpg").replace("\\", "/")
+                self.playblast_preview(temp_path)
+                image = QtGui.QImage(temp_path)
+            self.preview_cache.store(state_key, image=image, path=temp_path)
+            self.preview_image = image
+            self.show_preview_image(preview_label)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(None, "Capture Failed", f"Viewport capture failed:\n{e}")
+
+    def grab_viewport_image(self, width=400, height=300):
+        """
+        Reads the active viewport's color buffer straight into a QImage,
+        without a playblast or temp file.
+
+        Returns:
+            QtGui.QImage or None: The scaled capture, or None if the buffer
+            could not be read (callers fall back to playblast_preview).
+        """
+        try:
+            view = omui2.M3dView.active3dView()
+            view.refresh(False, True)
+            buffer_image = om2.MImage()
+            view.readColorBuffer(buffer_image, True)
+            buffer_width, buffer_height = buffer_image.getSize()
+            pixels = ctypes.string_at(buffer_image.pixels(), buffer_width * buffer_height * 4)
+            image = QtGui.QImage(pixels, buffer_width, buffer_height, QtGui.QImage.Format_RGBA8888)
+            # OpenGL buffers are bottom-up; copy() detaches from the pixel bytes
+            image = image.mirrored(False, True).copy()
+            return image.scaled(width, height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        except Exception as e:
+            logging.warning(f"[AssetPublisherUI] Viewport buffer capture unavailable, using playblast: {e}")
+            return None
 
     def save_preview_image(self, image_path, preview_label):
         """
@@ -340,133 +544,60 @@ class AssetPublisherLogic:
             preview_label (QtWidgets.QLabel): The label to display the preview.
         """
         try:
-            mc.playblast(
-                completeFilename=image_path,
-                format='image',
-                width=400,
-                height=300,
-                showOrnaments=False,
-                frame=mc.currentTime(q=True),
-                viewer=False,
-                offScreen=True,
-                percent=100,
-                compression="jpg"
-            )
-            self.preview_image_path = image_path
-            pixmap = QtGui.QPixmap(image_path)
-            scaled = pixmap.scaled(preview_label.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-            preview_label.setPixmap(scaled)
-            preview_label.setText("")
+            self.playblast_preview(image_path)
+            self.preview_image = QtGui.QImage(image_path)
+            self.show_preview_image(preview_label)
         except Exception as e:
             QtWidgets.QMessageBox.critical(None, "Capture Failed", f"Viewport capture failed:\n{e}")
 
-    def publish_asset(self, comment, department_name, metadata_labels, preview_label):
+    def show_preview_image(self, preview_label):
         """
-        Safely publish asset. Aborts if metadata is invalid or any step fails.
-        Requires comment, department_name, metadata_labels, and preview_label.
+        Displays the current in-memory preview in the label.
         """
-        try:
-            # Step 1: Validate basic fields
-            department = self.get_internal_department(department_name)
-
-            if not self.asset_name or not self.asset_type or not self.creator:
-                raise ValueError("Missing asset metadata. Please refresh or create an asset.")
-
-            if not comment:
-                raise ValueError("Publish comment is required.")
-
-            # ✅ Step 2: Strict metadata check from scene
-            metadata = self.load_asset_metadata()
-            if not metadata or metadata.get("asset_name", "") in ["", "Unnamed"]:
-                raise RuntimeError("No valid metadata found in scene. Cannot publish.")
-
-            # ✅ Step 3: Only now proceed with directory creation
-            publish_paths = file_utils_module.DirectoryUtils.create_publish_dir_structure(
-                project_root=self.project_root,
-                asset_name=self.asset_name,
-                department=department,
-                asset_type=self.asset_type,
-                format_type="ma"
-            )
-            if not publish_paths:
-                raise RuntimeError("Failed to create publish directory.")
-            file_publish_path, metadata_path, preview_image_path = publish_paths
-
-            # Step 4: Get versioned filename
-            full_publish_path, file_name, new_version_str = version_utils_module.VersionUtils.update_version(
-                path=file_publish_path,
-                base_name=self.asset_name,
-                suffix=department,
-                ext=".ma"
-            )
-            self.version = new_version_str
-
-            # Step 5: Save Maya scene
-            mc.file(rename=full_publish_path)
-            mc.file(save=True, type="mayaAscii")
-
-            # Step 6: Save preview image
-            preview_name = f"{self.asset_name}_{department}_prv_{self.version}.jpg"
-            preview_path = os.path.join(preview_image_path, preview_name).replace("\\", "/")
-            self.save_preview_image(preview_path, preview_label) # Pass preview_label
-
-            # Step 7: Update metadata
-            asset_scene_utils_module.AssetSceneUtils.update_asset_metadata({
-                "department": department,
-                "publisher_name": user_utils_module.UserUtils.get_os_user(),
-                "publish_date": asset_scene_utils_module.datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "publish_path": file_publish_path,
-                "preview_image_path": self.preview_image_path,
-                "version": self.version
-            })
-
-            # Step 8: Add history
-            live_metadata = self.load_asset_metadata()
-            if not live_metadata:
-                raise RuntimeError("Could not read updated asset metadata.")
-
-            history_entry = {
-                "asset_name": live_metadata.get("asset_name", "N/A"),
-                "asset_type": live_metadata.get("asset_type", "N/A"),
-                "version": live_metadata.get("version", "N/A"),
-                "department": department,
-                "publisher": live_metadata.get("publisher_name", "N/A"),
-                "publish_date": asset_scene_utils_module.datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "comment": comment,
-                "file_path": full_publish_path,
-                "preview_image": self.preview_image_path
-            }
-
-            json_utils_module.update_publish_history(
-                path=metadata_path,
-                file_name="metadata.json",
-                new_entry=history_entry
-            )
+        if self.preview_image is None or self.preview_image.isNull():
+            return
+        pixmap = QtGui.QPixmap.fromImage(self.preview_image)
+        scaled = pixmap.scaled(preview_label.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        preview_label.setPixmap(scaled)
+        preview_label.setText("")
 
-            self.refresh_metadata(metadata_labels) # Pass metadata_labels
-            QtWidgets.QMessageBox.information(None, "Publish Success", f"✅ Published to {department} with comment:\n{comment}")
+    def publish_asset(self, comment, department_name, signals):
+        """
+        Starts an asynchronous publish and returns the running pipeline.
 
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(None, "Publish Failed", f"❌ Publish failed:\n{str(e)}")
+        Scene save, playblast and metadata node edits run on the main thread;
+        directory creation, version reservation and the history write run on
+        the pipeline worker pool. Progress, failure and cancellation are
+        reported through the given PublishSignals.
+        """
+        pipeline, context = self.create_pipeline(comment, department_name, dispatch_main=signals.run_on_main.emit)
+        pipeline.on_step_started = signals.step_started.emit
+        pipeline.on_step_finished = signals.step_finished.emit
+        pipeline.on_finished = signals.finished.emit
+        pipeline.on_failed = lambda step, error: signals.failed.emit(step, str(error))
+        pipeline.on_cancelled = signals.cancelled.emit
+        pipeline.start(context)
+        return pipeline
+
+    def _step_save_preview(self, context):
+        super(AssetPublisherLogic, self)._step_save_preview(context)
+        entry = context.get("preview_entry")
+        self.preview_image = entry.image if entry and entry.image is not None else QtGui.QImage(context["preview_path"])
 
     def refresh_metadata(self, metadata_labels):
         """
         Refreshes metadata and updates UI labels.
         Requires metadata_labels to update the UI.
+
+        Returns:
+            dict: The metadata read from the scene.
         """
         metadata = self.load_asset_metadata()
-        self.update_attributes_from_metadata(metadata)
-        updates = {
-            "Asset Name": self.asset_name,
-            "Asset Type": self.asset_type,
-            "Version": self.version,
-            "Artist": self.creator,
-            "Publish Path": self.publish_dir
-        }
-        for key, value in updates.items():
+        for key, value in self.get_display_fields().items():
             label = metadata_labels.get(key)
             if label:
                 label.setText(f"<b>{key}:</b> {value}")
+        return metadata
 
     def create_new_asset(self, asset_name, asset_type, department_name, metadata_labels):
         """
@@ -474,37 +605,39 @@ class AssetPublisherLogic:
         Requires asset_name, asset_type, department_name, and metadata_labels.
         """
         try:
-            asset_scene_utils_module.AssetSceneUtils.create_new_asset(
-                department=department_name,
-                asset_type=asset_type,
-                asset_name=asset_name,
-                creator_name=user_utils_module.UserUtils.get_os_user(),
-                publisher_name=user_utils_module.UserUtils.get_os_user(),
-                project_name=self.project_name
-            )
+            super(AssetPublisherLogic, self).create_new_asset(asset_name, asset_type, department_name)
             self.refresh_metadata(metadata_labels) # Pass metadata_labels
         except Exception as e:
             QtWidgets.QMessageBox.critical(None, "Creation Failed", f"Failed to create new asset:\n{e}")
 
-
-    def load_asset_metadata(self):
-        """
-        Loads asset metadata from the scene.
-        """
-        try:
-            metadata = asset_scene_utils_module.AssetSceneUtils.get_asset_data()
-            self.update_attributes_from_metadata(metadata)
-            return metadata
-        except Exception as e:
-            print("Failed to load metadata:", e)
-            return {}
+# Open tool windows by name. Kept across development reloads of this module,
+# so a reloaded show_ui still finds the window created by the old code.
+_ui_registry = globals().get("_ui_registry", {})
 
 def show_ui():
-    for widget in QtWidgets.QApplication.allWidgets():
-        if isinstance(widget, AssetPublisherUI):
-            widget.close()
+    """
+    Opens the Asset Publisher, replacing a window that is already open.
+
+    Looks up the previous window in the module registry instead of scanning
+    every widget in the Maya session. A window with a publish in flight is
+    brought to the front instead: its PublishSignals run the remaining main
+    thread steps, and deleting it would strand the publish and its version claim.
+    """
+    previous = _ui_registry.get("AssetPublisherUI")
+    if previous is not None and shiboken2.isValid(previous):
+        if previous.publish_pipeline is not None and not previous.publish_pipeline.done:
+            previous.show()
+            previous.raise_()
+            previous.activateWindow()
+            return previous
+    _ui_registry.pop("AssetPublisherUI", None)
+    if previous is not None and shiboken2.isValid(previous):
+        previous.close()
+        previous.deleteLater()
     ui = AssetPublisherUI(parent=get_maya_main_window())
+    _ui_registry["AssetPublisherUI"] = ui
     ui.show()
+    return ui
 
 def show():
     show_ui()
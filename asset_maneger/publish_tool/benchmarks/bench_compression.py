@@ -0,0 +1,98 @@
+# File: asset_manager/publish_tool/benchmarks/bench_compression.py
+"""
+Benchmark for the publish compression codecs (see core/compression_utils.py).
+
+Compresses the same files with every codec and level through
+compression_utils.compress_file, reads them back through open_published,
+and reports the ratio (stored / original bytes) against compression and
+decompression throughput. Run it once per department on that department's
+publishes to pick its `department_compression` setting:
+
+    python bench_compression.py "E:/grow/publish/*/*/rig/ma/*.ma" --codecs zlib:1 zlib:6 lzma:1 lzma:6
+
+Without files, one synthetic mayaAscii scene is generated (--lines).
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+import publish_tool.core.compression_utils as compression_utils
+from publish_tool.benchmarks.bench_delta_chain import synthetic_scene_versions
+
+DEFAULT_SPECS = ["zlib:1", "zlib:6", "zlib:9", "lzma:0", "lzma:3", "lzma:6", "bz2:1", "bz2:9"]
+
+
+def bench_codec(sources, spec, work_dir):
+    codec, level = compression_utils.parse_codec_spec(spec)
+    original = stored = 0
+    compress_seconds = decompress_seconds = 0.0
+
+    for index, source in enumerate(sources):
+        path = os.path.join(work_dir, f"bench_{index:04d}{os.path.splitext(source)[1]}")
+        shutil.copyfile(source, path)
+
+        start = time.perf_counter()
+        result = compression_utils.compress_file(path, codec, level)
+        compress_seconds += time.perf_counter() - start
+        if not result:
+            raise RuntimeError(f"Compressing {source} with {spec} failed")
+        original += result["original_size"]
+        stored += result["stored_size"]
+
+        start = time.perf_counter()
+        with compression_utils.open_published(path) as f:
+            while f.read(compression_utils.CHUNK_SIZE):
+                pass
+        decompress_seconds += time.perf_counter() - start
+        os.remove(result["path"])
+
+    megabytes = original / 1024 ** 2
+    return {
+        "codec": spec,
+        "ratio": stored / original if original else 1.0,
+        "compress_mb_s": megabytes / compress_seconds if compress_seconds else 0.0,
+        "decompress_mb_s": megabytes / decompress_seconds if decompress_seconds else 0.0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark publish compression codecs.")
+    parser.add_argument("files", nargs="*", help="Files to compress (globs allowed).")
+    parser.add_argument("--codecs", nargs="+", default=DEFAULT_SPECS, help="Codec specs like zlib:6.")
+    parser.add_argument("--lines", type=int, default=300000, help="Lines of the synthetic scene.")
+    args = parser.parse_args(argv)
+
+    work_dir = tempfile.mkdtemp(prefix="bench_compression_")
+    try:
+        if args.files:
+            sources = []
+            for pattern in args.files:
+                sources.extend(sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern])
+        else:
+            sources = [os.path.join(work_dir, "synthetic.ma")]
+            with open(sources[0], "wb") as f:
+                f.write(next(synthetic_scene_versions(1, args.lines, 0.0)))
+        total = sum(os.path.getsize(path) for path in sources)
+        print(f"{len(sources)} files, {total / 1024 ** 2:.1f} MB")
+
+        print(f"{'codec':>8} {'ratio':>7} {'comp MB/s':>10} {'decomp MB/s':>12}")
+        for spec in args.codecs:
+            result = bench_codec(sources, spec, work_dir)
+            print(f"{result['codec']:>8} {result['ratio']:>7.3f} "
+                  f"{result['compress_mb_s']:>10.1f} {result['decompress_mb_s']:>12.1f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,384 @@
+# File: asset_manager/publish_tool/benchmarks/bench_core.py
+"""
+Benchmark suite for the publish core, runnable without Maya.
+
+Groups (--only to pick some):
+    version_utils    VersionIndex scans (cold/warm), find_latest_version, reserve_version
+    json_utils       history append, tail, full read and 'since' queries on a large log
+    directory_utils  create_publish_dir_structure with a cold and a warm folder cache
+    catalog          PublishCatalog rebuild, no-op refresh and latest_versions on a synthetic project
+    resolver         AssetResolver batches of 'latest' and pinned URIs, cold, warm and revalidated
+    publish          full headless AssetPublisherLogic publishes on the in-memory maya.cmds
+                     (testing/fake_cmds.install_fake_maya), with per-step medians
+
+Every result is the median of --repeat runs in milliseconds per call. Save
+a run with --json and compare a later commit against it:
+
+    python bench_core.py --json before.json
+    git checkout my-branch
+    python bench_core.py --compare before.json --threshold 0.2
+
+--compare exits with 1 when a benchmark got slower by more than the
+threshold (and by more than --min-delta-ms, to ignore timer noise).
+"""
+
+import argparse
+import collections
+import contextlib
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+import publish_tool.core.catalog as catalog_module
+import publish_tool.core.json_utils as json_utils
+import publish_tool.core.trace_utils as trace_utils
+from publish_tool.benchmarks import synthetic_project
+from publish_tool.core.file_utils import DirectoryUtils
+from publish_tool.core.version_utils import VersionIndex, VersionUtils
+
+# name: (full size, --quick size)
+SIZES = {
+    "versions": (1000, 100),
+    "history": (50000, 2000),
+    "assets": (1000, 50),
+    "catalog_history": (20, 5),
+    "resolver_assets": (2000, 200),
+    "publishes": (20, 5),
+    "delta_lines": (240000, 20000),
+}
+
+
+def measure(func, repeat, number=1, setup=None):
+    """
+    Returns `repeat` samples of seconds per call, each timing `number` calls after `setup`.
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def result(group, name, samples, **params):
+    milliseconds = [sample * 1000 for sample in samples]
+    return {
+        "name": f"{group}.{name}",
+        "median_ms": round(statistics.median(milliseconds), 5),
+        "min_ms": round(min(milliseconds), 5),
+        "max_ms": round(max(milliseconds), 5),
+        "runs": len(milliseconds),
+        "params": params
+    }
+
+
+@contextlib.contextmanager
+def isolated_user_dirs(work_dir):
+    """
+    Keeps catalogs and trace events of benchmark projects out of ~/.pip_dev.
+    """
+    previous = catalog_module.CATALOG_DIR, trace_utils.EVENT_LOG_DIR
+    catalog_module.CATALOG_DIR = os.path.join(work_dir, "catalog")
+    trace_utils.EVENT_LOG_DIR = os.path.join(work_dir, "traces")
+    try:
+        yield
+    finally:
+        catalog_module.CATALOG_DIR, trace_utils.EVENT_LOG_DIR = previous
+
+
+def bench_version_utils(work_dir, size, repeat):
+    path = os.path.join(work_dir, "versions")
+    os.makedirs(path)
+    count = size("versions")
+    for version in range(1, count + 1):
+        open(os.path.join(path, f"tree_mod_v{version:03d}.ma"), "w").close()
+
+    scan = lambda: VersionIndex.get_versions(path, "tree", "mod", ".ma")
+    latest = lambda: VersionUtils.find_latest_version(path, "tree", "mod", ".ma")
+
+    def reserve():
+        VersionUtils.reserve_version(path, "tree", "mod", ".ma").release()
+
+    return [
+        result("version_utils", "get_versions.cold", measure(scan, repeat, setup=VersionIndex.invalidate), files=count),
+        result("version_utils", "get_versions.warm", measure(scan, repeat, number=100), files=count),
+        result("version_utils", "find_latest_version.warm", measure(latest, repeat, number=100), files=count),
+        result("version_utils", "reserve_version", measure(reserve, repeat, number=10), files=count),
+    ]
+
+
+def bench_json_utils(work_dir, size, repeat):
+    path = os.path.join(work_dir, "history")
+    os.makedirs(path)
+    count = size("history")
+    rng = synthetic_project.random.Random(7)
+    entries = [
+        synthetic_project.history_entry("prop", "tree", "mod", version, f"/publish/tree_mod_v{version:03d}.ma", rng)
+        for version in range(1, count + 1)
+    ]
+    synthetic_project.write_history(path, entries)
+    file_name = synthetic_project.METADATA_FILE
+    since = datetime.datetime.strptime(entries[int(count * 0.99)]["publish_date"], json_utils.DATE_FORMAT)
+    new_entry = dict(entries[-1], comment="benchmark append")
+
+    return [
+        result("json_utils", "update_publish_history",
+               measure(lambda: json_utils.update_publish_history(path, file_name, new_entry), repeat, number=20),
+               records=count),
+        result("json_utils", "tail_publish_history.1",
+               measure(lambda: json_utils.tail_publish_history(path, file_name, 1), repeat, number=20),
+               records=count),
+        result("json_utils", "tail_publish_history.50",
+               measure(lambda: json_utils.tail_publish_history(path, file_name, 50), repeat, number=5),
+               records=count),
+        result("json_utils", "publish_history_since.1pct",
+               measure(lambda: json_utils.publish_history_since(path, file_name, since), repeat, number=5),
+               records=count),
+        result("json_utils", "read_publish_history",
+               measure(lambda: json_utils.read_publish_history(path, file_name), repeat),
+               records=count),
+    ]
+
+
+def bench_directory_utils(work_dir, size, repeat):
+    args = dict(project_root=os.path.join(work_dir, "dirs"), asset_name="tree", department="mod",
+                asset_type="prop", format_type="ma")
+    DirectoryUtils.create_publish_dir_structure(**args)
+    create = lambda: DirectoryUtils.create_publish_dir_structure(**args)
+    results = [
+        result("directory_utils", "create_publish_dir_structure.cold",
+               measure(create, repeat, setup=DirectoryUtils.invalidate_dir_cache)),
+        result("directory_utils", "create_publish_dir_structure.warm", measure(create, repeat, number=100)),
+    ]
+    DirectoryUtils.invalidate_dir_cache()
+    return results
+
+
+def bench_catalog(work_dir, size, repeat):
+    project_root = os.path.join(work_dir, "catalog_project")
+    assets, history = size("assets"), size("catalog_history")
+    stats = synthetic_project.generate_project(project_root, assets=assets, versions=1, history=history)
+    catalog = catalog_module.PublishCatalog(project_root, db_path=os.path.join(work_dir, "bench_catalog.sqlite"))
+    params = dict(assets=assets, departments=stats["departments"], records=stats["history_records"])
+    try:
+        return [
+            result("catalog", "rebuild", measure(catalog.rebuild, max(1, repeat // 2)), **params),
+            result("catalog", "refresh.unchanged", measure(catalog.refresh, repeat), **params),
+            result("catalog", "latest_versions", measure(catalog.latest_versions, repeat), **params),
+        ]
+    finally:
+        catalog.close()
+
+
+def bench_resolver(work_dir, size, repeat):
+    from publish_tool.core.asset_resolver import AssetResolver
+
+    project_root = os.path.join(work_dir, "resolver_project")
+    assets = size("resolver_assets")
+    synthetic_project.generate_project(project_root, assets=assets, departments=("mod", "rig"), versions=3,
+                                       history=size("catalog_history"), scene_lines=1)
+    latest = [f"asset://{asset_type}/{name}/rig" for asset_type, name in synthetic_project.asset_names(assets)]
+    pinned = [f"asset://{asset_type}/{name}/mod@v002" for asset_type, name in synthetic_project.asset_names(assets)]
+    resolver = AssetResolver(project_root)
+    # Long enough that the warm runs never revalidate; the stale run forces it
+    resolver.check_interval = 3600.0
+
+    def expire():
+        for entry in resolver._entries.values():
+            entry.checked = 0.0
+
+    return [
+        result("resolver", "resolve_many.latest.cold",
+               measure(lambda: resolver.resolve_many(latest), repeat, setup=resolver.invalidate), uris=assets),
+        result("resolver", "resolve_many.latest.warm", measure(lambda: resolver.resolve_many(latest), repeat),
+               uris=assets),
+        result("resolver", "resolve_many.latest.revalidate",
+               measure(lambda: resolver.resolve_many(latest), repeat, setup=expire), uris=assets),
+        result("resolver", "resolve_many.pinned.cold",
+               measure(lambda: resolver.resolve_many(pinned), repeat, setup=resolver.invalidate), uris=assets),
+        result("resolver", "resolve.warm", measure(lambda: resolver.resolve(latest[0]), repeat, number=100)),
+    ]
+
+
+def bench_delta_store(work_dir, size, repeat):
+    from publish_tool.core.delta_store import apply_delta, encode_delta
+
+    count = size("delta_lines")
+    # Scene-like text dominated by a few repeated lines, e.g. 'setAttr ".v" no;'
+    base = []
+    for index in range(count):
+        if index % 4 == 0:
+            base.append(f'createNode transform -n "node{index}";\n'.encode())
+        else:
+            base.append([b'\tsetAttr ".v" no;\n', b'\tsetAttr ".io" yes;\n', b'\tsetAttr -k off ".sx";\n'][index % 3])
+    # Inserted lines make the next line match the expected base position, which
+    # is the case that used to pull in every occurrence of a repeated line
+    edited = list(base)
+    for index in range(count - 1, 0, -97):
+        edited.insert(index, f'createNode transform -n "added{index}";\n'.encode())
+
+    delta = encode_delta(base, edited)
+    if apply_delta(base, delta) != b"".join(edited):
+        raise RuntimeError("Delta round trip failed.")
+
+    return [
+        result("delta_store", "encode_delta.repeated_lines", measure(lambda: encode_delta(base, edited), repeat),
+               lines=count),
+        result("delta_store", "apply_delta.repeated_lines", measure(lambda: apply_delta(base, delta), repeat),
+               lines=count),
+    ]
+
+
+def bench_publish(work_dir, size, repeat):
+    from publish_tool.testing.fake_cmds import install_fake_maya, uninstall_fake_maya, write_fake_scene
+    from publish_tool.core.publisher_logic import AssetPublisherLogic
+
+    scene_path = write_fake_scene(os.path.join(work_dir, "tree.ma"), "tree", extra_nodes=200)
+    cmds = install_fake_maya()
+    try:
+        cmds.file(scene_path, open=True, force=True)
+        logic = AssetPublisherLogic(work_dir, "publish_project")
+        totals, steps = [], collections.defaultdict(list)
+        for _ in range(size("publishes")):
+            start = time.perf_counter()
+            ok, context, error = logic.publish_headless("benchmark", "modeling")
+            totals.append(time.perf_counter() - start)
+            if not ok:
+                raise RuntimeError(f"Benchmark publish failed: {error}")
+            for name, seconds in context["trace"].summary()["steps"].items():
+                steps[name].append(seconds)
+    finally:
+        uninstall_fake_maya()
+
+    results = [result("publish", "headless", totals, scene_nodes=201)]
+    results += [result("publish", f"step.{name}", samples) for name, samples in steps.items()]
+    return results
+
+
+GROUPS = collections.OrderedDict([
+    ("version_utils", bench_version_utils),
+    ("json_utils", bench_json_utils),
+    ("directory_utils", bench_directory_utils),
+    ("catalog", bench_catalog),
+    ("resolver", bench_resolver),
+    ("delta_store", bench_delta_store),
+    ("publish", bench_publish),
+])
+
+
+def run_suite(groups=None, quick=False, repeat=5, root=None):
+    """
+    Runs benchmark groups in a temp folder.
+
+    Returns:
+        list: Result dicts (name, median_ms, min_ms, max_ms, runs, params).
+    """
+    size = lambda name: SIZES[name][1 if quick else 0]
+    results = []
+    work_root = tempfile.mkdtemp(prefix="bench_core_", dir=root)
+    try:
+        with isolated_user_dirs(work_root):
+            for group in groups or GROUPS:
+                work_dir = os.path.join(work_root, group)
+                os.makedirs(work_dir)
+                results.extend(GROUPS[group](work_dir, size, repeat))
+    finally:
+        DirectoryUtils.invalidate_dir_cache()
+        VersionIndex.invalidate()
+        shutil.rmtree(work_root, ignore_errors=True)
+    return results
+
+
+def run_metadata(quick, repeat):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ASSET_MGR_ROOT,
+                                capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "commit": commit or None,
+        "date": datetime.datetime.now().strftime(json_utils.DATE_FORMAT),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "repeat": repeat
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """
+    Returns (lines, regressions) comparing median_ms against a baseline run.
+    """
+    previous = {entry["name"]: entry for entry in baseline.get("results", [])}
+    lines = [f"{'benchmark':<52} {'before':>10} {'after':>10} {'change':>8}"]
+    regressions = []
+    for entry in results:
+        old = previous.get(entry["name"])
+        if old is None:
+            lines.append(f"{entry['name']:<52} {'-':>10} {entry['median_ms']:>10.4f} {'new':>8}")
+            continue
+        change = (entry["median_ms"] - old["median_ms"]) / old["median_ms"] if old["median_ms"] else 0.0
+        slower = change > threshold and entry["median_ms"] - old["median_ms"] > min_delta_ms
+        if slower:
+            regressions.append(entry["name"])
+        lines.append(f"{entry['name']:<52} {old['median_ms']:>10.4f} {entry['median_ms']:>10.4f} "
+                     f"{change:>+7.1%}{' !' if slower else ''}")
+    return lines, regressions
+
+
+def format_results(results):
+    lines = [f"{'benchmark':<52} {'median ms':>10} {'min ms':>10} {'runs':>5}  params"]
+    for entry in results:
+        params = " ".join(f"{key}={value}" for key, value in entry["params"].items())
+        lines.append(f"{entry['name']:<52} {entry['median_ms']:>10.4f} {entry['min_ms']:>10.4f} "
+                     f"{entry['runs']:>5}  {params}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the publish core without Maya.")
+    parser.add_argument("--only", nargs="+", choices=list(GROUPS), help="Benchmark groups to run.")
+    parser.add_argument("--quick", action="store_true", help="Small synthetic sizes, for a fast check.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--root", help="Folder for the synthetic data, e.g. on a network share.")
+    parser.add_argument("--json", help="Write the results to this file.")
+    parser.add_argument("--compare", help="Baseline results written earlier with --json.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown counted as a regression.")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="Ignore slowdowns smaller than this.")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.only, args.quick, max(1, args.repeat), args.root)
+    print(format_results(results))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"meta": run_metadata(args.quick, args.repeat), "results": results}, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        lines, regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        print(f"\nAgainst {args.compare} (commit {baseline.get('meta', {}).get('commit')}):")
+        print("\n".join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# File: asset_manager/publish_tool/benchmarks/bench_delta_chain.py
+"""
+Benchmark for DeltaStore version chains.
+
+Packs a sequence of scene versions at several keyframe intervals and
+reports the storage ratio (packed bytes / full bytes), pack time and the
+latency of rebuilding every version with a cold and a warm local cache.
+Every rebuilt version is checked byte for byte against its source.
+
+Pass real versions of one asset in publish order, e.g.:
+
+    python bench_delta_chain.py E:/grow/publish/prop/tree/mod/ma/tree_mod_v*.ma --intervals 1 5 10 20
+
+Without files, a synthetic mayaAscii chain is generated (--versions,
+--lines, --change-rate).
+"""
+
+import argparse
+import glob
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+from publish_tool.core.delta_store import DeltaStore
+
+
+def synthetic_scene_versions(versions, lines, change_rate, seed=7):
+    """
+    Yields mayaAscii-like contents of consecutive versions. Each version
+    changes about change_rate of the attribute lines and adds a few nodes.
+    """
+    rng = random.Random(seed)
+    body = []
+    node = 0
+    while len(body) < lines:
+        body.append(f'createNode transform -n "node{node}" -p "root";\n')
+        body.append(f'\trename -uid "{rng.getrandbits(64):016X}";\n')
+        body.append(f'\tsetAttr ".t" -type "double3" {rng.uniform(-10, 10):.4f} {rng.uniform(-10, 10):.4f} 0 ;\n')
+        body.append(f'createNode mesh -n "node{node}Shape" -p "node{node}";\n')
+        points = " ".join(f"{rng.uniform(-1, 1):.5f}" for _ in range(12))
+        body.append(f'\tsetAttr -s 4 ".vt[0:3]" {points};\n')
+        node += 1
+
+    for version in range(1, versions + 1):
+        header = [
+            "//Maya ASCII 2023 scene\n",
+            f"//Name: bench_v{version:03d}.ma\n",
+            f"//Last modified: version {version}\n",
+            'requires maya "2023";\n',
+            f'fileInfo "UUID" "{rng.getrandbits(128):032X}";\n',
+        ]
+        yield "".join(header + body).encode("utf-8")
+
+        for _ in range(max(1, int(len(body) * change_rate))):
+            index = rng.randrange(len(body))
+            if "setAttr" in body[index]:
+                body[index] = f'\tsetAttr ".t" -type "double3" {rng.uniform(-10, 10):.4f} 0 0 ;\n'
+        for _ in range(3):
+            body.append(f'createNode transform -n "node{node}" -p "root";\n')
+            node += 1
+
+
+def bench_interval(sources, interval, work_dir):
+    chain_dir = os.path.join(work_dir, f"interval_{interval}")
+    cache_dir = os.path.join(work_dir, f"cache_{interval}")
+    os.makedirs(chain_dir)
+    store = DeltaStore(keyframe_interval=interval, cache_dir=cache_dir)
+
+    full_bytes = packed_bytes = 0
+    paths = []
+    pack_seconds = 0.0
+    previous = None
+    for index, content in enumerate(sources, 1):
+        path = os.path.join(chain_dir, f"bench_mod_v{index:03d}.ma")
+        with open(path, "wb") as f:
+            f.write(content)
+        start = time.perf_counter()
+        packed = store.pack(path, previous)
+        pack_seconds += time.perf_counter() - start
+        if not packed:
+            raise RuntimeError(f"Packing {path} failed")
+        full_bytes += len(content)
+        packed_bytes += os.path.getsize(packed)
+        paths.append(path)
+        previous = path
+
+    latencies = {}
+    for mode in ("cold", "warm"):
+        if mode == "cold":
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        samples = []
+        for path, content in zip(paths, sources):
+            if mode == "cold":
+                shutil.rmtree(cache_dir, ignore_errors=True)
+            start = time.perf_counter()
+            local_path = store.materialize(path)
+            samples.append(time.perf_counter() - start)
+            with open(local_path, "rb") as f:
+                if f.read() != content:
+                    raise RuntimeError(f"Rebuilt {os.path.basename(path)} does not match the source")
+        latencies[mode] = samples
+
+    return {
+        "full_bytes": full_bytes,
+        "packed_bytes": packed_bytes,
+        "pack_ms": pack_seconds * 1000 / len(sources),
+        "latencies": latencies
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark delta-compressed version chains.")
+    parser.add_argument("files", nargs="*", help="Scene versions in publish order (globs allowed).")
+    parser.add_argument("--intervals", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--versions", type=int, default=30, help="Synthetic versions.")
+    parser.add_argument("--lines", type=int, default=200000, help="Lines per synthetic scene.")
+    parser.add_argument("--change-rate", type=float, default=0.01, help="Share of lines changed per synthetic version.")
+    args = parser.parse_args(argv)
+
+    if args.files:
+        paths = []
+        for pattern in args.files:
+            paths.extend(sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern])
+        sources = []
+        for path in paths:
+            with open(path, "rb") as f:
+                sources.append(f.read())
+        print(f"{len(sources)} versions from disk, {sum(map(len, sources)) / 1024 ** 2:.1f} MB")
+    else:
+        sources = list(synthetic_scene_versions(args.versions, args.lines, args.change_rate))
+        print(f"{len(sources)} synthetic versions, {sum(map(len, sources)) / 1024 ** 2:.1f} MB, "
+              f"{args.change_rate:.1%} lines changed per version")
+
+    work_dir = tempfile.mkdtemp(prefix="bench_delta_")
+    try:
+        print(f"{'interval':>8} {'ratio':>8} {'pack ms':>9} {'cold avg':>9} {'cold max':>9} {'warm avg':>9}")
+        for interval in args.intervals:
+            result = bench_interval(sources, interval, work_dir)
+            cold = result["latencies"]["cold"]
+            warm = result["latencies"]["warm"]
+            print(f"{interval:>8} {result['packed_bytes'] / result['full_bytes']:>8.3f} "
+                  f"{result['pack_ms']:>9.1f} {sum(cold) * 1000 / len(cold):>9.1f} "
+                  f"{max(cold) * 1000:>9.1f} {sum(warm) * 1000 / len(warm):>9.2f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
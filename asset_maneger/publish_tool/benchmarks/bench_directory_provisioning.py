@@ -0,0 +1,128 @@
+# File: asset_manager/publish_tool/benchmarks/bench_directory_provisioning.py
+"""
+Benchmark for DirectoryUtils publish folder provisioning.
+
+1. Bulk show set-up: provision_publish_trees for a synthetic show
+   (assets x departments x formats) at several thread pool sizes, each in
+   a fresh folder.
+2. Repeat publishes: create_publish_dir_structure called again for an
+   existing tree, with the directory cache cleared each time (cold) and
+   kept (warm). File system calls are counted by wrapping os.stat and
+   os.mkdir.
+
+Point --root at a network share to see the latency the cache and the
+thread pool hide; the default is a local temp folder.
+
+Usage:
+    python bench_directory_provisioning.py --assets 2000 --workers 1 4 16
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+from publish_tool.core.file_utils import DirectoryUtils
+
+
+class FsCallCounter:
+    """
+    Counts os.stat and os.mkdir calls while active.
+    """
+
+    def __init__(self):
+        self.stat = 0
+        self.mkdir = 0
+
+    def __enter__(self):
+        self._stat, self._mkdir = os.stat, os.mkdir
+
+        def stat(*args, **kwargs):
+            self.stat += 1
+            return self._stat(*args, **kwargs)
+
+        def mkdir(*args, **kwargs):
+            self.mkdir += 1
+            return self._mkdir(*args, **kwargs)
+
+        os.stat, os.mkdir = stat, mkdir
+        return self
+
+    def __exit__(self, *exc):
+        os.stat, os.mkdir = self._stat, self._mkdir
+
+
+def synthetic_assets(count):
+    asset_types = ["character", "prop", "set", "vehicle"]
+    return [(asset_types[index % len(asset_types)], f"asset{index:05d}") for index in range(count)]
+
+
+def bench_bulk(root, assets, departments, formats, workers):
+    results = []
+    for worker_count in workers:
+        project_root = os.path.join(root, f"bulk_{worker_count}")
+        DirectoryUtils.invalidate_dir_cache()
+        stats = DirectoryUtils.provision_publish_trees(
+            project_root, assets, departments, formats, max_workers=worker_count
+        )
+        results.append((worker_count, stats))
+    return results
+
+
+def bench_repeat(root, publishes):
+    project_root = os.path.join(root, "repeat")
+    args = dict(project_root=project_root, asset_name="tree", department="mod", asset_type="prop", format_type="ma")
+    DirectoryUtils.create_publish_dir_structure(**args)
+
+    results = {}
+    for mode in ("cold", "warm"):
+        with FsCallCounter() as counter:
+            start = time.perf_counter()
+            for _ in range(publishes):
+                if mode == "cold":
+                    DirectoryUtils.invalidate_dir_cache()
+                DirectoryUtils.create_publish_dir_structure(**args)
+            elapsed = time.perf_counter() - start
+        results[mode] = (elapsed, counter.stat, counter.mkdir)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark publish folder provisioning.")
+    parser.add_argument("--assets", type=int, default=2000)
+    parser.add_argument("--departments", nargs="+", default=["mod", "rig", "tex"])
+    parser.add_argument("--formats", nargs="+", default=["ma", "abc"])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--publishes", type=int, default=1000, help="Repeat publishes for the cache benchmark.")
+    parser.add_argument("--root", help="Folder to create the synthetic trees in; a temp folder by default.")
+    parser.add_argument("--keep", action="store_true", help="Do not delete the synthetic trees.")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="bench_dirs_", dir=args.root)
+    try:
+        assets = synthetic_assets(args.assets)
+        print(f"Bulk provisioning {len(assets)} assets x {len(args.departments)} departments x "
+              f"{len(args.formats)} formats in {root}")
+        for worker_count, stats in bench_bulk(root, assets, args.departments, args.formats, args.workers):
+            print(f"  workers={worker_count:<3} {stats['seconds']:>8.3f}s  "
+                  f"created={stats['created']} existing={stats['existing']} failed={stats['failed']}")
+
+        print(f"Repeat create_publish_dir_structure x{args.publishes}")
+        for mode, (elapsed, stats, mkdirs) in bench_repeat(root, args.publishes).items():
+            print(f"  {mode:<5} {elapsed * 1000 / args.publishes:>8.4f} ms/publish  "
+                  f"stat={stats / args.publishes:.1f} mkdir={mkdirs / args.publishes:.1f} per publish")
+    finally:
+        DirectoryUtils.invalidate_dir_cache()
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
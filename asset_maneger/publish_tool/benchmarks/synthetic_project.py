@@ -0,0 +1,153 @@
+# File: asset_manager/publish_tool/benchmarks/synthetic_project.py
+"""
+Generators for synthetic publish trees used by the benchmarks.
+
+A project holds N assets x departments x versions laid out like real
+publishes (see file_utils.PUBLISH_DIR_TEMPLATE): versioned scene files,
+metadata.json and an append-only history log per department. The history
+can be made much longer than the number of versions on disk to measure
+large-history behaviour.
+
+    python synthetic_project.py E:/bench --assets 1000 --versions 10 --history 500
+"""
+
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+import publish_tool.core.json_utils as json_utils
+from publish_tool.core.file_utils import DirectoryUtils
+
+ASSET_TYPES = ("character", "prop", "set", "vehicle")
+DEPARTMENTS = ("mod", "rig", "tex")
+METADATA_FILE = "metadata.json"
+
+
+def asset_names(count):
+    """
+    Returns (asset_type, asset_name) pairs, spread over ASSET_TYPES.
+    """
+    return [(ASSET_TYPES[index % len(ASSET_TYPES)], f"asset{index:05d}") for index in range(count)]
+
+
+def history_entry(asset_type, asset_name, department, version, file_path, rng, start=None):
+    """
+    Returns a publish history record shaped like the ones AssetPublisherLogic writes.
+    """
+    start = start or datetime.datetime(2025, 1, 1)
+    publish_date = start + datetime.timedelta(minutes=version * 37 + rng.randrange(30))
+    return {
+        "asset_name": asset_name,
+        "asset_type": asset_type,
+        "version": f"v{version:03d}",
+        "department": department,
+        "publisher": f"artist{rng.randrange(20):02d}",
+        "publish_date": publish_date.strftime(json_utils.DATE_FORMAT),
+        "comment": f"Synthetic publish {version} " + "x" * rng.randrange(10, 80),
+        "file_path": file_path,
+        "preview_image": "",
+        "original_size": 2048,
+        "stored_size": 2048
+    }
+
+
+def scene_text(asset_name, version, lines):
+    """
+    Returns a small mayaAscii-looking scene body.
+    """
+    body = [f"//Maya ASCII 2023 scene\n//Name: {asset_name}_v{version:03d}.ma\n", 'requires maya "2023";\n']
+    body += [f'createNode transform -n "{asset_name}_node{index}";\n' for index in range(lines)]
+    return "".join(body)
+
+
+def write_history(metadata_dir, entries):
+    """
+    Writes metadata.json and its history log in one pass (no per-record appends).
+    """
+    history_name = json_utils.get_history_file_name(METADATA_FILE)
+    with open(os.path.join(metadata_dir, history_name), "w", encoding="utf-8", newline="\n") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    first = entries[0] if entries else {}
+    json_utils.save_json(metadata_dir, METADATA_FILE, {
+        "asset_name": first.get("asset_name"),
+        "asset_type": first.get("asset_type"),
+        "history_file": history_name
+    })
+
+
+def generate_project(project_root, assets=100, departments=DEPARTMENTS, versions=5, history=None,
+                     scene_lines=20, seed=7):
+    """
+    Writes a synthetic publish tree.
+
+    Args:
+        project_root (str): Project folder; 'publish/' is created inside it.
+        assets (int): Number of assets.
+        departments (iterable): Department codes per asset.
+        versions (int): Scene versions written per asset and department.
+        history (int or None): History records per asset and department
+            (defaults to `versions`); records beyond `versions` point at
+            scene files that were never written.
+        scene_lines (int): Nodes per synthetic scene.
+        seed (int): Random seed, so trees are identical between runs.
+
+    Returns:
+        dict: Counts of assets, departments, scene files, history records and bytes, plus seconds.
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    history = versions if history is None else history
+    stats = {"assets": assets, "departments": 0, "scene_files": 0, "history_records": 0, "bytes": 0}
+
+    for asset_type, asset_name in asset_names(assets):
+        for department in departments:
+            file_dir, metadata_dir, _ = DirectoryUtils.create_publish_dir_structure(
+                project_root, asset_name, department, asset_type, "ma"
+            )
+            entries = []
+            for version in range(1, max(versions, history) + 1):
+                file_name = f"{asset_name}_{department}_v{version:03d}.ma"
+                file_path = os.path.join(file_dir, file_name).replace("\\", "/")
+                if version <= versions:
+                    data = scene_text(asset_name, version, scene_lines)
+                    with open(file_path, "w") as f:
+                        f.write(data)
+                    stats["scene_files"] += 1
+                    stats["bytes"] += len(data)
+                if version <= history:
+                    entries.append(history_entry(asset_type, asset_name, department, version, file_path, rng))
+            write_history(metadata_dir, entries)
+            stats["departments"] += 1
+            stats["history_records"] += len(entries)
+
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic publish tree.")
+    parser.add_argument("project_root")
+    parser.add_argument("--assets", type=int, default=100)
+    parser.add_argument("--departments", nargs="+", default=list(DEPARTMENTS))
+    parser.add_argument("--versions", type=int, default=5)
+    parser.add_argument("--history", type=int, help="History records per department (default: --versions).")
+    parser.add_argument("--scene-lines", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    stats = generate_project(args.project_root, args.assets, args.departments, args.versions,
+                             args.history, args.scene_lines)
+    print(json.dumps(stats, indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
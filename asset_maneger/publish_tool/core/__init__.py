@@ -0,0 +1,18 @@
+# File: asset_manager/publish_tool/core/__init__.py
+"""
+Core publish modules. Submodules are imported on first attribute access,
+e.g. `publish_tool.core.catalog`, and their import time is recorded by
+publish_tool.timed_import.
+"""
+
+
+def __getattr__(name):
+    if name.startswith("_"):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    import publish_tool
+    try:
+        return publish_tool.timed_import(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
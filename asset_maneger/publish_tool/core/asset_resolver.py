@@ -0,0 +1,441 @@
+# File: asset_manager/publish_tool/core/asset_resolver.py
+
+import collections
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, NamedTuple, Optional
+
+import publish_tool.core.compression_utils as compression_utils_module
+import publish_tool.core.json_utils as json_utils_module
+import publish_tool.core.trace_utils as trace_utils_module
+from publish_tool.core.file_utils import PUBLISH_DIR_TEMPLATE
+from publish_tool.core.version_utils import VersionIndex
+
+URI_SCHEME = "asset://"
+LATEST = "latest"
+METADATA_FILE = "metadata.json"
+
+# Asset/department entries kept in memory per project
+RESOLVER_CACHE_SIZE = 20000
+
+# Seconds a cached entry is trusted before its history log is checked on disk again
+CHECK_INTERVAL = 2.0
+
+# Threads used to check stale entries of a batch, mostly waiting on the file server
+RESOLVE_WORKERS = 8
+
+
+class AssetRef(NamedTuple):
+    asset_type: Optional[str]
+    asset_name: str
+    department: str
+    version: str = LATEST
+    format_type: str = "ma"
+
+    @property
+    def key(self):
+        return (self.asset_type, self.asset_name, self.department, self.format_type)
+
+    def uri(self) -> str:
+        parts = [self.asset_type, self.asset_name, self.department] if self.asset_type else [self.asset_name, self.department]
+        suffix = f".{self.format_type}" if self.format_type != "ma" else ""
+        return f"{URI_SCHEME}{'/'.join(parts)}{suffix}@{self.version}"
+
+
+def parse_uri(uri) -> Optional[AssetRef]:
+    """
+    Parses an asset URI.
+
+    Format:
+        asset://<asset_type>/<asset_name>/<department>[.<format>][@<version>]
+
+    The asset type may be left out (asset://tree/mod) and is then looked up
+    under publish/. The version is 'latest' (default), 'v003' or '3'.
+    AssetRef values and (asset_type, asset_name, department[, version]) tuples
+    are accepted as they are.
+
+    Returns:
+        AssetRef or None: None if the URI is malformed.
+    """
+    if isinstance(uri, AssetRef):
+        return uri
+    if isinstance(uri, tuple):
+        return AssetRef(*uri) if 3 <= len(uri) <= 5 else None
+    if not isinstance(uri, str):
+        return None
+    return _parse_uri_text(uri)
+
+
+@functools.lru_cache(maxsize=RESOLVER_CACHE_SIZE)
+def _parse_uri_text(uri):
+    text = uri[len(URI_SCHEME):] if uri.startswith(URI_SCHEME) else uri
+    text, _, version = text.partition("@")
+    parts = [part for part in text.strip("/").split("/") if part]
+    if len(parts) not in (2, 3):
+        return None
+    department, _, format_type = parts[-1].partition(".")
+
+    version = (version or LATEST).strip().lower()
+    if version != LATEST:
+        number = version[1:] if version.startswith("v") else version
+        if not number.isdigit():
+            return None
+        version = f"v{int(number):03d}"
+
+    return AssetRef(
+        parts[0] if len(parts) == 3 else None,
+        parts[-2],
+        department,
+        version,
+        format_type or "ma"
+    )
+
+
+def history_signature(metadata_dir: str) -> tuple:
+    """
+    Returns (mtime_ns, size, inode) of the history log and of metadata.json
+    in a metadata folder, None for a missing file. Changes with every publish.
+    """
+    signature = []
+    for file_name in (json_utils_module.get_history_file_name(METADATA_FILE), METADATA_FILE):
+        try:
+            st = os.stat(os.path.join(metadata_dir, file_name))
+            signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class _DepartmentEntry:
+    """
+    Cached versions of one asset/department, valid for one history log state.
+    """
+    __slots__ = ("metadata_dir", "file_dir", "signature", "checked", "latest", "versions", "paths")
+
+    def __init__(self, metadata_dir, file_dir, signature):
+        self.metadata_dir = metadata_dir
+        self.file_dir = file_dir
+        self.signature = signature
+        self.checked = time.monotonic()
+        self.latest = None      # newest history entry
+        self.versions = None    # {'v003': entry}, read on the first pinned version
+        self.paths = {}         # {'v003': stored path}, only for files that exist
+
+
+class AssetResolver:
+    """
+    Turns asset URIs into published file paths.
+
+    The publish history of each asset/department is the source of truth: the
+    newest record answers 'latest' and pinned versions are looked up in the
+    full log. Departments without a history log (publishes made before the
+    history existed) fall back to the versioned files on disk, like
+    VersionUtils.find_latest_version.
+
+    Results are kept in an LRU of RESOLVER_CACHE_SIZE asset/department
+    entries. An entry is dropped when the stat signature of its history log
+    and metadata file changes, which is checked at most every CHECK_INTERVAL
+    seconds, so a batch of thousands of URIs costs one stat per department
+    once warm. Publishes made in this session drop their entry right away
+    (see forget_metadata_dir).
+
+    Example:
+        resolver = AssetResolver.for_project("E:/grow")
+        resolver.resolve("asset://character/hero/rig@latest")
+        resolver.resolve_many(["asset://prop/tree/mod@v003", "asset://tree/tex"])
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, project_root: str, cache_size: int = RESOLVER_CACHE_SIZE,
+                 check_interval: float = CHECK_INTERVAL):
+        self.project_root = project_root
+        self.publish_root = os.path.join(project_root, "publish")
+        self.cache_size = cache_size
+        self.check_interval = check_interval
+        self._entries = collections.OrderedDict()
+        self._asset_types = {}
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "AssetResolver":
+        """
+        Returns the shared resolver instance for a project root.
+        """
+        key = os.path.normcase(os.path.abspath(project_root))
+        with cls._instances_lock:
+            resolver = cls._instances.get(key)
+            if resolver is None:
+                resolver = cls._instances[key] = cls(project_root)
+            return resolver
+
+    @classmethod
+    def forget_metadata_dir(cls, project_root: str, metadata_dir: str) -> None:
+        """
+        Drops the cached entry written to by a publish, if the project has a shared resolver.
+        """
+        with cls._instances_lock:
+            resolver = cls._instances.get(os.path.normcase(os.path.abspath(project_root)))
+        if resolver is not None:
+            resolver.invalidate(metadata_dir=metadata_dir)
+
+    # -- cache -----------------------------------------------------------
+
+    def invalidate(self, asset_name: Optional[str] = None, department: Optional[str] = None,
+                   metadata_dir: Optional[str] = None) -> int:
+        """
+        Drops cached entries: all of them, those of one asset (and department),
+        or the one stored for a metadata folder.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        if metadata_dir:
+            metadata_dir = os.path.normcase(os.path.abspath(metadata_dir))
+        with self._lock:
+            if asset_name is None and metadata_dir is None:
+                count = len(self._entries)
+                self._entries.clear()
+                self._asset_types.clear()
+                return count
+            keys = [
+                key for key, entry in self._entries.items()
+                if (metadata_dir is None or os.path.normcase(os.path.abspath(entry.metadata_dir)) == metadata_dir)
+                and (asset_name is None or key[1] == asset_name)
+                and (department is None or key[2] == department)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def _find_asset_type(self, asset_name):
+        """
+        Returns the asset type folder holding an asset, for URIs without a type.
+        """
+        with self._lock:
+            if asset_name in self._asset_types:
+                return self._asset_types[asset_name]
+        try:
+            asset_types = sorted(entry.name for entry in os.scandir(self.publish_root) if entry.is_dir())
+        except OSError:
+            asset_types = []
+        asset_type = next(
+            (name for name in asset_types if os.path.isdir(os.path.join(self.publish_root, name, asset_name))),
+            None
+        )
+        if asset_type is not None:
+            with self._lock:
+                self._asset_types[asset_name] = asset_type
+        return asset_type
+
+    def _dirs(self, asset_type, asset_name, department, format_type):
+        fields = dict(asset_type=asset_type, asset_name=asset_name, department=department, format_type=format_type)
+        return (
+            os.path.join(self.project_root, PUBLISH_DIR_TEMPLATE["metadata"].format(**fields)),
+            os.path.join(self.project_root, PUBLISH_DIR_TEMPLATE["file"].format(**fields))
+        )
+
+    def _load_entry(self, ref, asset_type, cached):
+        """
+        Returns a valid entry for ref.key, reusing `cached` when its history is unchanged.
+        Runs without the lock held: it only touches the file system.
+        """
+        metadata_dir, file_dir = self._dirs(asset_type, ref.asset_name, ref.department, ref.format_type)
+        signature = history_signature(metadata_dir)
+        if cached is not None and cached.signature == signature:
+            cached.checked = time.monotonic()
+            return cached
+
+        entry = _DepartmentEntry(metadata_dir, file_dir, signature)
+        if signature[0] is not None or signature[1] is not None:
+            latest = json_utils_module.tail_publish_history(metadata_dir, METADATA_FILE, 1)
+            entry.latest = latest[-1] if latest else None
+        return entry
+
+    def _get_entries(self, refs, workers):
+        """
+        Returns {key: entry} for the distinct asset/departments in refs,
+        checking stale or missing entries on `workers` threads.
+        """
+        now = time.monotonic()
+        entries, pending = {}, {}
+        with self._lock:
+            for ref in refs:
+                key = ref.key
+                if key in entries or key in pending:
+                    continue
+                entry = self._entries.get(key)
+                if entry is not None and now - entry.checked < self.check_interval:
+                    self._entries.move_to_end(key)
+                    entries[key] = entry
+                    self.stats["hits"] += 1
+                else:
+                    pending[key] = (ref, entry)
+                    self.stats["stale" if entry is not None else "misses"] += 1
+
+        if not pending:
+            return entries
+
+        def load(item):
+            key, (ref, cached) = item
+            asset_type = ref.asset_type or self._find_asset_type(ref.asset_name)
+            if asset_type is None:
+                return key, None
+            return key, self._load_entry(ref, asset_type, cached)
+
+        trace_utils_module.count("resolver_loads", len(pending))
+        if workers > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+                loaded = list(pool.map(load, pending.items()))
+        else:
+            loaded = [load(item) for item in pending.items()]
+
+        with self._lock:
+            for key, entry in loaded:
+                if entry is None:
+                    self._entries.pop(key, None)
+                    continue
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                entries[key] = entry
+            while len(self._entries) > self.cache_size:
+                self._entries.popitem(last=False)
+        return entries
+
+    # -- resolution ------------------------------------------------------
+
+    def _record(self, ref, entry):
+        """
+        Returns the history record of the requested version, or a minimal
+        record built from the files on disk when there is no history.
+        """
+        if ref.version == LATEST and entry.latest is not None:
+            return entry.latest
+
+        if entry.latest is not None:
+            if entry.latest.get("version") == ref.version:
+                return entry.latest
+            if entry.versions is None:
+                history = json_utils_module.read_publish_history(entry.metadata_dir, METADATA_FILE)
+                entry.versions = {record.get("version"): record for record in history}
+            return entry.versions.get(ref.version)
+
+        # No history: versioned files on disk, as VersionUtils names them
+        versions = VersionIndex.get_versions(entry.file_dir, ref.asset_name, ref.department, f".{ref.format_type}")
+        if ref.version != LATEST:
+            number = int(ref.version[1:])
+            versions = [item for item in versions if item[0] == number]
+        if not versions:
+            return None
+        number, file_name = versions[-1]
+        return {"version": f"v{number:03d}", "file_path": os.path.join(entry.file_dir, file_name).replace("\\", "/")}
+
+    def _resolve_ref(self, ref, entry, with_record=False):
+        if entry is None:
+            return None
+        record = self._record(ref, entry)
+        if not record or not record.get("file_path"):
+            return None
+
+        version = record.get("version")
+        path = entry.paths.get(version)
+        if path is None:
+            path = compression_utils_module.find_published(record["file_path"])
+            if path is None:
+                return None
+            entry.paths[version] = path
+        if not with_record:
+            return path
+        result = dict(record)
+        result["stored_path"] = path
+        return result
+
+    def resolve(self, uri) -> Optional[str]:
+        """
+        Resolves one asset URI.
+
+        Returns:
+            str or None: Path of the stored file (plain, compressed or delta
+            packed; see compression_utils.materialize for a plain copy), or None
+            if the URI is malformed or the version does not exist.
+        """
+        return self.resolve_many([uri]).get(uri)
+
+    def resolve_many(self, uris: Iterable, workers: int = RESOLVE_WORKERS,
+                     with_records: bool = False) -> Dict:
+        """
+        Resolves a batch of asset URIs.
+
+        URIs sharing an asset and department share one history read.
+
+        Args:
+            uris (iterable): URI strings, AssetRef values or tuples.
+            workers (int): Threads used to check entries not cached yet.
+            with_records (bool): Return the history record (plus 'stored_path')
+                instead of the path.
+
+        Returns:
+            dict: {uri: path, record or None}, in input order.
+        """
+        refs = {}
+        for uri in uris:
+            if uri not in refs:
+                refs[uri] = parse_uri(uri)
+
+        entries = self._get_entries([ref for ref in refs.values() if ref is not None], workers)
+        results = {}
+        for key, ref in refs.items():
+            if ref is None:
+                logging.warning(f"[AssetResolver] Malformed asset URI {key!r}")
+                results[key] = None
+                continue
+            try:
+                results[key] = self._resolve_ref(ref, entries.get(ref.key), with_records)
+            except Exception as e:
+                logging.error(f"[AssetResolver] Failed to resolve '{ref.uri()}': {e}")
+                results[key] = None
+        return results
+
+    def resolve_record(self, uri) -> Optional[dict]:
+        """
+        Returns the history record of a URI (publisher, date, comment, storage,
+        ...) with 'stored_path' added, or None.
+        """
+        return self.resolve_many([uri], with_records=True).get(uri)
+
+    def materialize_many(self, uris: Iterable, workers: int = RESOLVE_WORKERS) -> Dict:
+        """
+        Resolves URIs to plain local files that Maya can open, decompressing
+        or rebuilding delta packed versions through compression_utils.
+
+        Returns:
+            dict: {uri: local path or None}
+        """
+        results = {}
+        for uri, record in self.resolve_many(uris, workers, with_records=True).items():
+            results[uri] = compression_utils_module.materialize(record["file_path"]) if record else None
+        return results
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries), cache_size=self.cache_size)
+
+
+def resolve(uri, project_root: str) -> Optional[str]:
+    """
+    Shortcut for AssetResolver.for_project(project_root).resolve(uri).
+    """
+    return AssetResolver.for_project(project_root).resolve(uri)
+
+
+def resolve_many(uris: Iterable, project_root: str) -> Dict:
+    """
+    Shortcut for AssetResolver.for_project(project_root).resolve_many(uris).
+    """
+    return AssetResolver.for_project(project_root).resolve_many(uris)
@@ -1,9 +1,60 @@
 # File: asset_manager/publish_tool/core/asset_scene_utils.py
 
-import maya.cmds as mc
+import contextlib
 import datetime
+import json
 import logging
-from typing import Optional, Dict
+import threading
+from collections.abc import Mapping
+from typing import Optional, Dict, List
+
+from publish_tool.core.scene_adapter import MayaSceneAdapter
+
+class LazyMetadata(Mapping):
+    """
+    Read-only mapping over a metadata blob that is only JSON-decoded on first access.
+
+    The blob layout is {"schema": <int>, "fields": {<attr>: <value>, ...}}.
+    """
+
+    def __init__(self, raw: str, node: str = None):
+        self._raw = raw
+        self._node = node
+        self._data = None
+
+    def _fields(self) -> dict:
+        if self._data is None:
+            try:
+                blob = json.loads(self._raw)
+                if blob.get("schema", 0) > AssetSceneUtils.METADATA_SCHEMA_VERSION:
+                    AssetSceneUtils.logger.warning(
+                        f"Metadata blob on '{self._node}' uses newer schema {blob.get('schema')}; reading known fields only."
+                    )
+                self._data = dict(blob.get("fields", {}))
+            except (ValueError, AttributeError) as e:
+                AssetSceneUtils.logger.warning(f"Could not decode metadata blob on '{self._node}': {e}")
+                self._data = {}
+        return self._data
+
+    def __getitem__(self, key):
+        return self._fields()[key]
+
+    def __iter__(self):
+        return iter(self._fields())
+
+    def __len__(self):
+        return len(self._fields())
+
+    def __repr__(self):
+        return f"LazyMetadata({self._node!r})"
+
+
+class MetadataTransaction(dict):
+    """
+    Collects metadata changes and writes them in one go when the
+    AssetSceneUtils.metadata_transaction block exits without an error.
+    """
+
 
 class AssetSceneUtils:
     """
@@ -12,49 +63,242 @@ class AssetSceneUtils:
     """
 
     METADATA_SUFFIX = "_metadata_node"
+    METADATA_BLOB_ATTR = "metadata_json"
+    METADATA_SCHEMA_VERSION = 1
+    # Node type -> attribute holding an external file path
+    DEPENDENCY_ATTRS = {
+        "file": "fileTextureName",
+        "imagePlane": "imageName",
+        "audio": "filename",
+        "AlembicNode": "abc_File",
+        "gpuCache": "cacheFileName",
+        "aiImage": "filename",
+        "aiStandIn": "dso"
+    }
     logger = logging.getLogger("AssetSceneUtils")
 
+    _scene_adapter = None
+    _callback_ids = []
+    _node_cache_valid = False
+    _cached_node_uuid = None
+    _cache_lock = threading.Lock()
+
     def __new__(cls, *args, **kwargs):
         raise NotImplementedError("AssetSceneUtils is a static utility class and cannot be instantiated.")
 
+    @staticmethod
+    def set_scene_adapter(adapter) -> None:
+        """
+        Replaces the scene adapter (see scene_adapter.MayaSceneAdapter) and
+        re-registers the node cache invalidation callbacks on it.
+        """
+        previous = AssetSceneUtils._scene_adapter
+        if previous is not None:
+            previous.remove_callbacks(AssetSceneUtils._callback_ids)
+        AssetSceneUtils._scene_adapter = adapter
+        AssetSceneUtils._callback_ids = adapter.add_invalidation_callbacks(
+            AssetSceneUtils.invalidate_metadata_node_cache
+        )
+        AssetSceneUtils.invalidate_metadata_node_cache()
+
+    @staticmethod
+    def get_scene_adapter():
+        """
+        Returns the active scene adapter, creating the Maya one on first use.
+        """
+        if AssetSceneUtils._scene_adapter is None:
+            AssetSceneUtils.set_scene_adapter(MayaSceneAdapter())
+        return AssetSceneUtils._scene_adapter
+
+    @staticmethod
+    def _cmds():
+        return AssetSceneUtils.get_scene_adapter().cmds
+
+    @staticmethod
+    def invalidate_metadata_node_cache(*_) -> None:
+        """
+        Forgets the cached metadata node handle. Called by the scene adapter
+        callbacks after scene open/new and network node creation/deletion.
+        """
+        with AssetSceneUtils._cache_lock:
+            AssetSceneUtils._node_cache_valid = False
+            AssetSceneUtils._cached_node_uuid = None
+
+    @staticmethod
+    def _cache_metadata_node(node: Optional[str]) -> None:
+        cmds = AssetSceneUtils._cmds()
+        uuids = cmds.ls(node, uuid=True) if node else None
+        with AssetSceneUtils._cache_lock:
+            AssetSceneUtils._cached_node_uuid = uuids[0] if uuids else None
+            AssetSceneUtils._node_cache_valid = bool(uuids) or node is None
+
     @staticmethod
     def get_metadata_node_name() -> Optional[str]:
         """
         Returns the name of the metadata node in the scene.
 
+        The node is remembered by UUID, so repeated calls cost a single
+        lookup (and follow renames) until the scene adapter reports a scene
+        change. A scene without a metadata node is remembered as well.
+
         Returns:
             Optional[str]: Metadata node name if found, otherwise None.
         """
-        nodes = [n for n in mc.ls(type='network') if n.endswith(AssetSceneUtils.METADATA_SUFFIX)]
-        return nodes[0] if nodes else None
+        cmds = AssetSceneUtils._cmds()
+        with AssetSceneUtils._cache_lock:
+            cache_valid = AssetSceneUtils._node_cache_valid
+            cached_uuid = AssetSceneUtils._cached_node_uuid
+
+        if cache_valid:
+            if cached_uuid is None:
+                return None
+            nodes = cmds.ls(cached_uuid)
+            if nodes and nodes[0].endswith(AssetSceneUtils.METADATA_SUFFIX):
+                return nodes[0]
+
+        nodes = [n for n in cmds.ls(type='network') if n.endswith(AssetSceneUtils.METADATA_SUFFIX)]
+        node = nodes[0] if nodes else None
+        AssetSceneUtils._cache_metadata_node(node)
+        return node
 
     @staticmethod
     def get_asset_data() -> Dict[str, str]:
         """
         Retrieves metadata from the metadata node in the scene.
 
+        Nodes carrying the compact metadata blob (see enable_metadata_blob)
+        are read with a single attribute read and decoded lazily; nodes with
+        only the per-attribute layout are read attribute by attribute.
+
         Returns:
             dict: Dictionary containing user-defined attribute names and their values.
 
         Raises:
             RuntimeError: If no metadata node is found.
         """
-        asset_data = {}
+        adapter = AssetSceneUtils.get_scene_adapter()
         node = AssetSceneUtils.get_metadata_node_name()
 
         if not node:
             raise RuntimeError("No metadata node found in the scene.")
 
-        user_attrs = mc.listAttr(node, userDefined=True) or []
-
-        for attr in user_attrs:
-            try:
-                asset_data[attr] = mc.getAttr(f"{node}.{attr}")
-            except RuntimeError as e:
-                AssetSceneUtils.logger.warning(f"Could not retrieve attribute '{attr}' from '{node}': {e}")
+        blob = adapter.read_string_attrs(node, [AssetSceneUtils.METADATA_BLOB_ATTR])
+        if blob.get(AssetSceneUtils.METADATA_BLOB_ATTR):
+            return LazyMetadata(blob[AssetSceneUtils.METADATA_BLOB_ATTR], node)
 
+        asset_data = adapter.read_string_attrs(node)
+        asset_data.pop(AssetSceneUtils.METADATA_BLOB_ATTR, None)
         return asset_data
 
+    @staticmethod
+    def _encode_blob(fields: Dict[str, str]) -> str:
+        return json.dumps(
+            {"schema": AssetSceneUtils.METADATA_SCHEMA_VERSION, "fields": fields},
+            separators=(",", ":"),
+            sort_keys=True
+        )
+
+    @staticmethod
+    def write_metadata(updates: Dict[str, str]) -> bool:
+        """
+        Writes several metadata attributes as one transaction: the node is
+        unlocked once, every value (and the blob, if present) is written in a
+        single adapter call, and the node is relocked once.
+
+        Args:
+            updates (dict): Attribute-value pairs to update.
+
+        Returns:
+            bool: True if the update was successful, False otherwise.
+        """
+        adapter = AssetSceneUtils.get_scene_adapter()
+        cmds = adapter.cmds
+        node = AssetSceneUtils.get_metadata_node_name()
+        if not node:
+            AssetSceneUtils.logger.warning("No metadata node found to update.")
+            return False
+
+        values = dict(updates)
+        blob = adapter.read_string_attrs(node, [AssetSceneUtils.METADATA_BLOB_ATTR])
+        if AssetSceneUtils.METADATA_BLOB_ATTR in blob:
+            fields = dict(LazyMetadata(blob[AssetSceneUtils.METADATA_BLOB_ATTR] or "{}", node))
+            fields.update(updates)
+            values[AssetSceneUtils.METADATA_BLOB_ATTR] = AssetSceneUtils._encode_blob(fields)
+
+        is_locked = cmds.lockNode(node, query=True, lock=True)[0]
+
+        try:
+            if is_locked:
+                cmds.lockNode(node, lock=False)
+
+            for attr in adapter.write_string_attrs(node, values):
+                AssetSceneUtils.logger.warning(f"Attribute '{attr}' does not exist on '{node}'.")
+
+            return True
+
+        except Exception as e:
+            cmds.error(f"Failed to update metadata on '{node}': {e}")
+            return False
+
+        finally:
+            if is_locked:
+                cmds.lockNode(node, lock=True)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def metadata_transaction():
+        """
+        Context manager that batches metadata edits into one write_metadata call.
+
+        Example:
+            with AssetSceneUtils.metadata_transaction() as metadata:
+                metadata["version"] = "v004"
+                metadata["status"] = "Published"
+
+        Raises:
+            RuntimeError: If the batched write fails.
+        """
+        transaction = MetadataTransaction()
+        yield transaction
+        if transaction and not AssetSceneUtils.write_metadata(transaction):
+            raise RuntimeError("Failed to write metadata transaction.")
+
+    @staticmethod
+    def enable_metadata_blob() -> bool:
+        """
+        Adds the compact metadata blob attribute to the scene's metadata node
+        and fills it from the per-attribute values, which are kept for tools
+        that read the old layout.
+
+        Returns:
+            bool: True if the blob is present afterwards, False otherwise.
+        """
+        adapter = AssetSceneUtils.get_scene_adapter()
+        cmds = adapter.cmds
+        node = AssetSceneUtils.get_metadata_node_name()
+        if not node:
+            AssetSceneUtils.logger.warning("No metadata node found to convert.")
+            return False
+
+        fields = adapter.read_string_attrs(node)
+        if fields.pop(AssetSceneUtils.METADATA_BLOB_ATTR, None) is not None:
+            return True
+
+        is_locked = cmds.lockNode(node, query=True, lock=True)[0]
+        try:
+            if is_locked:
+                cmds.lockNode(node, lock=False)
+            cmds.addAttr(node, longName=AssetSceneUtils.METADATA_BLOB_ATTR, dataType="string")
+            adapter.write_string_attrs(node, {AssetSceneUtils.METADATA_BLOB_ATTR: AssetSceneUtils._encode_blob(fields)})
+            cmds.setAttr(f"{node}.{AssetSceneUtils.METADATA_BLOB_ATTR}", lock=True)
+            return True
+        except Exception as e:
+            AssetSceneUtils.logger.error(f"Failed to add metadata blob to '{node}': {e}")
+            return False
+        finally:
+            if is_locked:
+                cmds.lockNode(node, lock=True)
+
     @staticmethod
     def create_new_asset(
         department: str,
@@ -66,14 +310,19 @@ class AssetSceneUtils:
         status: str = "Draft",
         version: str = "v001",
         publish_path: str = "N/A",
-        preview_image_path: str = "N/A"
+        preview_image_path: str = "N/A",
+        use_metadata_blob: bool = False
     ) -> Optional[str]:
         """
         Creates a new network node in Maya to store metadata for a new asset.
 
+        With use_metadata_blob, the node also gets the compact metadata blob
+        (see enable_metadata_blob) next to the per-attribute values.
+
         Returns:
             Optional[str]: The name of the created network node if successful, None otherwise.
         """
+        cmds = AssetSceneUtils._cmds()
         # Parameter validation
         for param, value in {
             'department': department,
@@ -83,7 +332,7 @@ class AssetSceneUtils:
             'publisher_name': publisher_name
         }.items():
             if not value:
-                mc.error(f"Parameter '{param}' is required and cannot be empty.")
+                cmds.error(f"Parameter '{param}' is required and cannot be empty.")
                 return None
 
         base_network_node_name = f"{asset_name}{AssetSceneUtils.METADATA_SUFFIX}"
@@ -94,10 +343,10 @@ class AssetSceneUtils:
             raise RuntimeError(f"A metadata node already exists in the scene: '{existing_node}'")
 
         try:
-            network_node = mc.createNode("network", name=base_network_node_name)
+            network_node = cmds.createNode("network", name=base_network_node_name)
             AssetSceneUtils.logger.info(f"Created network node: '{network_node}'")
         except RuntimeError as e:
-            mc.error(f"Failed to create network node '{base_network_node_name}': {e}")
+            cmds.error(f"Failed to create network node '{base_network_node_name}': {e}")
             return None
 
         current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -115,20 +364,23 @@ class AssetSceneUtils:
             "publish_path": publish_path,
             "preview_image_path": preview_image_path,
             "version": version,
-            "maya_version": mc.about(version=True)
+            "maya_version": cmds.about(version=True)
         }
 
-        for attr, value in attributes.items():
-            attr_name = attr.lower()
-            if not mc.attributeQuery(attr_name, node=network_node, exists=True):
-                mc.addAttr(network_node, longName=attr_name, dataType="string")
-            mc.setAttr(f"{network_node}.{attr_name}", value, type="string")
+        values = {attr.lower(): value for attr, value in attributes.items()}
+        if use_metadata_blob:
+            values[AssetSceneUtils.METADATA_BLOB_ATTR] = AssetSceneUtils._encode_blob(dict(values))
+
+        for attr_name in values:
+            cmds.addAttr(network_node, longName=attr_name, dataType="string")
+        AssetSceneUtils.get_scene_adapter().write_string_attrs(network_node, values)
 
-        for attr in attributes.keys():
-            mc.setAttr(f"{network_node}.{attr.lower()}", lock=True)
-        mc.lockNode(network_node, lock=True)
+        for attr_name in values:
+            cmds.setAttr(f"{network_node}.{attr_name}", lock=True)
+        cmds.lockNode(network_node, lock=True)
 
-        mc.select(network_node)
+        cmds.select(network_node)
+        AssetSceneUtils._cache_metadata_node(network_node)
         AssetSceneUtils.logger.info(f"Network node '{network_node}' created with metadata.")
         return network_node
 
@@ -143,32 +395,95 @@ class AssetSceneUtils:
         Returns:
             bool: True if the update was successful, False otherwise.
         """
-        node = AssetSceneUtils.get_metadata_node_name()
-        if not node:
-            AssetSceneUtils.logger.warning("No metadata node found to update.")
-            return False
+        return AssetSceneUtils.write_metadata(updates)
 
-        is_locked = mc.lockNode(node, query=True, lock=True)[0]
+    @staticmethod
+    def get_active_camera() -> Optional[str]:
+        """
+        Returns the camera of the focused model panel, or of the first visible one.
+        """
+        cmds = AssetSceneUtils._cmds()
+        panel = cmds.getPanel(withFocus=True)
+        if not panel or cmds.getPanel(typeOf=panel) != "modelPanel":
+            visible = [p for p in (cmds.getPanel(visiblePanels=True) or []) if cmds.getPanel(typeOf=p) == "modelPanel"]
+            panel = visible[0] if visible else None
+        return cmds.modelPanel(panel, query=True, camera=True) if panel else None
 
-        try:
-            if is_locked:
-                mc.lockNode(node, lock=False)
+    @staticmethod
+    def get_viewport_state_key() -> Optional[tuple]:
+        """
+        Returns a cheap fingerprint of what a viewport capture would show.
 
-            for attr, value in updates.items():
-                attr_name = f"{node}.{attr}"
-                if mc.attributeQuery(attr, node=node, exists=True):
-                    mc.setAttr(attr_name, lock=False)
-                    mc.setAttr(attr_name, value, type="string")
-                    mc.setAttr(attr_name, lock=True)
-                else:
-                    AssetSceneUtils.logger.warning(f"Attribute '{attr}' does not exist on '{node}'.")
+        Combines the scene name, the head of the undo and redo queues (as a
+        proxy for scene edits), the current frame and the active camera with
+        its world matrix. Returns None when undo is disabled, since edits can
+        then not be detected.
 
-            return True
+        Returns:
+            Optional[tuple]: Hashable state key, or None.
+        """
+        cmds = AssetSceneUtils._cmds()
+        if not cmds.undoInfo(query=True, state=True):
+            return None
 
-        except Exception as e:
-            mc.error(f"Failed to update metadata on '{node}': {e}")
-            return False
+        camera = AssetSceneUtils.get_active_camera()
+        matrix = None
+        if camera and cmds.objExists(camera):
+            matrix = tuple(round(v, 6) for v in cmds.xform(camera, query=True, matrix=True, worldSpace=True))
 
-        finally:
-            if is_locked:
-                mc.lockNode(node, lock=True)
+        return (
+            cmds.file(query=True, sceneName=True),
+            cmds.undoInfo(query=True, undoName=True),
+            cmds.undoInfo(query=True, redoName=True),
+            cmds.currentTime(query=True),
+            camera,
+            matrix
+        )
+
+    @staticmethod
+    def list_file_dependencies() -> List[Dict[str, str]]:
+        """
+        Lists the external files the open scene points to.
+
+        Covers the node types in DEPENDENCY_ATTRS (node types of unloaded
+        plugins are skipped) and the top-level references; nested references
+        travel inside their referenced files.
+
+        Returns:
+            list: {'node', 'attr', 'path'} records with the path as stored in
+            the scene, unexpanded. References use the attr 'reference'.
+        """
+        cmds = AssetSceneUtils._cmds()
+        dependencies = []
+        for node_type, attr in AssetSceneUtils.DEPENDENCY_ATTRS.items():
+            try:
+                nodes = cmds.ls(type=node_type) or []
+            except RuntimeError:
+                continue
+            for node in nodes:
+                try:
+                    path = cmds.getAttr(f"{node}.{attr}")
+                except (RuntimeError, ValueError):
+                    continue
+                if path:
+                    dependencies.append({"node": node, "attr": attr, "path": path})
+
+        for reference_path in cmds.file(query=True, reference=True) or []:
+            try:
+                node = cmds.referenceQuery(reference_path, referenceNode=True)
+                path = cmds.referenceQuery(node, filename=True, unresolvedName=True, withoutCopyNumber=True)
+            except RuntimeError as e:
+                AssetSceneUtils.logger.warning(f"Skipping reference '{reference_path}': {e}")
+                continue
+            dependencies.append({"node": node, "attr": "reference", "path": path})
+        return dependencies
+
+    @staticmethod
+    def get_workspace_root() -> Optional[str]:
+        """
+        Returns the root of the current Maya project, the base of relative file paths.
+        """
+        try:
+            return AssetSceneUtils._cmds().workspace(query=True, rootDirectory=True) or None
+        except (AttributeError, RuntimeError):
+            return None
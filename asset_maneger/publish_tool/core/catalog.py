@@ -0,0 +1,469 @@
+# File: asset_manager/publish_tool/core/catalog.py
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+import publish_tool.core.json_utils as json_utils_module
+import publish_tool.core.trace_utils as trace_utils_module
+
+CATALOG_DIR = os.path.join(os.path.expanduser("~"), ".pip_dev", "catalog")
+METADATA_FILE = "metadata.json"
+SCHEMA_VERSION = 2
+
+_VERSION_NUMBER = re.compile(r"(\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    metadata_dir TEXT PRIMARY KEY,
+    asset_type TEXT NOT NULL,
+    asset_name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    meta_mtime_ns INTEGER,
+    meta_size INTEGER,
+    hist_mtime_ns INTEGER,
+    hist_size INTEGER,
+    hist_ino INTEGER,
+    hist_offset INTEGER
+);
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY,
+    metadata_dir TEXT NOT NULL,
+    asset_type TEXT NOT NULL,
+    asset_name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    version TEXT,
+    version_num INTEGER,
+    publisher TEXT,
+    publish_date TEXT,
+    comment TEXT,
+    file_path TEXT,
+    preview_image TEXT,
+    storage TEXT,
+    original_size INTEGER,
+    stored_size INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_versions_asset ON versions (asset_name, department, version_num);
+CREATE INDEX IF NOT EXISTS idx_versions_type ON versions (asset_type, department, asset_name, version_num);
+CREATE INDEX IF NOT EXISTS idx_versions_department ON versions (department, version_num);
+CREATE INDEX IF NOT EXISTS idx_versions_publisher ON versions (publisher, publish_date);
+CREATE INDEX IF NOT EXISTS idx_versions_date ON versions (publish_date);
+CREATE INDEX IF NOT EXISTS idx_versions_source ON versions (metadata_dir);
+"""
+
+_VERSION_COLUMNS = (
+    "asset_type, asset_name, department, version, version_num, publisher, "
+    "publish_date, comment, file_path, preview_image, storage, original_size, stored_size"
+)
+
+
+def default_catalog_path(project_root: str) -> str:
+    """
+    Returns the local catalog file for a project.
+
+    The catalog lives on the local disk, not next to the publishes: SQLite
+    locking is unreliable on network shares, and the catalog can always be
+    rebuilt from the metadata files.
+
+    Example:
+        'E:/grow' -> '~/.pip_dev/catalog/grow_3f2a9c1d.sqlite'
+    """
+    normalized = os.path.normcase(os.path.abspath(project_root)).replace("\\", "/")
+    digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:8]
+    name = os.path.basename(normalized.rstrip("/")) or "project"
+    return os.path.join(CATALOG_DIR, f"{name}_{digest}.sqlite")
+
+
+class PublishCatalog:
+    """
+    Project-level SQLite index of every publish.
+
+    Mirrors the publish tree created by DirectoryUtils.create_publish_dir_structure:
+
+        <project_root>/publish/<asset_type>/<asset_name>/<department>/data/metadata/
+
+    and indexes one row per history entry (asset, department, version,
+    publisher, date, comment, file and preview paths, storage and sizes).
+
+    refresh() is incremental. A metadata folder is skipped when the mtime and
+    size of its files are unchanged. When only new records were appended to
+    the history log, just the bytes after the last indexed offset are parsed.
+    A rewritten log (compaction, different inode) or a legacy inline history
+    is parsed again in full.
+
+    Example:
+        catalog = PublishCatalog.for_project("E:/grow")
+        catalog.refresh()
+        catalog.latest_versions(asset_type="character", department="rig")
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, project_root: str, db_path: Optional[str] = None):
+        self.project_root = project_root
+        self.publish_root = os.path.join(project_root, "publish")
+        self.db_path = db_path or default_catalog_path(project_root)
+        self._lock = threading.RLock()
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "PublishCatalog":
+        """
+        Returns the shared catalog instance for a project root.
+        """
+        key = os.path.normcase(os.path.abspath(project_root))
+        with cls._instances_lock:
+            catalog = cls._instances.get(key)
+            if catalog is None:
+                catalog = cls._instances[key] = cls(project_root)
+            return catalog
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            user_version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if user_version != SCHEMA_VERSION:
+                self._conn.executescript("DROP TABLE IF EXISTS versions; DROP TABLE IF EXISTS sources;")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # -- indexing --------------------------------------------------------
+
+    def _iter_metadata_dirs(self):
+        """
+        Yields (metadata_dir, asset_type, asset_name, department) for every
+        department folder in the publish tree.
+        """
+        def subdirs(path):
+            try:
+                with os.scandir(path) as entries:
+                    return [e for e in entries if e.is_dir() and not e.name.startswith(".")]
+            except OSError:
+                return []
+
+        for type_entry in subdirs(self.publish_root):
+            for asset_entry in subdirs(type_entry.path):
+                for department_entry in subdirs(asset_entry.path):
+                    metadata_dir = os.path.join(department_entry.path, "data", "metadata")
+                    if os.path.isdir(metadata_dir):
+                        yield (
+                            metadata_dir.replace("\\", "/"),
+                            type_entry.name,
+                            asset_entry.name,
+                            department_entry.name
+                        )
+
+    @staticmethod
+    def _stat(path):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _version_number(version) -> Optional[int]:
+        match = _VERSION_NUMBER.search(str(version or ""))
+        return int(match.group(1)) if match else None
+
+    def _version_row(self, source, entry):
+        metadata_dir, asset_type, asset_name, department = source
+        version = entry.get("version")
+        return (
+            metadata_dir,
+            asset_type,
+            asset_name,
+            department,
+            version,
+            self._version_number(version),
+            entry.get("publisher"),
+            entry.get("publish_date"),
+            entry.get("comment"),
+            entry.get("file_path"),
+            entry.get("preview_image"),
+            entry.get("storage"),
+            entry.get("original_size"),
+            entry.get("stored_size")
+        )
+
+    def _insert_entries(self, source, entries):
+        self._conn.executemany(
+            f"INSERT INTO versions (metadata_dir, {_VERSION_COLUMNS}) VALUES ({', '.join('?' * 14)})",
+            [self._version_row(source, entry) for entry in entries if isinstance(entry, dict)]
+        )
+
+    @staticmethod
+    def _read_log(history_path, offset):
+        """
+        Parses complete history lines from `offset` on.
+
+        Returns:
+            tuple: (entries, new_offset). A trailing line without a newline is
+            left for the next refresh.
+        """
+        with open(history_path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        entries = []
+        for line in data[:end].split(b"\n"):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                logging.warning(f"[PublishCatalog] Skipping malformed history record in '{history_path}'")
+        return entries, offset + end
+
+    def _index_source(self, source, known) -> bool:
+        """
+        Brings one metadata folder up to date. Must run inside a transaction.
+
+        Returns:
+            bool: True if any rows changed.
+        """
+        metadata_dir = source[0]
+        meta_stat = self._stat(os.path.join(metadata_dir, METADATA_FILE))
+        history_path = os.path.join(metadata_dir, json_utils_module.get_history_file_name(METADATA_FILE))
+        hist_stat = self._stat(history_path)
+
+        state = (
+            meta_stat.st_mtime_ns if meta_stat else None,
+            meta_stat.st_size if meta_stat else None,
+            hist_stat.st_mtime_ns if hist_stat else None,
+            hist_stat.st_size if hist_stat else None,
+            hist_stat.st_ino if hist_stat else None
+        )
+        if known is not None and tuple(known)[4:9] == state:
+            return False
+
+        offset = 0
+        if hist_stat:
+            appended = (
+                known is not None
+                and known["hist_ino"] == hist_stat.st_ino
+                and known["hist_offset"]
+                and known["hist_size"] is not None
+                and hist_stat.st_size >= known["hist_size"]
+            )
+            if appended:
+                offset = known["hist_offset"]
+            else:
+                self._conn.execute("DELETE FROM versions WHERE metadata_dir = ?", (metadata_dir,))
+            entries, offset = self._read_log(history_path, offset)
+        else:
+            # Legacy layout: the history is still inline in metadata.json
+            self._conn.execute("DELETE FROM versions WHERE metadata_dir = ?", (metadata_dir,))
+            data = json_utils_module.load_json(metadata_dir, METADATA_FILE) or {}
+            entries = data.get("publish_history", [])
+
+        self._insert_entries(source, entries)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            tuple(source) + state + (offset,)
+        )
+        return True
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Scans the publish tree and reindexes changed metadata folders.
+
+        Returns:
+            dict: Counts of 'scanned', 'updated' and 'removed' folders plus 'seconds'.
+        """
+        start = time.perf_counter()
+        stats = {"scanned": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            try:
+                known = {
+                    row["metadata_dir"]: row
+                    for row in self._conn.execute("SELECT * FROM sources")
+                }
+                with self._conn:
+                    for source in self._iter_metadata_dirs():
+                        stats["scanned"] += 1
+                        if self._index_source(source, known.pop(source[0], None)):
+                            stats["updated"] += 1
+
+                    for metadata_dir in known:
+                        self._conn.execute("DELETE FROM versions WHERE metadata_dir = ?", (metadata_dir,))
+                        self._conn.execute("DELETE FROM sources WHERE metadata_dir = ?", (metadata_dir,))
+                        stats["removed"] += 1
+            except Exception as e:
+                logging.error(f"[PublishCatalog] Failed to refresh catalog '{self.db_path}': {e}")
+        stats["seconds"] = round(time.perf_counter() - start, 4)
+        return stats
+
+    @trace_utils_module.traced("PublishCatalog.refresh_metadata_dir")
+    def refresh_metadata_dir(self, metadata_dir: str) -> bool:
+        """
+        Reindexes a single metadata folder, e.g. right after a publish wrote to it.
+
+        Args:
+            metadata_dir (str): '<...>/<asset_type>/<asset_name>/<department>/data/metadata'
+
+        Returns:
+            bool: True if the folder was indexed, False on failure.
+        """
+        metadata_dir = metadata_dir.replace("\\", "/").rstrip("/")
+        department_dir = os.path.dirname(os.path.dirname(metadata_dir))
+        asset_dir = os.path.dirname(department_dir)
+        source = (
+            metadata_dir,
+            os.path.basename(os.path.dirname(asset_dir)),
+            os.path.basename(asset_dir),
+            os.path.basename(department_dir)
+        )
+        with self._lock:
+            try:
+                known = self._conn.execute(
+                    "SELECT * FROM sources WHERE metadata_dir = ?", (metadata_dir,)
+                ).fetchone()
+                with self._conn:
+                    self._index_source(source, known)
+                return True
+            except Exception as e:
+                logging.error(f"[PublishCatalog] Failed to index '{metadata_dir}': {e}")
+                return False
+
+    def rebuild(self) -> Dict[str, int]:
+        """
+        Drops every indexed row and scans the whole tree again.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM versions")
+            self._conn.execute("DELETE FROM sources")
+        return self.refresh()
+
+    # -- queries ---------------------------------------------------------
+
+    def _query(self, sql, params=()) -> List[dict]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def latest_versions(self, asset_type: Optional[str] = None, department: Optional[str] = None) -> List[dict]:
+        """
+        Returns the newest version of every asset/department pair.
+
+        Args:
+            asset_type (str or None): Restrict to one asset type, e.g. 'character'.
+            department (str or None): Restrict to one department code, e.g. 'rig'.
+
+        Returns:
+            list: One row dict per asset and department, ordered by asset name.
+        """
+        where, params = [], []
+        if asset_type:
+            where.append("asset_type = ?")
+            params.append(asset_type)
+        if department:
+            where.append("department = ?")
+            params.append(department)
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        # SQLite returns the bare columns from the row holding MAX()
+        return self._query(
+            f"SELECT {_VERSION_COLUMNS.replace('version_num', 'MAX(version_num) AS version_num')} "
+            f"FROM versions {where_sql} GROUP BY asset_type, department, asset_name "
+            f"ORDER BY asset_name, department",
+            params
+        )
+
+    def get_latest(self, asset_name: str, department: str, asset_type: Optional[str] = None) -> Optional[dict]:
+        """
+        Returns the newest version row of one asset in one department, or None.
+        """
+        sql = f"SELECT {_VERSION_COLUMNS} FROM versions WHERE asset_name = ? AND department = ?"
+        params = [asset_name, department]
+        if asset_type:
+            sql += " AND asset_type = ?"
+            params.append(asset_type)
+        rows = self._query(sql + " ORDER BY version_num DESC, publish_date DESC LIMIT 1", params)
+        return rows[0] if rows else None
+
+    def get_versions(self, asset_name: str, department: Optional[str] = None,
+                     asset_type: Optional[str] = None) -> List[dict]:
+        """
+        Returns every indexed version of an asset, oldest first.
+        """
+        sql = f"SELECT {_VERSION_COLUMNS} FROM versions WHERE asset_name = ?"
+        params = [asset_name]
+        if department:
+            sql += " AND department = ?"
+            params.append(department)
+        if asset_type:
+            sql += " AND asset_type = ?"
+            params.append(asset_type)
+        return self._query(sql + " ORDER BY department, version_num, publish_date", params)
+
+    def list_assets(self, asset_type: Optional[str] = None) -> List[dict]:
+        """
+        Returns asset_type, asset_name and department of every indexed folder.
+        """
+        sql = "SELECT asset_type, asset_name, department FROM sources"
+        params = []
+        if asset_type:
+            sql += " WHERE asset_type = ?"
+            params.append(asset_type)
+        return self._query(sql + " ORDER BY asset_type, asset_name, department", params)
+
+    def find_by_publisher(self, publisher: str, since: Optional[str] = None) -> List[dict]:
+        """
+        Returns versions published by one user, optionally from `since`
+        (a json_utils.DATE_FORMAT string) on, newest first.
+        """
+        sql = f"SELECT {_VERSION_COLUMNS} FROM versions WHERE publisher = ?"
+        params = [publisher]
+        if since:
+            sql += " AND publish_date >= ?"
+            params.append(since)
+        return self._query(sql + " ORDER BY publish_date DESC", params)
+
+    def published_since(self, timestamp: str, department: Optional[str] = None) -> List[dict]:
+        """
+        Returns versions published at or after `timestamp`, newest first.
+        """
+        sql = f"SELECT {_VERSION_COLUMNS} FROM versions WHERE publish_date >= ?"
+        params = [timestamp]
+        if department:
+            sql += " AND department = ?"
+            params.append(department)
+        return self._query(sql + " ORDER BY publish_date DESC", params)
+
+    def storage_summary(self, department: Optional[str] = None) -> List[dict]:
+        """
+        Returns original and stored bytes per department and storage mode
+        ('plain' for uncompressed files), for versions that recorded sizes.
+        """
+        sql = (
+            "SELECT department, COALESCE(storage, 'plain') AS storage, COUNT(*) AS versions, "
+            "SUM(original_size) AS original_size, SUM(stored_size) AS stored_size "
+            "FROM versions WHERE original_size IS NOT NULL"
+        )
+        params = []
+        if department:
+            sql += " AND department = ?"
+            params.append(department)
+        return self._query(sql + " GROUP BY department, COALESCE(storage, 'plain') ORDER BY department, storage", params)
+
+    def count_versions(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
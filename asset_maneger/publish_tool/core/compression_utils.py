@@ -0,0 +1,216 @@
+# File: asset_manager/publish_tool/core/compression_utils.py
+
+import bz2
+import gzip
+import hashlib
+import io
+import logging
+import lzma
+import os
+import shutil
+import uuid
+from typing import Dict, Optional, Tuple
+
+import publish_tool.core.delta_store as delta_store_module
+import publish_tool.core.trace_utils as trace_utils_module
+
+CHUNK_SIZE = 1024 * 1024
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pip_dev", "decompress_cache")
+
+# codec name -> (file suffix, default level, valid levels)
+CODECS = {
+    "zlib": (".gz", 6, range(0, 10)),
+    "lzma": (".xz", 6, range(0, 10)),
+    "bz2": (".bz2", 9, range(1, 10)),
+}
+COMPRESSED_EXTS = tuple(suffix for suffix, _, _ in CODECS.values())
+
+
+def parse_codec_spec(spec) -> Optional[Tuple[str, int]]:
+    """
+    Parses a compression setting like 'lzma', 'zlib:1' or 'bz2:9'.
+
+    Args:
+        spec (str or None): Codec name with an optional ':level'. None, ''
+            and 'none' mean no compression.
+
+    Returns:
+        tuple or None: (codec, level), or None for no compression.
+
+    Raises:
+        ValueError: If the codec or level is unknown.
+    """
+    if not spec or str(spec).lower() == "none":
+        return None
+    codec, _, level = str(spec).lower().partition(":")
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression codec '{codec}', expected one of {tuple(CODECS)}.")
+    _, default_level, levels = CODECS[codec]
+    level = int(level) if level else default_level
+    if level not in levels:
+        raise ValueError(f"Compression level {level} is out of range for '{codec}'.")
+    return codec, level
+
+
+def codec_for_path(path: str) -> Optional[str]:
+    """
+    Returns the codec of a compressed file from its suffix, or None.
+    """
+    lower = path.lower()
+    for codec, (suffix, _, _) in CODECS.items():
+        if lower.endswith(suffix):
+            return codec
+    return None
+
+
+def _open_codec(codec, path, mode, level=None):
+    if codec == "zlib":
+        return gzip.open(path, mode, compresslevel=6 if level is None else level)
+    if codec == "lzma":
+        return lzma.open(path, mode, preset=level) if "w" in mode else lzma.open(path, mode)
+    return bz2.open(path, mode, compresslevel=9 if level is None else level)
+
+
+def find_published(path: str) -> Optional[str]:
+    """
+    Returns the file holding a published version: the plain file, a
+    compressed copy (<path>.gz/.xz/.bz2) or a delta chain entry.
+    """
+    if os.path.isfile(path):
+        return path
+    for suffix in COMPRESSED_EXTS:
+        if os.path.isfile(path + suffix):
+            return path + suffix
+    return delta_store_module.DeltaStore.find_stored(path)
+
+
+@trace_utils_module.traced("compression_utils.compress_file")
+def compress_file(path: str, codec: str = "zlib", level: Optional[int] = None,
+                  remove_source: bool = True, target_path: Optional[str] = None) -> Optional[Dict]:
+    """
+    Compresses a file to <path><suffix>, or to target_path, in one streaming pass.
+
+    The output is written to a temporary file and renamed into place, so
+    readers never see a partial file.
+
+    Args:
+        path (str): File to compress, e.g. a just-saved publish.
+        codec (str): 'zlib' (gzip container), 'lzma' (xz) or 'bz2'.
+        level (int or None): Codec level, or None for the codec default.
+        remove_source (bool): Delete the uncompressed file afterwards.
+        target_path (str or None): Output path, e.g. on the share for a
+            scene saved locally; <path><suffix> by default.
+
+    Returns:
+        dict or None: {"path", "codec", "level", "original_size", "stored_size"},
+        or None on failure (the source file is left untouched).
+    """
+    if codec not in CODECS:
+        logging.error(f"[CompressionUtils] Unknown compression codec '{codec}'.")
+        return None
+    suffix, default_level, _ = CODECS[codec]
+    level = default_level if level is None else level
+    target_path = target_path or path + suffix
+    temp_path = f"{target_path}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(path, "rb") as src, _open_codec(codec, temp_path, "wb", level) as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        shutil.copystat(path, temp_path)
+        os.replace(temp_path, target_path)
+        result = {
+            "path": target_path,
+            "codec": codec,
+            "level": level,
+            "original_size": os.path.getsize(path),
+            "stored_size": os.path.getsize(target_path)
+        }
+        if remove_source:
+            os.remove(path)
+        trace_utils_module.count("bytes_read", result["original_size"])
+        trace_utils_module.count("bytes_written", result["stored_size"])
+        return result
+    except Exception as e:
+        logging.error(f"[CompressionUtils] Failed to compress '{path}' with {codec}: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+
+
+def open_published(path: str, mode: str = "rb", encoding: Optional[str] = None):
+    """
+    Opens a published version for reading, decompressing on the fly.
+
+    `path` is the logical file path recorded in the publish history, e.g.
+    '.../tree_mod_v004.ma'; the stored file may be plain, compressed or
+    part of a delta chain. A path with a compressed suffix is opened directly.
+
+    Args:
+        path (str): Logical or stored file path.
+        mode (str): 'rb' or 'rt'.
+        encoding (str or None): Text encoding for 'rt' (default utf-8).
+
+    Returns:
+        file object: A readable stream.
+
+    Raises:
+        FileNotFoundError: If no stored file exists for the path.
+        ValueError: If mode is not a read mode.
+    """
+    if mode not in ("r", "rb", "rt"):
+        raise ValueError(f"open_published only reads, got mode '{mode}'.")
+    stored_path = find_published(path)
+    if not stored_path:
+        raise FileNotFoundError(f"No published file for '{path}'.")
+
+    text = mode in ("r", "rt")
+    codec = codec_for_path(stored_path)
+    if codec:
+        stream = _open_codec(codec, stored_path, "rb")
+    elif stored_path.endswith(delta_store_module.PACKED_EXTS):
+        stream = io.BytesIO(delta_store_module.DeltaStore().read_version(path))
+    else:
+        stream = open(stored_path, "rb")
+    return io.TextIOWrapper(stream, encoding=encoding or "utf-8") if text else stream
+
+
+def materialize(path: str, cache_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Returns a plain local copy of a published version, e.g. for cmds.file(open=True).
+
+    Plain files are returned as they are. Compressed files are decompressed
+    once into cache_dir, keyed by the stored file's path, size and mtime;
+    delta chain entries are rebuilt through DeltaStore.materialize.
+
+    Returns:
+        str or None: Path to a plain file, or None on failure.
+    """
+    stored_path = find_published(path)
+    if not stored_path:
+        logging.error(f"[CompressionUtils] No published file for '{path}'.")
+        return None
+    codec = codec_for_path(stored_path)
+    if codec is None:
+        if stored_path.endswith(delta_store_module.PACKED_EXTS):
+            return delta_store_module.DeltaStore().materialize(path)
+        return stored_path
+
+    temp_path = None
+    try:
+        st = os.stat(stored_path)
+        key = hashlib.sha1(f"{os.path.abspath(stored_path)}|{st.st_size}|{st.st_mtime_ns}".encode()).hexdigest()
+        base_name = os.path.basename(stored_path)[:-len(CODECS[codec][0])]
+        local_path = os.path.join(cache_dir or CACHE_DIR, key[:2], f"{key}_{base_name}")
+        if os.path.isfile(local_path):
+            return local_path
+
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        temp_path = f"{local_path}.{uuid.uuid4().hex[:8]}.tmp"
+        with _open_codec(codec, stored_path, "rb") as src, open(temp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        os.replace(temp_path, local_path)
+        return local_path
+    except Exception as e:
+        logging.error(f"[CompressionUtils] Failed to decompress '{stored_path}': {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
@@ -0,0 +1,302 @@
+# File: asset_manager/publish_tool/core/content_store.py
+
+import errno
+import hashlib
+import logging
+import os
+import re
+import shutil
+import stat
+import sys
+import uuid
+from typing import Optional, Tuple
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+STORE_DIR_NAME = ".content_store"
+LINK_MODES = ("auto", "hardlink", "reflink", "copy")
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Attributes rewritten on the metadata node by every publish (see
+# AssetPublisherLogic._step_update_metadata); ignored by scene_digest.
+VOLATILE_METADATA_ATTRS = frozenset([
+    "department",
+    "publisher_name",
+    "publish_date",
+    "publish_path",
+    "preview_image_path",
+    "version",
+    "metadata_json"
+])
+METADATA_NODE_SUFFIX = "_metadata_node"
+
+_CREATE_NODE = re.compile(rb'^createNode\s+\S+\s+.*?-n\s+"([^"]+)"')
+_SET_ATTR = re.compile(rb'^\s*setAttr\b.*?"\.([A-Za-z0-9_]+)"')
+_FILE_INFO_UUID = b'fileInfo "UUID"'
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs, XFS and similar
+_FICLONE = 0x40049409
+
+
+def _ma_scene_lines(lines):
+    """
+    Filters mayaAscii lines down to the ones that describe the scene.
+
+    Drops comment lines (the header carries the file name and save time),
+    the per-save fileInfo UUID, and the publish bookkeeping attributes of
+    the asset metadata node.
+    """
+    in_metadata_node = False
+    for line in lines:
+        if line.startswith(b"//") or line.startswith(_FILE_INFO_UUID):
+            continue
+        match = _CREATE_NODE.match(line)
+        if match:
+            in_metadata_node = match.group(1).endswith(METADATA_NODE_SUFFIX.encode())
+        elif in_metadata_node:
+            attr = _SET_ATTR.match(line)
+            if attr and attr.group(1).decode() in VOLATILE_METADATA_ATTRS:
+                continue
+        yield line
+
+
+# Scene formats with a normalized digest; other files use the raw digest
+_SCENE_FILTERS = {
+    ".ma": _ma_scene_lines
+}
+
+
+class StoredFile:
+    """
+    Result of ContentStore.ingest.
+
+    Attributes:
+        digest (str): sha256 of the file bytes, the object name in the store.
+        scene_digest (str): Digest of the scene content, see ContentStore.digest_file.
+        size (int): File size in bytes.
+        reused (bool): True if the object already existed (no new space used).
+        link_mode (str): How the published path refers to the object.
+    """
+
+    def __init__(self, digest, scene_digest, size, reused, link_mode):
+        self.digest = digest
+        self.scene_digest = scene_digest
+        self.size = size
+        self.reused = reused
+        self.link_mode = link_mode
+
+
+class ContentStore:
+    """
+    Content-addressed store for published files.
+
+    Every file is kept once under objects/<aa>/<bb>/<sha256> and published
+    paths refer to it through a hardlink, a reflink (copy-on-write clone) or,
+    where neither works, a plain copy:
+
+        <project_root>/.content_store/
+            objects/3f/2a/3f2a9c...
+
+    The store must be on the same volume as the publish tree for links to
+    work. Objects are made read-only, because every hardlinked version
+    shares them: editing a published file in place would change all of them.
+
+    Example:
+        store = ContentStore.for_project("E:/grow")
+        stored = store.ingest("E:/grow/publish/prop/tree/mod/ma/tree_mod_v004.ma")
+    """
+
+    def __init__(self, root: str, link_mode: str = "auto"):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{link_mode}', expected one of {LINK_MODES}.")
+        self.root = root
+        self.link_mode = link_mode
+        self.objects_dir = os.path.join(root, "objects")
+
+    @classmethod
+    def for_project(cls, project_root: str, link_mode: str = "auto") -> "ContentStore":
+        return cls(os.path.join(project_root, STORE_DIR_NAME), link_mode=link_mode)
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:4], digest)
+
+    def has_object(self, digest: str) -> bool:
+        return bool(digest) and os.path.isfile(self.object_path(digest))
+
+    @staticmethod
+    def digest_file(path: str) -> Tuple[str, str]:
+        """
+        Hashes a file in one streaming pass.
+
+        Returns:
+            tuple: (digest, scene_digest). digest is the sha256 of the bytes.
+            scene_digest ignores save-time noise for known scene formats (see
+            _ma_scene_lines), so a resave of an unchanged scene keeps its
+            scene_digest; for other files it equals digest.
+        """
+        scene_filter = _SCENE_FILTERS.get(os.path.splitext(path)[1].lower())
+        raw_hash = hashlib.sha256()
+
+        with open(path, "rb") as f:
+            if scene_filter is None:
+                for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                    raw_hash.update(block)
+                digest = raw_hash.hexdigest()
+                return digest, digest
+
+            scene_hash = hashlib.sha256()
+
+            def lines():
+                for line in f:
+                    raw_hash.update(line)
+                    yield line
+
+            for line in scene_filter(lines()):
+                scene_hash.update(line)
+        return raw_hash.hexdigest(), scene_hash.hexdigest()
+
+    # -- linking ---------------------------------------------------------
+
+    @staticmethod
+    def _reflink(source, target):
+        """
+        Clones source to target sharing blocks copy-on-write.
+
+        Raises:
+            OSError: If the platform or file system has no clone support.
+        """
+        if sys.platform.startswith("linux"):
+            import fcntl
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                try:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                    return
+                except OSError:
+                    pass
+            os.remove(target)
+        elif sys.platform == "darwin":
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) == 0:
+                return
+        raise OSError(errno.EOPNOTSUPP, "reflink not supported", target)
+
+    def _materialize(self, source, target) -> str:
+        """
+        Creates target (which must not exist) from source using the configured
+        link mode, falling back from hardlink to reflink to copy in auto mode.
+
+        Returns:
+            str: The link mode used.
+        """
+        modes = ("hardlink", "reflink", "copy") if self.link_mode == "auto" else (self.link_mode,)
+        for mode in modes:
+            try:
+                if mode == "hardlink":
+                    os.link(source, target)
+                elif mode == "reflink":
+                    self._reflink(source, target)
+                else:
+                    shutil.copyfile(source, target)
+                return mode
+            except FileExistsError:
+                raise
+            except OSError as e:
+                if mode == modes[-1]:
+                    raise
+                logging.debug(f"[ContentStore] {mode} '{source}' -> '{target}' failed: {e}")
+        raise OSError(f"Could not link '{source}' to '{target}'")
+
+    def link(self, digest: str, target_path: str) -> Optional[str]:
+        """
+        Points target_path at a stored object, replacing any existing file atomically.
+
+        Returns:
+            str or None: The link mode used, or None on failure.
+        """
+        object_path = self.object_path(digest)
+        temp_path = f"{target_path}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            mode = self._materialize(object_path, temp_path)
+            os.replace(temp_path, target_path)
+            return mode
+        except Exception as e:
+            logging.error(f"[ContentStore] Failed to link object {digest[:12]} to '{target_path}': {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+    def _add_object(self, path, digest) -> Optional[str]:
+        """
+        Stores a file as a new object. Returns the link mode shared with
+        `path`, or None if the object appeared concurrently.
+        """
+        object_path = self.object_path(digest)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        try:
+            if self.link_mode in ("auto", "hardlink"):
+                try:
+                    os.link(path, object_path)
+                    mode = "hardlink"
+                except FileExistsError:
+                    raise
+                except OSError:
+                    if self.link_mode == "hardlink":
+                        raise
+                    mode = None
+                if mode:
+                    os.chmod(object_path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+                    return mode
+
+            # No shared inode: copy the bytes in and swap them into place
+            temp_path = f"{object_path}.{uuid.uuid4().hex[:8]}.tmp"
+            shutil.copyfile(path, temp_path)
+            os.chmod(temp_path, stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH)
+            if os.path.exists(object_path):
+                os.remove(temp_path)
+                return None
+            os.replace(temp_path, object_path)
+            return "copy"
+        except FileExistsError:
+            return None
+
+    @trace_utils_module.traced("ContentStore.ingest")
+    def ingest(self, path: str, digests: Optional[Tuple[str, str]] = None) -> Optional[StoredFile]:
+        """
+        Moves a freshly written file into the store.
+
+        If an object with the same bytes exists, the file is replaced by a
+        link to it and no new space is used; otherwise the file becomes the
+        new object.
+
+        Args:
+            path (str): File to store, e.g. a just-saved publish.
+            digests (tuple or None): (digest, scene_digest) if already computed.
+
+        Returns:
+            StoredFile or None: None on failure (the file is left untouched).
+        """
+        try:
+            digest, scene_digest = digests or self.digest_file(path)
+            size = os.path.getsize(path)
+            object_path = self.object_path(digest)
+
+            for _ in range(2):
+                if os.path.isfile(object_path):
+                    if os.path.samefile(object_path, path):
+                        return StoredFile(digest, scene_digest, size, True, "hardlink")
+                    if os.path.getsize(object_path) == size:
+                        mode = self.link(digest, path)
+                        return StoredFile(digest, scene_digest, size, True, mode) if mode else None
+                    # Damaged object: replace it with the new bytes
+                    logging.warning(f"[ContentStore] Object {digest[:12]} has the wrong size, replacing it.")
+                    os.chmod(object_path, stat.S_IWRITE | stat.S_IREAD)
+                    os.remove(object_path)
+
+                mode = self._add_object(path, digest)
+                if mode:
+                    return StoredFile(digest, scene_digest, size, False, mode)
+            return None
+        except Exception as e:
+            logging.error(f"[ContentStore] Failed to store '{path}': {e}")
+            return None
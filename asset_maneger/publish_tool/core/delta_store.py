@@ -0,0 +1,439 @@
+# File: asset_manager/publish_tool/core/delta_store.py
+
+import bisect
+import hashlib
+import logging
+import os
+import struct
+import threading
+import uuid
+import zlib
+from typing import List, Optional, Tuple
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+KEYFRAME_EXT = ".key"
+DELTA_EXT = ".delta"
+PACKED_EXTS = (KEYFRAME_EXT, DELTA_EXT)
+DEFAULT_KEYFRAME_INTERVAL = 10
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pip_dev", "delta_cache")
+CACHE_MAX_BYTES = 20 * 1024 ** 3
+
+_MAGIC = b"PDLT"
+_FORMAT_VERSION = 1
+_OP_COPY = 0
+_OP_INSERT = 1
+_MAX_CANDIDATES = 8
+_MIN_COPY_BYTES = 8
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_delta(base_lines: List[bytes], new_lines: List[bytes]) -> bytes:
+    """
+    Encodes new_lines as copy/insert operations against base_lines.
+
+    Each new line is looked up in a hash index of the base lines and the
+    longest run of matching lines among a few candidate positions is copied
+    (preferring the position right after the previous copy). Lines that do
+    not match are inserted verbatim. The cost is linear in the number of
+    lines, unlike a full diff.
+
+    Returns:
+        bytes: Uncompressed operation stream.
+    """
+    index = {}
+    for position, line in enumerate(base_lines):
+        index.setdefault(line, []).append(position)
+
+    base_count = len(base_lines)
+    new_count = len(new_lines)
+    out = bytearray()
+    pending = []
+    expected = 0
+    i = 0
+
+    def flush_inserts():
+        if pending:
+            payload = b"".join(pending)
+            out.append(_OP_INSERT)
+            _write_varint(out, len(payload))
+            out.extend(payload)
+            pending.clear()
+
+    while i < new_count:
+        line = new_lines[i]
+        positions = index.get(line)
+        if not positions:
+            pending.append(line)
+            i += 1
+            continue
+
+        candidates = []
+        if expected < base_count and base_lines[expected] == line:
+            candidates.append(expected)
+        after = bisect.bisect_left(positions, expected)
+        candidates.extend(positions[after:after + _MAX_CANDIDATES])
+        # Clamped: a negative bound would slice in every occurrence of a repeated line
+        candidates.extend(positions[:max(0, _MAX_CANDIDATES - len(candidates))])
+
+        best_start, best_length = None, 0
+        for start in candidates:
+            length = 1
+            while (i + length < new_count and start + length < base_count
+                   and new_lines[i + length] == base_lines[start + length]):
+                length += 1
+            if length > best_length:
+                best_start, best_length = start, length
+                if i + length >= new_count:
+                    break
+
+        if best_length == 1 and len(line) < _MIN_COPY_BYTES:
+            pending.append(line)
+            i += 1
+            continue
+
+        flush_inserts()
+        out.append(_OP_COPY)
+        _write_varint(out, best_start)
+        _write_varint(out, best_length)
+        i += best_length
+        expected = best_start + best_length
+
+    flush_inserts()
+    return bytes(out)
+
+
+def apply_delta(base_lines: List[bytes], ops: bytes) -> bytes:
+    """
+    Rebuilds the content encoded by encode_delta.
+    """
+    parts = []
+    pos = 0
+    end = len(ops)
+    while pos < end:
+        op = ops[pos]
+        pos += 1
+        if op == _OP_COPY:
+            start, pos = _read_varint(ops, pos)
+            length, pos = _read_varint(ops, pos)
+            parts.extend(base_lines[start:start + length])
+        elif op == _OP_INSERT:
+            length, pos = _read_varint(ops, pos)
+            parts.append(ops[pos:pos + length])
+            pos += length
+        else:
+            raise ValueError(f"Corrupt delta: unknown operation {op} at byte {pos - 1}")
+    return b"".join(parts)
+
+
+class PackedHeader:
+    """
+    Header of a .key or .delta file.
+
+    Attributes:
+        is_keyframe (bool): True for full (compressed) content.
+        depth (int): Deltas since the last keyframe (0 for keyframes).
+        digest (bytes): sha256 of the reconstructed content.
+        base_name (str): File name of the base version (deltas only).
+        payload_offset (int): Offset of the zlib payload.
+    """
+
+    def __init__(self, is_keyframe, depth, digest, base_name, payload_offset=0):
+        self.is_keyframe = is_keyframe
+        self.depth = depth
+        self.digest = digest
+        self.base_name = base_name
+        self.payload_offset = payload_offset
+
+    def to_bytes(self) -> bytes:
+        base = (self.base_name or "").encode("utf-8")
+        out = bytearray(_MAGIC)
+        out += struct.pack("<BB", _FORMAT_VERSION, 0 if self.is_keyframe else 1)
+        _write_varint(out, self.depth)
+        out += self.digest
+        _write_varint(out, len(base))
+        out += base
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PackedHeader":
+        if data[:4] != _MAGIC:
+            raise ValueError("Not a packed version file.")
+        format_version, kind = struct.unpack_from("<BB", data, 4)
+        if format_version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported packed format {format_version}.")
+        depth, pos = _read_varint(data, 6)
+        digest = bytes(data[pos:pos + 32])
+        base_length, pos = _read_varint(data, pos + 32)
+        base_name = bytes(data[pos:pos + base_length]).decode("utf-8") or None
+        return cls(kind == 0, depth, digest, base_name, pos + base_length)
+
+
+class DeltaStore:
+    """
+    Delta-compressed version chains for mayaAscii publishes.
+
+    A published 'tree_mod_v005.ma' is replaced by either:
+
+        tree_mod_v005.ma.key     full content, zlib compressed (a keyframe)
+        tree_mod_v005.ma.delta   line copy/insert delta against the previous
+                                 version, zlib compressed
+
+    Every keyframe_interval-th version of a chain is a keyframe, so rebuilding
+    any version applies at most keyframe_interval - 1 deltas. Versions are
+    rebuilt on demand by materialize() into a local cache keyed by content
+    digest, so a cached version is never stale.
+
+    VersionUtils counts packed files as written versions (see
+    version_utils.PACKED_EXTS), so version numbering is unaffected.
+
+    Example:
+        store = DeltaStore(keyframe_interval=10)
+        store.pack("E:/grow/publish/prop/tree/mod/ma/tree_mod_v005.ma")
+        local_path = store.materialize("E:/grow/publish/prop/tree/mod/ma/tree_mod_v005.ma")
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = CACHE_MAX_BYTES, compression_level: int = 6):
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_max_bytes = cache_max_bytes
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+
+    # -- locating versions -------------------------------------------------
+
+    @staticmethod
+    def find_stored(path: str) -> Optional[str]:
+        """
+        Returns the file holding a version: the plain file, its keyframe or its delta.
+        """
+        for candidate in (path, path + KEYFRAME_EXT, path + DELTA_EXT):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def read_header(packed_path: str) -> PackedHeader:
+        with open(packed_path, "rb") as f:
+            return PackedHeader.from_bytes(f.read(4096))
+
+    def _cache_path(self, digest: bytes, ext: str) -> str:
+        hex_digest = digest.hex()
+        return os.path.join(self.cache_dir, hex_digest[:2], hex_digest + ext)
+
+    # -- reconstruct -------------------------------------------------------
+
+    def _read_cached(self, digest, ext) -> Optional[bytes]:
+        cache_path = self._cache_path(digest, ext)
+        try:
+            with open(cache_path, "rb") as f:
+                content = f.read()
+            os.utime(cache_path)  # LRU order for prune_cache
+            return content
+        except OSError:
+            return None
+
+    def _write_cache(self, digest, ext, content) -> str:
+        cache_path = self._cache_path(digest, ext)
+        if not os.path.exists(cache_path):
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{cache_path}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, cache_path)
+        return cache_path
+
+    def read_version(self, path: str) -> bytes:
+        """
+        Returns the full content of a version, rebuilding it from its chain if needed.
+
+        Args:
+            path (str): The versioned path as published, e.g. '.../tree_mod_v005.ma'.
+
+        Raises:
+            FileNotFoundError: If neither the file nor a packed form exists.
+            ValueError: If a packed file is corrupt or a rebuilt version fails its digest check.
+        """
+        ext = os.path.splitext(path)[1]
+        chain = []
+        current = path
+        content = None
+        while True:
+            stored = self.find_stored(current)
+            if stored is None:
+                raise FileNotFoundError(f"No stored version for '{current}'")
+            if stored == current:
+                with open(stored, "rb") as f:
+                    content = f.read()
+                break
+
+            with open(stored, "rb") as f:
+                data = f.read()
+            header = PackedHeader.from_bytes(data)
+            content = self._read_cached(header.digest, ext)
+            if content is not None:
+                break
+            chain.append((header, data))
+            if header.is_keyframe:
+                content = b""
+                break
+            current = os.path.join(os.path.dirname(current), header.base_name)
+
+        # Apply from the oldest link forward
+        for header, data in reversed(chain):
+            payload = zlib.decompress(data[header.payload_offset:])
+            if header.is_keyframe:
+                content = payload
+            else:
+                content = apply_delta(content.splitlines(keepends=True), payload)
+            if hashlib.sha256(content).digest() != header.digest:
+                raise ValueError(f"Rebuilt content of '{path}' does not match its digest.")
+        return content
+
+    def materialize(self, path: str) -> Optional[str]:
+        """
+        Returns a local path holding the full content of a version.
+
+        Plain files are returned as they are; packed versions are rebuilt into
+        the local cache (reused on later calls).
+
+        Returns:
+            str or None: Readable file path, or None on failure.
+        """
+        try:
+            stored = self.find_stored(path)
+            if stored == path:
+                return path
+            if stored is None:
+                logging.error(f"[DeltaStore] No stored version for '{path}'")
+                return None
+            header = self.read_header(stored)
+            ext = os.path.splitext(path)[1]
+            cache_path = self._cache_path(header.digest, ext)
+            if os.path.exists(cache_path):
+                os.utime(cache_path)
+                return cache_path
+            cache_path = self._write_cache(header.digest, ext, self.read_version(path))
+            self.prune_cache()
+            return cache_path
+        except Exception as e:
+            logging.error(f"[DeltaStore] Failed to materialize '{path}': {e}")
+            return None
+
+    def prune_cache(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Deletes least recently used cache files until the cache fits in max_bytes.
+
+        Returns:
+            int: Bytes freed.
+        """
+        max_bytes = self.cache_max_bytes if max_bytes is None else max_bytes
+        entries = []
+        total = 0
+        with self._lock:
+            for dir_path, _, file_names in os.walk(self.cache_dir):
+                for file_name in file_names:
+                    file_path = os.path.join(dir_path, file_name)
+                    try:
+                        st = os.stat(file_path)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, file_path))
+                    total += st.st_size
+
+            freed = 0
+            for _, size, file_path in sorted(entries):
+                if total - freed <= max_bytes:
+                    break
+                try:
+                    os.remove(file_path)
+                    freed += size
+                except OSError:
+                    pass
+        return freed
+
+    # -- pack --------------------------------------------------------------
+
+    @trace_utils_module.traced("DeltaStore.pack")
+    def pack(self, path: str, base_path: Optional[str] = None) -> Optional[str]:
+        """
+        Replaces a full version file with a keyframe or a delta against base_path.
+
+        A keyframe is written when there is no usable base or when the base
+        is keyframe_interval - 1 deltas away from its keyframe. The full
+        content is seeded into the local cache, so the publisher can reopen
+        the version without rebuilding it.
+
+        Args:
+            path (str): Full version file to pack.
+            base_path (str or None): Versioned path of the previous version.
+
+        Returns:
+            str or None: The packed file path, or None on failure (the full file is kept).
+        """
+        packed_path = None
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            digest = hashlib.sha256(content).digest()
+            ext = os.path.splitext(path)[1]
+
+            depth = self._base_depth(base_path) if base_path else None
+            if depth is None or depth + 1 >= self.keyframe_interval:
+                header = PackedHeader(True, 0, digest, None)
+                payload = zlib.compress(content, self.compression_level)
+                packed_path = path + KEYFRAME_EXT
+            else:
+                base_lines = self.read_version(base_path).splitlines(keepends=True)
+                ops = encode_delta(base_lines, content.splitlines(keepends=True))
+                header = PackedHeader(False, depth + 1, digest, os.path.basename(base_path))
+                payload = zlib.compress(ops, self.compression_level)
+                packed_path = path + DELTA_EXT
+
+            header_bytes = header.to_bytes()
+            temp_path = f"{packed_path}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(header_bytes)
+                f.write(payload)
+            os.replace(temp_path, packed_path)
+            trace_utils_module.count("bytes_read", len(content))
+            trace_utils_module.count("bytes_written", len(header_bytes) + len(payload))
+
+            self._write_cache(digest, ext, content)
+            os.remove(path)
+            return packed_path
+        except Exception as e:
+            logging.error(f"[DeltaStore] Failed to pack '{path}': {e}")
+            if packed_path and os.path.exists(packed_path) and os.path.exists(path):
+                os.remove(packed_path)
+            return None
+
+    def _base_depth(self, base_path) -> Optional[int]:
+        """
+        Returns the chain depth of the base version: 0 for plain files and
+        keyframes, or None if the base does not exist.
+        """
+        stored = self.find_stored(base_path)
+        if stored is None:
+            return None
+        if stored == base_path:
+            return 0
+        return self.read_header(stored).depth
@@ -0,0 +1,282 @@
+# File: asset_manager/publish_tool/core/dependency_utils.py
+"""
+Gathers a scene's external files (textures, references, caches) into the publish.
+
+Files are copied into the department's data/dependencies folder under
+their content hash:
+
+    <department>/data/dependencies/<digest[:16]>/<file name>
+
+so every version of the department shares one copy of an unchanged file
+and the rewritten paths in the published scene stay the same between
+versions. index.json in the same folder remembers the digest of each
+source path by size and mtime, which lets an unchanged source be reused
+without reading it again.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+DEPENDENCIES_DIR_NAME = "dependencies"
+INDEX_FILE = "index.json"
+DEPENDENCY_WORKERS = 8
+HASH_BLOCK_SIZE = 1024 * 1024
+DIGEST_LENGTH = 16
+
+# File name tokens that stand for a sequence of files, e.g. UDIM tiles
+_SEQUENCE_TOKENS = re.compile(r"<UDIM>|<udim>|<UVTILE>|<uvtile>|<u>|<v>|<f>|<frame>|#+", re.IGNORECASE)
+
+
+def dependencies_dir_for(metadata_path: str) -> str:
+    """
+    Returns the data/dependencies folder next to a department's data/metadata folder.
+    """
+    return os.path.join(os.path.dirname(os.path.normpath(metadata_path)), DEPENDENCIES_DIR_NAME).replace("\\", "/")
+
+
+def resolve_path(raw_path: str, workspace_root: Optional[str] = None) -> str:
+    """
+    Expands environment variables and '~' and makes a workspace-relative path absolute.
+    """
+    path = os.path.expanduser(os.path.expandvars(raw_path.strip()))
+    if not os.path.isabs(path) and workspace_root:
+        path = os.path.join(workspace_root, path)
+    return os.path.normpath(path)
+
+
+def expand_sequence(path: str) -> List[str]:
+    """
+    Returns the files a dependency path stands for.
+
+    Paths with UDIM or frame tokens ('<UDIM>', '<f>', '####') expand to the
+    matching files on disk; other paths return themselves if they exist.
+    """
+    if _SEQUENCE_TOKENS.search(os.path.basename(path)):
+        pattern = glob.escape(os.path.dirname(path))
+        pattern = os.path.join(pattern, _SEQUENCE_TOKENS.sub("*", glob.escape(os.path.basename(path))))
+        return sorted(glob.glob(pattern))
+    return [path] if os.path.isfile(path) else []
+
+
+def digest_file(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def load_index(dependencies_dir: str) -> Dict[str, dict]:
+    """
+    Returns the source path -> {size, mtime_ns, digest} index of a dependencies folder.
+    """
+    try:
+        with open(os.path.join(dependencies_dir, INDEX_FILE), "r") as f:
+            index = json.load(f)
+        return index if isinstance(index, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logging.warning(f"[DependencyUtils] Ignoring unreadable index in '{dependencies_dir}': {e}")
+        return {}
+
+
+def save_index(dependencies_dir: str, index: Dict[str, dict]) -> bool:
+    """
+    Replaces the index atomically; concurrent publishes keep the last write.
+    """
+    index_path = os.path.join(dependencies_dir, INDEX_FILE)
+    temp_path = f"{index_path}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(temp_path, "w") as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        os.replace(temp_path, index_path)
+        return True
+    except Exception as e:
+        logging.error(f"[DependencyUtils] Failed to write the index in '{dependencies_dir}': {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
+def _gather_file(source: str, dependencies_dir: str, known: Optional[dict]) -> dict:
+    """
+    Places one source file in the dependencies folder.
+
+    Returns:
+        dict: source, target, digest, size, mtime_ns and either 'reused' or
+        'copied', or 'error' on failure.
+    """
+    try:
+        stat_result = os.stat(source)
+        digest = None
+        if known and known.get("size") == stat_result.st_size and known.get("mtime_ns") == stat_result.st_mtime_ns:
+            digest = known.get("digest")
+        if not digest:
+            digest = digest_file(source)
+
+        target = os.path.join(dependencies_dir, digest[:DIGEST_LENGTH], os.path.basename(source)).replace("\\", "/")
+        record = {
+            "source": source,
+            "target": target,
+            "digest": digest,
+            "size": stat_result.st_size,
+            "mtime_ns": stat_result.st_mtime_ns
+        }
+        if os.path.isfile(target) and os.path.getsize(target) == stat_result.st_size:
+            record["reused"] = True
+            return record
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temp_path = f"{target}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            shutil.copyfile(source, temp_path)
+            os.replace(temp_path, target)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        record["copied"] = True
+        return record
+    except Exception as e:
+        logging.error(f"[DependencyUtils] Failed to gather '{source}': {e}")
+        return {"source": source, "error": str(e)}
+
+
+def gather_dependencies(dependencies: List[dict], dependencies_dir: str,
+                        workspace_root: Optional[str] = None, workers: int = DEPENDENCY_WORKERS) -> dict:
+    """
+    Copies a scene's dependencies into `dependencies_dir` on a thread pool.
+
+    Args:
+        dependencies (list): Records from AssetSceneUtils.list_file_dependencies,
+            each with 'node', 'attr' and the unexpanded 'path'.
+        dependencies_dir (str): Target folder (see dependencies_dir_for).
+        workspace_root (str or None): Base of relative paths.
+        workers (int): Concurrent copies.
+
+    Returns:
+        dict: 'paths' maps each original scene path to its new path (sequence
+        paths keep their token in a gathered folder), 'files' lists the
+        gathered files, 'missing' the paths without files on disk and
+        'copied_bytes' / 'reused_bytes' the totals.
+    """
+    report = {"paths": {}, "files": [], "missing": [], "failed": [], "copied_bytes": 0, "reused_bytes": 0}
+    sources = {}
+    for dependency in dependencies:
+        raw_path = dependency["path"]
+        if raw_path in sources or raw_path in report["missing"]:
+            continue
+        resolved = resolve_path(raw_path, workspace_root)
+        files = expand_sequence(resolved)
+        if not files:
+            report["missing"].append(raw_path)
+            continue
+        sources[raw_path] = (resolved, files)
+    if not sources:
+        return report
+
+    os.makedirs(dependencies_dir, exist_ok=True)
+    index = load_index(dependencies_dir)
+    unique_files = sorted({file_path for _, files in sources.values() for file_path in files})
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique_files)))) as pool:
+        records = list(pool.map(
+            lambda source: _gather_file(source, dependencies_dir, index.get(source)),
+            unique_files
+        ))
+    by_source = {record["source"]: record for record in records}
+
+    for record in records:
+        if "error" in record:
+            report["failed"].append(record["source"])
+            continue
+        index[record["source"]] = {key: record[key] for key in ("size", "mtime_ns", "digest")}
+        report["copied_bytes" if record.get("copied") else "reused_bytes"] += record["size"]
+        report["files"].append({key: record[key] for key in ("source", "target", "digest", "size")})
+
+    for raw_path, (resolved, files) in sources.items():
+        gathered = [by_source[file_path] for file_path in files if "error" not in by_source[file_path]]
+        if len(gathered) != len(files):
+            # A partly gathered sequence keeps pointing at its source
+            continue
+        if len(files) == 1 and files[0] == resolved:
+            report["paths"][raw_path] = gathered[0]["target"]
+        else:
+            # Tiles land in different digest folders; link them side by side under the token name
+            report["paths"][raw_path] = _link_sequence(raw_path, gathered, dependencies_dir)
+
+    save_index(dependencies_dir, index)
+    trace_utils_module.count("dependency_files", len(report["files"]))
+    trace_utils_module.count("dependency_bytes_copied", report["copied_bytes"])
+    trace_utils_module.count("dependency_bytes_reused", report["reused_bytes"])
+    return report
+
+
+def _link_sequence(raw_path: str, gathered: List[dict], dependencies_dir: str) -> str:
+    """
+    Collects the files of a sequence in one folder named after their combined digest.
+
+    Hard links keep this free where the file system allows it.
+    """
+    combined = hashlib.sha256("".join(sorted(record["digest"] for record in gathered)).encode()).hexdigest()
+    sequence_dir = os.path.join(dependencies_dir, combined[:DIGEST_LENGTH]).replace("\\", "/")
+    os.makedirs(sequence_dir, exist_ok=True)
+    for record in gathered:
+        target = os.path.join(sequence_dir, os.path.basename(record["source"]))
+        if os.path.isfile(target):
+            continue
+        temp_path = f"{target}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            os.link(record["target"], temp_path)
+        except OSError:
+            shutil.copyfile(record["target"], temp_path)
+        os.replace(temp_path, target)
+    return f"{sequence_dir}/{os.path.basename(raw_path.replace(os.sep, '/'))}"
+
+
+def rewrite_scene_paths(scene_path: str, paths: Dict[str, str]) -> int:
+    """
+    Replaces quoted dependency paths in a saved mayaAscii file.
+
+    The file is streamed into a temporary file that then replaces it, which
+    also detaches it from any hard-linked copy.
+
+    Args:
+        scene_path (str): The saved .ma file.
+        paths (dict): Original path string -> new path.
+
+    Returns:
+        int: Number of replaced strings, or -1 on failure.
+    """
+    if not paths:
+        return 0
+    # Longest first, so a path never matches inside a longer one
+    quoted = {json.dumps(old, ensure_ascii=False): json.dumps(new, ensure_ascii=False) for old, new in paths.items()}
+    pattern = re.compile("|".join(re.escape(old) for old in sorted(quoted, key=len, reverse=True)))
+
+    replaced = 0
+    temp_path = f"{scene_path}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(scene_path, "r", encoding="utf-8", errors="surrogateescape", newline="") as src, \
+                open(temp_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as dst:
+            for line in src:
+                if '"' in line:
+                    line, count = pattern.subn(lambda match: quoted[match.group(0)], line)
+                    replaced += count
+                dst.write(line)
+        os.replace(temp_path, scene_path)
+        return replaced
+    except Exception as e:
+        logging.error(f"[DependencyUtils] Failed to rewrite paths in '{scene_path}': {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return -1
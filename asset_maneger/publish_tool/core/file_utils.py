@@ -1,8 +1,27 @@
 import os
 import logging
-from typing import Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+# Relative folders created for every asset/department/format. The first three
+# roles are the paths returned by create_publish_dir_structure.
+PUBLISH_DIR_TEMPLATE = {
+    "file": "publish/{asset_type}/{asset_name}/{department}/{format_type}",
+    "metadata": "publish/{asset_type}/{asset_name}/{department}/data/metadata",
+    "preview_image": "publish/{asset_type}/{asset_name}/{department}/data/preview_image",
+}
+
+# Seconds a folder stays "known to exist" before it is checked on disk again
+DIR_CACHE_TTL = 300.0
 
 class DirectoryUtils:
+    _known_dirs = {}
+    _known_dirs_lock = threading.Lock()
+
     @staticmethod
     def create_dir(base_path, folder_name):
         """
@@ -24,17 +43,92 @@ class DirectoryUtils:
             return None
 
     @staticmethod
+    def _normalize(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def _is_known_dir(path, now=None):
+        expires = DirectoryUtils._known_dirs.get(DirectoryUtils._normalize(path))
+        return expires is not None and expires > (now or time.monotonic())
+
+    @staticmethod
+    def _remember_dir(path, now=None):
+        """
+        Marks a folder and all of its parents as existing.
+        """
+        expires = (now or time.monotonic()) + DIR_CACHE_TTL
+        path = DirectoryUtils._normalize(path)
+        with DirectoryUtils._known_dirs_lock:
+            while path and DirectoryUtils._known_dirs.get(path, 0) < expires:
+                DirectoryUtils._known_dirs[path] = expires
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+
+    @staticmethod
+    def invalidate_dir_cache(path: Optional[str] = None) -> None:
+        """
+        Forgets cached folders, either all of them or `path` and everything below it.
+        """
+        with DirectoryUtils._known_dirs_lock:
+            if path is None:
+                DirectoryUtils._known_dirs.clear()
+                return
+            prefix = DirectoryUtils._normalize(path)
+            for known in list(DirectoryUtils._known_dirs):
+                if known == prefix or known.startswith(prefix + os.sep):
+                    del DirectoryUtils._known_dirs[known]
+
+    @staticmethod
+    def ensure_dir(path: str) -> bool:
+        """
+        Creates a folder and its parents unless it is already known to exist.
+
+        Repeated calls for the same tree cost no file system round-trips
+        until DIR_CACHE_TTL runs out.
+
+        Returns:
+            bool: True if the folder exists, False if it could not be created.
+        """
+        if DirectoryUtils._is_known_dir(path):
+            trace_utils_module.count("dir_cache_hits")
+            return True
+        trace_utils_module.count("file_ops")
+        try:
+            os.makedirs(path, exist_ok=True)
+        except Exception as e:
+            logging.error(f"[DirectoryUtils] Failed to create directory '{path}': {e}")
+            return False
+        DirectoryUtils._remember_dir(path)
+        return True
+
+    @staticmethod
+    def render_dir_template(template: Dict[str, str], **fields) -> Dict[str, str]:
+        """
+        Fills a directory template with asset fields.
+
+        Example:
+            render_dir_template(PUBLISH_DIR_TEMPLATE, asset_type="prop", asset_name="tree",
+                                department="mod", format_type="ma")
+            -> {"file": "publish/prop/tree/mod/ma", ...}
+        """
+        return {role: relative.format(**fields) for role, relative in template.items()}
+
+    @staticmethod
+    @trace_utils_module.traced("DirectoryUtils.create_publish_dir_structure")
     def create_publish_dir_structure(
         project_root: str,
         asset_name: str,
         department: str,
         asset_type: str,
-        format_type: str
+        format_type: str,
+        template: Optional[Dict[str, str]] = None
     ) -> Optional[Tuple[str, str, str]]:
         """
         Creates a nested directory structure for publishing an asset in a VFX pipeline.
 
-        Final structure:
+        Default structure (PUBLISH_DIR_TEMPLATE):
             <project_root>/
                 publish/
                     <asset_type>/
@@ -45,12 +139,18 @@ class DirectoryUtils:
                                     preview_image/
                                 <format_type>/
 
+        Folders created earlier in this process are not checked again (see
+        ensure_dir), so republishing the same asset touches the disk only
+        when the cache entry has expired.
+
         Args:
             project_root (str): Base project path (e.g., 'E:/projects/showreel_2025')
             asset_name (str): Asset name (e.g., 'tree')
             department (str): Department name (e.g., 'Model', 'Rig')
             asset_type (str): Asset type/category (e.g., 'Prop', 'Character')
             format_type (str): Output format folder (e.g., 'ma', 'usd', 'abc')
+            template (dict or None): Role to relative path template; must contain
+                the 'file', 'metadata' and 'preview_image' roles.
 
         Returns:
             Optional[Tuple[str, str, str]]: A tuple containing the full paths to the
@@ -62,43 +162,100 @@ class DirectoryUtils:
             logging.error("[DirectoryUtils] One or more required arguments are empty.")
             return None
 
-        # Base path up to the department level
-        base_path_chain = [
-            "publish",
-            asset_type,
-            asset_name,
-            department
-        ]
-
-        department_path = project_root
-        for folder in base_path_chain:
-            department_path = DirectoryUtils.create_dir(department_path, folder)
-            if not department_path:
-                logging.error(f"[DirectoryUtils] Failed to create directory at step: {folder}")
+        try:
+            relative_paths = DirectoryUtils.render_dir_template(
+                template or PUBLISH_DIR_TEMPLATE,
+                asset_type=asset_type,
+                asset_name=asset_name,
+                department=department,
+                format_type=format_type
+            )
+        except (KeyError, IndexError, ValueError) as e:
+            logging.error(f"[DirectoryUtils] Invalid directory template: {e}")
+            return None
+
+        paths = {}
+        for role, relative in relative_paths.items():
+            full_path = os.path.join(project_root, relative)
+            if not DirectoryUtils.ensure_dir(full_path):
+                logging.error(f"[DirectoryUtils] Failed to create '{role}' directory.")
                 return None
+            paths[role] = full_path
 
-        # Create the format_type directory
-        file_publish_path = DirectoryUtils.create_dir(department_path, format_type)
-        if not file_publish_path:
-            logging.error(f"[DirectoryUtils] Failed to create format_type directory.")
+        try:
+            return paths["file"], paths["metadata"], paths["preview_image"]
+        except KeyError as e:
+            logging.error(f"[DirectoryUtils] Directory template has no {e} entry.")
             return None
 
-        # Create the data directory and its subdirectories
-        data_path = DirectoryUtils.create_dir(department_path, "data")
-        if not data_path:
-            logging.error(f"[DirectoryUtils] Failed to create data directory.")
-            return None
+    @staticmethod
+    def provision_publish_trees(
+        project_root: str,
+        assets: Iterable[Tuple[str, str]],
+        departments: Iterable[str],
+        format_types: Iterable[str] = ("ma",),
+        template: Optional[Dict[str, str]] = None,
+        max_workers: int = 16
+    ) -> Dict[str, float]:
+        """
+        Creates publish skeletons for many assets at once, e.g. at show start-up.
 
-        metadata_path = DirectoryUtils.create_dir(data_path, "metadata")
-        if not metadata_path:
-            logging.error(f"[DirectoryUtils] Failed to create metadata directory.")
-            return None
+        Every asset x department x format combination is rendered through the
+        template, shared folders are created only once, and the unique leaf
+        folders are created on a thread pool so the per-folder latency of a
+        network share overlaps.
 
-        preview_image_path = DirectoryUtils.create_dir(data_path, "preview_image")
-        if not preview_image_path:
-            logging.error(f"[DirectoryUtils] Failed to create preview_image directory.")
-            return None
+        Args:
+            project_root (str): Base project path.
+            assets (iterable): (asset_type, asset_name) pairs.
+            departments (iterable): Department codes, e.g. ['mod', 'rig', 'tex'].
+            format_types (iterable): Format folders, e.g. ['ma', 'abc'].
+            template (dict or None): Directory template, PUBLISH_DIR_TEMPLATE by default.
+            max_workers (int): Threads creating folders.
+
+        Returns:
+            dict: Counts of 'created', 'existing' and 'failed' leaf folders, plus 'seconds'.
+        """
+        start = time.perf_counter()
+        template = template or PUBLISH_DIR_TEMPLATE
+        departments = list(departments)
+        format_types = list(format_types)
+
+        leaves = set()
+        for asset_type, asset_name in assets:
+            for department in departments:
+                for format_type in format_types:
+                    relative_paths = DirectoryUtils.render_dir_template(
+                        template,
+                        asset_type=asset_type,
+                        asset_name=asset_name,
+                        department=department,
+                        format_type=format_type
+                    )
+                    for relative in relative_paths.values():
+                        leaves.add(os.path.normpath(os.path.join(project_root, relative)))
+
+        # Parents of other leaves get created along the way
+        parents = {os.path.dirname(path) for path in leaves}
+        pending = sorted(path for path in leaves if path not in parents and not DirectoryUtils._is_known_dir(path))
 
-        return file_publish_path, metadata_path, preview_image_path
+        def create(path):
+            try:
+                os.makedirs(path)
+                result = "created"
+            except FileExistsError:
+                result = "existing"
+            except Exception as e:
+                logging.error(f"[DirectoryUtils] Failed to create directory '{path}': {e}")
+                return "failed"
+            DirectoryUtils._remember_dir(path)
+            return result
 
+        stats = {"created": 0, "existing": len(leaves) - len(parents & leaves) - len(pending), "failed": 0}
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                for result in pool.map(create, pending):
+                    stats[result] += 1
 
+        stats["seconds"] = round(time.perf_counter() - start, 4)
+        return stats
@@ -1,6 +1,13 @@
+import datetime
 import json
 import logging
 import os
+import uuid
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+HISTORY_SUFFIX = "_history.jsonl"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 def save_json(path: str, file_name: str, data: dict) -> bool:
     """
@@ -73,33 +80,290 @@ def update_json(path: str, file_name: str, new_data: dict) -> bool:
 
     return save_json(path, file_name, data)
 
-def update_publish_history(path: str, file_name: str, new_entry: dict) -> bool:
+def get_history_file_name(file_name: str) -> str:
     """
-    Updates a JSON file by appending a new entry to a 'publish_history' list.
-    If the file doesn't exist, it creates it with the initial asset info.
+    Returns the name of the append-only history log that belongs to a metadata file.
 
-    Args:
-        path (str): The directory path of the JSON file.
-        file_name (str): The name of the JSON file (e.g., 'metadata.json').
-        new_entry (dict): The new dictionary to append to the history.
+    Example:
+        'metadata.json' -> 'metadata_history.jsonl'
+    """
+    return os.path.splitext(file_name)[0] + HISTORY_SUFFIX
+
+def _write_lines_temp(file_path: str, records: list) -> str:
+    """
+    Writes records as JSON lines to a uniquely named temp file next to file_path.
 
     Returns:
-        bool: True if the file was updated successfully, False otherwise.
+        str: The temp file path.
+    """
+    temp_path = f"{file_path}.{uuid.uuid4().hex[:8]}.tmp"
+    with open(temp_path, "w", encoding="utf-8", newline="\n") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+    return temp_path
+
+def _write_lines_atomic(file_path: str, records: list) -> None:
+    """
+    Writes records as JSON lines to a temp file and swaps it into place.
+    """
+    os.replace(_write_lines_temp(file_path, records), file_path)
+
+def _create_lines_exclusive(file_path: str, records: list) -> bool:
+    """
+    Creates file_path with the records unless it exists; never replaces an existing file.
+
+    The records are written to a temp file first and hard-linked into place,
+    so the file appears complete. File systems without hard links fall back
+    to an exclusive create.
+
+    Returns:
+        bool: True if this call created the file, False if it already existed.
+    """
+    temp_path = _write_lines_temp(file_path, records)
+    try:
+        try:
+            os.link(temp_path, file_path)
+            return True
+        except FileExistsError:
+            return False
+        except OSError:
+            pass
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0))
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "wb") as dst, open(temp_path, "rb") as src:
+            dst.write(src.read())
+        return True
+    finally:
+        os.remove(temp_path)
+
+def _migrate_publish_history(path: str, file_name: str, new_entry: dict) -> bool:
+    """
+    Moves a legacy 'publish_history' list out of the metadata file into the
+    append-only log. The metadata file keeps only the asset header.
+
+    Runs once per asset, the first time the history log does not exist yet.
+    Concurrent first publishes race on creating the log: the log is created
+    before the metadata file drops its list, and only the writer that
+    created it rewrites the metadata file, so a later writer that read the
+    already migrated metadata can never replace the log with an empty one.
+
+    Returns:
+        bool: True if the log is ready for appends, False otherwise.
     """
+    history_name = get_history_file_name(file_name)
     data = load_json(path, file_name)
-    
+
     if data is None:
-        # If file doesn't exist, create the base structure
         data = {
             "asset_name": new_entry.get("asset_name"),
-            "asset_type": new_entry.get("asset_type"),
-            "publish_history": []
+            "asset_type": new_entry.get("asset_type")
         }
 
-    # Ensure publish_history list exists
-    if "publish_history" not in data:
-        data["publish_history"] = []
-        
-    data["publish_history"].append(new_entry)
+    legacy_history = data.pop("publish_history", None) or []
+    try:
+        if not _create_lines_exclusive(os.path.join(path, history_name), legacy_history):
+            # Another publish migrated it first
+            return True
+    except Exception as e:
+        logging.error(f"[JsonUtils] Failed to migrate publish history in '{path}': {e}")
+        return False
+
+    data["history_file"] = history_name
+    return save_json(path, file_name, data)
+
+def append_json_line(file_path: str, record: dict) -> int:
+    """
+    Appends one JSON record as a single line with one append write, so
+    concurrent writers never interleave inside a record.
+
+    Returns:
+        int: Number of bytes written. Raises OSError on failure.
+    """
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    flags = os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    fd = os.open(file_path, flags)
+    try:
+        # Never glue the record onto a line torn by an interrupted writer
+        if os.lseek(fd, 0, os.SEEK_END) > 0:
+            os.lseek(fd, -1, os.SEEK_END)
+            if os.read(fd, 1) != b"\n":
+                line = b"\n" + line
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    return len(line)
 
-    return save_json(path, file_name, data)
\ No newline at end of file
+@trace_utils_module.traced("json_utils.update_publish_history")
+def update_publish_history(path: str, file_name: str, new_entry: dict) -> bool:
+    """
+    Appends a new entry to the asset's publish history.
+
+    The history lives next to the metadata file as one JSON record per line
+    (see get_history_file_name) and each publish costs a single append write,
+    independent of the history length. Metadata files that still hold an
+    inline 'publish_history' list are migrated on the first append.
+
+    Args:
+        path (str): The directory path of the JSON file.
+        file_name (str): The name of the JSON file (e.g., 'metadata.json').
+        new_entry (dict): The new dictionary to append to the history.
+
+    Returns:
+        bool: True if the entry was appended successfully, False otherwise.
+    """
+    history_path = os.path.join(path, get_history_file_name(file_name))
+    try:
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        if not os.path.exists(history_path) and not _migrate_publish_history(path, file_name, new_entry):
+            return False
+
+        written = append_json_line(history_path, new_entry)
+        trace_utils_module.count("file_ops")
+        trace_utils_module.count("bytes_written", written)
+        return True
+    except Exception as e:
+        logging.error(f"[JsonUtils] Failed to append publish history to '{history_path}': {e}")
+        return False
+
+def _iter_lines_reversed(file_path: str, block_size: int = 65536):
+    """
+    Yields the lines of a file from last to first, reading fixed-size blocks
+    backwards from the end so only the requested tail is ever read.
+    """
+    with open(file_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+def _iter_history_reversed(path: str, file_name: str):
+    """
+    Yields history entries newest first, from the log or a legacy metadata file.
+    """
+    history_path = os.path.join(path, get_history_file_name(file_name))
+    if not os.path.exists(history_path):
+        data = load_json(path, file_name) or {}
+        yield from reversed(data.get("publish_history", []))
+        return
+
+    for line in _iter_lines_reversed(history_path):
+        try:
+            yield json.loads(line)
+        except ValueError:
+            logging.warning(f"[JsonUtils] Skipping malformed history record in '{history_path}'")
+
+def read_publish_history(path: str, file_name: str) -> list:
+    """
+    Returns the full publish history in chronological order.
+
+    Args:
+        path (str): The directory path of the JSON file.
+        file_name (str): The name of the JSON file (e.g., 'metadata.json').
+
+    Returns:
+        list: History entries, oldest first. Empty if there is no history.
+    """
+    try:
+        return list(_iter_history_reversed(path, file_name))[::-1]
+    except Exception as e:
+        logging.error(f"[JsonUtils] Failed to read publish history in '{path}': {e}")
+        return []
+
+def tail_publish_history(path: str, file_name: str, count: int) -> list:
+    """
+    Returns the latest `count` history entries, reading from the end of the log.
+
+    Returns:
+        list: Up to `count` entries, oldest first.
+    """
+    entries = []
+    try:
+        for entry in _iter_history_reversed(path, file_name):
+            if len(entries) >= count:
+                break
+            entries.append(entry)
+    except Exception as e:
+        logging.error(f"[JsonUtils] Failed to read publish history in '{path}': {e}")
+    return entries[::-1]
+
+def publish_history_since(path: str, file_name: str, timestamp) -> list:
+    """
+    Returns history entries published at or after `timestamp`.
+
+    Reading stops at the first older entry, so the cost depends on the number
+    of matching entries rather than the history length.
+
+    Args:
+        timestamp (str or datetime.datetime): Lower bound, as a datetime or a
+            string in DATE_FORMAT.
+
+    Returns:
+        list: Matching entries, oldest first.
+    """
+    if isinstance(timestamp, datetime.datetime):
+        timestamp = timestamp.strftime(DATE_FORMAT)
+
+    entries = []
+    try:
+        for entry in _iter_history_reversed(path, file_name):
+            if entry.get("publish_date", "") < timestamp:
+                break
+            entries.append(entry)
+    except Exception as e:
+        logging.error(f"[JsonUtils] Failed to read publish history in '{path}': {e}")
+    return entries[::-1]
+
+def compact_publish_history(path: str, file_name: str) -> int:
+    """
+    Rewrites the history log offline: drops torn or malformed records and
+    exact duplicates, orders entries by publish date and strips any legacy
+    inline history from the metadata file.
+
+    Should not run while artists are publishing to the same asset.
+
+    Returns:
+        int: Number of entries kept, or -1 on failure.
+    """
+    history_name = get_history_file_name(file_name)
+    history_path = os.path.join(path, history_name)
+    try:
+        if not os.path.exists(history_path):
+            if not os.path.exists(os.path.join(path, file_name)):
+                return 0
+            if not _migrate_publish_history(path, file_name, {}):
+                return -1
+
+        entries = []
+        seen = set()
+        for entry in read_publish_history(path, file_name):
+            key = json.dumps(entry, sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                entries.append(entry)
+        entries.sort(key=lambda e: e.get("publish_date", ""))
+        _write_lines_atomic(history_path, entries)
+
+        data = load_json(path, file_name) or {}
+        if "publish_history" in data or data.get("history_file") != history_name:
+            data.pop("publish_history", None)
+            data["history_file"] = history_name
+            save_json(path, file_name, data)
+
+        return len(entries)
+    except Exception as e:
+        logging.error(f"[JsonUtils] Failed to compact publish history in '{path}': {e}")
+        return -1
@@ -0,0 +1,425 @@
+# File: asset_manager/publish_tool/core/metadata_service.py
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import publish_tool.core.asset_resolver as asset_resolver_module
+import publish_tool.core.catalog as catalog_module
+import publish_tool.core.json_utils as json_utils_module
+import publish_tool.core.publish_watcher as publish_watcher_module
+from publish_tool.core.file_utils import PUBLISH_DIR_TEMPLATE
+
+SERVICE_DIR = os.path.join(os.path.expanduser("~"), ".pip_dev", "services")
+HOST = "127.0.0.1"
+METADATA_FILE = "metadata.json"
+
+CONNECT_TIMEOUT = 0.2  # seconds; a missing service must not slow down direct I/O
+REQUEST_TIMEOUT = 10.0
+RETRY_INTERVAL = 30.0  # seconds before a client tries a service that was not reachable again
+CATALOG_REFRESH_INTERVAL = 10.0  # seconds between full catalog rescans for listings
+MAX_TAIL = 100  # history records kept per asset/department for tail requests
+
+
+def service_file_path(project_root: str) -> str:
+    """
+    Returns the file announcing the local service of a project (port, pid, token).
+
+    Example:
+        'E:/grow' -> '~/.pip_dev/services/grow_3f2a9c1d.json'
+    """
+    catalog_name = os.path.basename(catalog_module.default_catalog_path(project_root))
+    return os.path.join(SERVICE_DIR, os.path.splitext(catalog_name)[0] + ".json")
+
+
+def metadata_dir_for(project_root, asset_type, asset_name, department) -> str:
+    return os.path.join(project_root, PUBLISH_DIR_TEMPLATE["metadata"].format(
+        asset_type=asset_type, asset_name=asset_name, department=department
+    ))
+
+
+class MetadataCache:
+    """
+    The lookups a Maya session needs about publishes, answered from memory.
+
+    Latest versions go through an AssetResolver, history tails are cached
+    per metadata folder and revalidated against its history signature, and
+    listings come from the project catalog, rescanned at most every
+    CATALOG_REFRESH_INTERVAL seconds. invalidate() is the publish event: it
+    drops the resolver entry and tail and reindexes that folder right away.
+
+    Runs inside MetadataService for all sessions of a workstation, and in
+    process when no service is running (see MetadataClient).
+    """
+
+    def __init__(self, project_root: str, catalog: Optional[catalog_module.PublishCatalog] = None):
+        self.project_root = project_root
+        self.resolver = asset_resolver_module.AssetResolver(project_root)
+        self.catalog = catalog or catalog_module.PublishCatalog.for_project(project_root)
+        self._tails = {}
+        self._catalog_refreshed = 0.0
+        self._lock = threading.Lock()
+
+    def latest(self, asset_type, asset_name, department, version=asset_resolver_module.LATEST) -> Optional[dict]:
+        ref = asset_resolver_module.AssetRef(asset_type, asset_name, department, version)
+        return self.resolver.resolve_record(ref)
+
+    def history_tail(self, asset_type, asset_name, department, count=10) -> List[dict]:
+        metadata_dir = metadata_dir_for(self.project_root, asset_type, asset_name, department)
+        signature = asset_resolver_module.history_signature(metadata_dir)
+        with self._lock:
+            cached = self._tails.get(metadata_dir)
+        if cached is None or cached[0] != signature or (len(cached[1]) < count and cached[2]):
+            entries = json_utils_module.tail_publish_history(metadata_dir, METADATA_FILE, max(count, MAX_TAIL))
+            # A full tail means older records may exist beyond it
+            cached = (signature, entries, len(entries) >= max(count, MAX_TAIL))
+            with self._lock:
+                self._tails[metadata_dir] = cached
+        return cached[1][-count:] if count > 0 else []
+
+    def _refresh_catalog(self, force=False):
+        with self._lock:
+            due = force or time.monotonic() - self._catalog_refreshed >= CATALOG_REFRESH_INTERVAL
+            if due:
+                self._catalog_refreshed = time.monotonic()
+        if due:
+            self.catalog.refresh()
+
+    def list_assets(self, asset_type=None, refresh=False) -> List[dict]:
+        self._refresh_catalog(refresh)
+        return self.catalog.list_assets(asset_type)
+
+    def latest_versions(self, asset_type=None, department=None, refresh=False) -> List[dict]:
+        self._refresh_catalog(refresh)
+        return self.catalog.latest_versions(asset_type, department)
+
+    def invalidate(self, metadata_dir: Optional[str] = None, reindex: bool = True) -> bool:
+        """
+        Drops everything cached for one metadata folder after a publish, or
+        everything if metadata_dir is None.
+
+        Args:
+            reindex (bool): Also reindex the folder in the catalog; False when
+                the caller (the PublishWatcher) already did.
+        """
+        if metadata_dir is None:
+            self.resolver.invalidate()
+            with self._lock:
+                self._tails.clear()
+                self._catalog_refreshed = 0.0
+            return True
+
+        self.resolver.invalidate(metadata_dir=metadata_dir)
+        key = os.path.normcase(os.path.abspath(metadata_dir))
+        with self._lock:
+            for path in [path for path in self._tails if os.path.normcase(os.path.abspath(path)) == key]:
+                del self._tails[path]
+        return self.catalog.refresh_metadata_dir(metadata_dir) if reindex else True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            tails = len(self._tails)
+        return dict(self.resolver.cache_info(), tails=tails)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    One JSON request per line in, one JSON response per line out.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                response = {"ok": True, "result": self.server.service.dispatch(request)}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = False
+
+
+class MetadataService:
+    """
+    Local process serving one project's metadata lookups to every Maya and
+    mayapy session of the workstation, so publish/ is listed and parsed
+    over the network once per machine instead of once per session.
+
+    Listens on 127.0.0.1 on a free port and announces port, pid and a
+    random token in service_file_path(project_root); requests without the
+    token are refused. Start it with tools/metadata_service.py.
+
+    Operations: ping, latest, history_tail, list_assets, latest_versions,
+    invalidate (the publish event), stats, shutdown.
+
+    With watch=True a PublishWatcher keeps the cache current with publishes
+    from other machines and changes made outside the tool.
+    """
+
+    OPERATIONS = ("ping", "latest", "history_tail", "list_assets", "latest_versions", "invalidate", "stats")
+
+    def __init__(self, project_root: str, port: int = 0, watch: bool = True):
+        self.project_root = project_root
+        self.watch = watch
+        self.cache = MetadataCache(project_root)
+        self.token = uuid.uuid4().hex
+        self.service_file = service_file_path(project_root)
+        self.started = time.time()
+        self.requests = 0
+        self._server = _Server((HOST, port), _RequestHandler, bind_and_activate=True)
+        self._server.service = self
+        self.port = self._server.server_address[1]
+
+    def dispatch(self, request: dict):
+        if request.get("token") != self.token:
+            raise PermissionError("Invalid service token.")
+        operation = request.get("op")
+        args = request.get("args") or {}
+        self.requests += 1
+
+        if operation == "shutdown":
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return True
+        if operation == "ping":
+            return {"pid": os.getpid(), "project_root": self.project_root}
+        if operation == "stats":
+            return dict(self.cache.stats(), requests=self.requests, uptime=round(time.time() - self.started, 1))
+        if operation not in self.OPERATIONS:
+            raise ValueError(f"Unknown operation '{operation}'.")
+        return getattr(self.cache, operation)(**args)
+
+    def _announce(self):
+        os.makedirs(os.path.dirname(self.service_file), exist_ok=True)
+        temp_path = f"{self.service_file}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"host": HOST, "port": self.port, "pid": os.getpid(), "token": self.token,
+                       "project_root": self.project_root}, f, indent=4)
+        os.replace(temp_path, self.service_file)
+
+    def _withdraw(self):
+        try:
+            with open(self.service_file) as f:
+                if json.load(f).get("token") == self.token:
+                    os.remove(self.service_file)
+        except (OSError, ValueError):
+            pass
+
+    def serve_forever(self) -> None:
+        """
+        Serves until shutdown is requested, then removes the service file.
+        """
+        self._announce()
+        logging.info(f"[MetadataService] Serving '{self.project_root}' on {HOST}:{self.port}")
+        watcher = publish_watcher_module.PublishWatcher.for_project(self.project_root) if self.watch else None
+        if watcher is not None:
+            watcher.subscribe(self._on_changes)
+        try:
+            self._server.serve_forever()
+        finally:
+            if watcher is not None:
+                watcher.unsubscribe(self._on_changes)
+            self._withdraw()
+            self._server.server_close()
+            self.cache.catalog.close()
+
+    def _on_changes(self, changes):
+        for change in changes:
+            if "rescan" in change["kinds"]:
+                self.cache.invalidate()
+            else:
+                self.cache.invalidate(change["metadata_dir"], reindex=False)
+
+    def shutdown(self) -> None:
+        self._server.shutdown()
+
+
+class MetadataClient:
+    """
+    Session side of the metadata service.
+
+    Every call goes to the local MetadataService when one is announced for
+    the project and falls back to an in-process MetadataCache (direct I/O)
+    when it is not, so callers never need to know whether it runs. An
+    unreachable service is not tried again for RETRY_INTERVAL seconds.
+
+    Example:
+        client = MetadataClient.for_project("E:/grow")
+        client.latest("character", "hero", "rig")
+        client.history_tail("prop", "tree", "mod", count=5)
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, project_root: str):
+        self.project_root = project_root
+        self._socket = None
+        self._reader = None
+        self._token = None
+        self._retry_at = 0.0
+        self._local = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "MetadataClient":
+        """
+        Returns the shared client for a project root.
+        """
+        key = os.path.normcase(os.path.abspath(project_root))
+        with cls._instances_lock:
+            client = cls._instances.get(key)
+            if client is None:
+                client = cls._instances[key] = cls(project_root)
+            return client
+
+    def _connect(self):
+        try:
+            with open(service_file_path(self.project_root)) as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            return False
+        try:
+            sock = socket.create_connection((info["host"], info["port"]), timeout=CONNECT_TIMEOUT)
+        except OSError:
+            return False
+        sock.settimeout(REQUEST_TIMEOUT)
+        self._socket, self._reader, self._token = sock, sock.makefile("rb"), info["token"]
+        return True
+
+    def _disconnect(self):
+        for handle in (self._reader, self._socket):
+            try:
+                if handle is not None:
+                    handle.close()
+            except OSError:
+                pass
+        self._socket = self._reader = None
+
+    def _remote(self, operation, args):
+        """
+        Returns (True, result) from the service, or (False, None) if it is unavailable.
+        """
+        with self._lock:
+            if self._socket is None:
+                if time.monotonic() < self._retry_at or not self._connect():
+                    self._retry_at = time.monotonic() + RETRY_INTERVAL
+                    return False, None
+            try:
+                request = {"op": operation, "args": args, "token": self._token}
+                self._socket.sendall((json.dumps(request) + "\n").encode("utf-8"))
+                line = self._reader.readline()
+                if not line:
+                    raise ConnectionError("Service closed the connection.")
+                response = json.loads(line)
+            except (OSError, ValueError) as e:
+                logging.warning(f"[MetadataClient] Metadata service unavailable, using direct I/O: {e}")
+                self._disconnect()
+                self._retry_at = time.monotonic() + RETRY_INTERVAL
+                return False, None
+        if not response.get("ok"):
+            logging.error(f"[MetadataClient] Service failed '{operation}': {response.get('error')}")
+            return True, None
+        return True, response.get("result")
+
+    def _local_cache(self):
+        with self._lock:
+            if self._local is None:
+                self._local = MetadataCache(self.project_root)
+            return self._local
+
+    def _call(self, operation, **args):
+        served, result = self._remote(operation, args)
+        if served:
+            return result
+        return getattr(self._local_cache(), operation)(**args)
+
+    @property
+    def connected(self) -> bool:
+        return self._socket is not None
+
+    def ping(self) -> Optional[dict]:
+        """
+        Returns pid and project root of the running service, or None.
+        """
+        served, info = self._remote("ping", {})
+        return info if served else None
+
+    def stop_service(self) -> bool:
+        served, _ = self._remote("shutdown", {})
+        self.close()
+        return served
+
+    def latest(self, asset_type: Optional[str], asset_name: str, department: str,
+               version: str = asset_resolver_module.LATEST) -> Optional[dict]:
+        """
+        Returns the history record of the latest (or a pinned) version with
+        'stored_path' added, or None.
+        """
+        return self._call("latest", asset_type=asset_type, asset_name=asset_name,
+                          department=department, version=version)
+
+    def history_tail(self, asset_type: str, asset_name: str, department: str, count: int = 10) -> List[dict]:
+        """
+        Returns the latest `count` history records, oldest first.
+        """
+        return self._call("history_tail", asset_type=asset_type, asset_name=asset_name,
+                          department=department, count=count) or []
+
+    def list_assets(self, asset_type: Optional[str] = None, refresh: bool = False) -> List[dict]:
+        """
+        Returns asset_type, asset_name and department of every published folder.
+
+        Args:
+            refresh (bool): Rescan the publish tree now instead of at most
+                every CATALOG_REFRESH_INTERVAL seconds.
+        """
+        return self._call("list_assets", asset_type=asset_type, refresh=refresh) or []
+
+    def latest_versions(self, asset_type: Optional[str] = None, department: Optional[str] = None,
+                        refresh: bool = False) -> List[dict]:
+        """
+        Returns the newest catalog row of every asset/department (see PublishCatalog.latest_versions).
+        """
+        return self._call("latest_versions", asset_type=asset_type, department=department, refresh=refresh) or []
+
+    def notify_published(self, metadata_dir: str) -> None:
+        """
+        Tells the service, or the in-process cache if this session has one,
+        that a publish wrote to metadata_dir.
+        """
+        served, _ = self._remote("invalidate", {"metadata_dir": metadata_dir})
+        if not served and self._local is not None:
+            self._local.invalidate(metadata_dir)
+
+    def stats(self) -> Dict:
+        return self._call("stats")
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+
+def notify_published(project_root: str, metadata_dir: str) -> None:
+    """
+    Publish event for the metadata service: drops the cached state of
+    metadata_dir in the local service, if one runs, and in this session.
+    Never raises; a missed event only delays updates until the history
+    signature is checked again.
+    """
+    try:
+        MetadataClient.for_project(project_root).notify_published(metadata_dir)
+    except Exception as e:
+        logging.warning(f"[MetadataClient] Could not send the publish event for '{metadata_dir}': {e}")
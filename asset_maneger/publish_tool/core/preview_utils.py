@@ -0,0 +1,99 @@
+# File: asset_manager/publish_tool/core/preview_utils.py
+
+import logging
+import os
+import shutil
+import threading
+from typing import Any, Optional
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+
+class PreviewEntry:
+    """
+    A captured preview: an in-memory image, a file on disk, or both.
+    """
+
+    def __init__(self, key, image=None, path=None):
+        self.key = key
+        self.image = image
+        self.path = path
+
+
+class PreviewCache:
+    """
+    Remembers the last viewport capture together with the scene state it was
+    taken in, so a publish can reuse it instead of playblasting again.
+
+    The key is opaque to the cache; AssetSceneUtils.get_viewport_state_key
+    builds one from the undo queue head, current frame and camera. A None key
+    never matches, which disables reuse when the state cannot be trusted.
+
+    Example:
+        cache.store(key, image=qimage)
+        entry = cache.lookup(key)
+    """
+
+    def __init__(self):
+        self._entry = None
+        self._lock = threading.Lock()
+
+    def store(self, key, image: Any = None, path: Optional[str] = None) -> None:
+        with self._lock:
+            self._entry = PreviewEntry(key, image, path) if key is not None else None
+
+    def lookup(self, key) -> Optional[PreviewEntry]:
+        """
+        Returns the cached capture if it was taken in the given state, otherwise None.
+        """
+        with self._lock:
+            entry = self._entry
+        if key is None or entry is None or entry.key != key:
+            return None
+        if entry.image is None and not (entry.path and os.path.isfile(entry.path)):
+            return None
+        return entry
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._entry is None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = None
+
+
+@trace_utils_module.traced("preview_utils.promote_preview")
+def promote_preview(entry: PreviewEntry, target_path: str, quality: int = 90) -> bool:
+    """
+    Writes a cached preview to its publish location.
+
+    In-memory images are encoded straight to target_path (safe to call off
+    the main thread for QImage); file captures are copied.
+
+    Args:
+        entry (PreviewEntry): Cached capture.
+        target_path (str): Final preview image path.
+        quality (int): JPEG quality for in-memory images.
+
+    Returns:
+        bool: True if the preview was written, False otherwise.
+    """
+    try:
+        target_dir = os.path.dirname(target_path)
+        if target_dir and not os.path.exists(target_dir):
+            os.makedirs(target_dir)
+
+        if entry.image is not None:
+            if entry.image.save(target_path, "JPG", quality):
+                return True
+            logging.warning(f"[PreviewUtils] Encoding preview to '{target_path}' failed, copying capture file instead.")
+
+        if entry.path:
+            shutil.copyfile(entry.path, target_path)
+            return True
+
+        return False
+    except Exception as e:
+        logging.error(f"[PreviewUtils] Failed to write preview '{target_path}': {e}")
+        return False
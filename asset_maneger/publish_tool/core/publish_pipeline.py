@@ -0,0 +1,211 @@
+# File: asset_manager/publish_tool/core/publish_pipeline.py
+
+import contextlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+
+class PublishCancelled(Exception):
+    """Raised inside a pipeline when the publish was cancelled."""
+
+
+class PublishContext(dict):
+    """
+    Shared state handed to every publish step.
+
+    Steps read and write plain keys and may register abort handlers, which
+    run in reverse order if a later step fails or the publish is cancelled
+    (e.g. to release a reserved version).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(PublishContext, self).__init__(*args, **kwargs)
+        self._abort_handlers = []
+
+    def on_abort(self, handler: Callable[[], None]) -> None:
+        self._abort_handlers.append(handler)
+
+    def run_abort_handlers(self) -> None:
+        while self._abort_handlers:
+            handler = self._abort_handlers.pop()
+            try:
+                handler()
+            except Exception as e:
+                logging.error(f"[PublishPipeline] Abort handler failed: {e}")
+
+
+class PublishStep:
+    """
+    One unit of work in a publish.
+
+    Args:
+        name (str): Label reported in progress callbacks.
+        func (callable): Called with the PublishContext.
+        main_thread (bool): True for steps that call into Maya (scene save,
+            playblast, node edits); these are handed to the pipeline's main
+            thread dispatcher instead of the worker pool.
+    """
+
+    def __init__(self, name: str, func: Callable[[PublishContext], None], main_thread: bool = False):
+        self.name = name
+        self.func = func
+        self.main_thread = main_thread
+
+    def __repr__(self):
+        return f"PublishStep({self.name!r}, main_thread={self.main_thread})"
+
+
+class PublishPipeline:
+    """
+    Runs publish steps in order, moving between the main thread and a worker pool.
+
+    Steps that don't touch Maya run on a shared thread pool so slow storage
+    never blocks the UI; steps flagged main_thread are passed to
+    `dispatch_main`, which must run the given callable on Maya's main thread
+    (the UI uses a queued Qt signal). Without a dispatcher they run inline.
+
+    Progress is reported through optional callbacks, which may be invoked
+    from any thread:
+        on_step_started(index, total, name)
+        on_step_finished(index, total, name, seconds)
+        on_finished(context)
+        on_failed(step_name, error)
+        on_cancelled()
+
+    With a trace (see core/trace_utils.py), every step runs inside
+    trace.step() and the trace is finished with the pipeline's outcome.
+    """
+
+    _executor = None
+    _executor_lock = threading.Lock()
+    MAX_WORKERS = 4
+
+    def __init__(self, steps: List[PublishStep], dispatch_main: Optional[Callable] = None, trace=None):
+        self.steps = list(steps)
+        self.dispatch_main = dispatch_main
+        self.trace = trace
+        self.on_step_started = None
+        self.on_step_finished = None
+        self.on_finished = None
+        self.on_failed = None
+        self.on_cancelled = None
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self.succeeded = False
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="publish")
+            return cls._executor
+
+    def cancel(self) -> None:
+        """
+        Requests cancellation. The step currently running completes; no further step starts.
+        """
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._done_event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done_event.wait(timeout)
+
+    def start(self, context: PublishContext) -> None:
+        """
+        Starts the pipeline asynchronously and returns immediately.
+        """
+        self._schedule(0, context)
+
+    def run(self, context: PublishContext) -> bool:
+        """
+        Runs every step synchronously on the calling thread (headless use).
+
+        Returns:
+            bool: True if all steps completed.
+        """
+        for index in range(len(self.steps)):
+            if not self._execute(index, context):
+                return False
+        return self.succeeded
+
+    def _finish_trace(self, status):
+        if self.trace is not None:
+            self.trace.finish(status)
+
+    def _notify(self, callback_name, *args):
+        callback = getattr(self, callback_name)
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            logging.error(f"[PublishPipeline] {callback_name} callback failed: {e}")
+
+    def _fail(self, context: PublishContext, step_name: str, error: Exception) -> None:
+        context.run_abort_handlers()
+        self._finish_trace("failed")
+        self._done_event.set()
+        self._notify("on_failed", step_name, error)
+
+    def _schedule(self, index: int, context: PublishContext) -> None:
+        if index >= len(self.steps):
+            return
+        if self.steps[index].main_thread:
+            if self.dispatch_main:
+                try:
+                    self.dispatch_main(lambda: self._execute(index, context, chain=True))
+                except Exception as e:
+                    # e.g. the dispatcher's Qt object was deleted; the step would never run
+                    logging.error(f"[PublishPipeline] Could not dispatch step '{self.steps[index].name}': {e}")
+                    self._fail(context, self.steps[index].name, e)
+            else:
+                self._execute(index, context, chain=True)
+        else:
+            self.get_executor().submit(self._execute, index, context, True)
+
+    def _execute(self, index: int, context: PublishContext, chain: bool = False) -> bool:
+        step = self.steps[index]
+        total = len(self.steps)
+
+        if self.cancelled:
+            context.run_abort_handlers()
+            self._finish_trace("cancelled")
+            self._done_event.set()
+            self._notify("on_cancelled")
+            return False
+
+        self._notify("on_step_started", index, total, step.name)
+        start = time.perf_counter()
+        try:
+            with self.trace.step(step.name) if self.trace is not None else contextlib.nullcontext():
+                step.func(context)
+        except PublishCancelled:
+            context.run_abort_handlers()
+            self._finish_trace("cancelled")
+            self._done_event.set()
+            self._notify("on_cancelled")
+            return False
+        except Exception as e:
+            logging.error(f"[PublishPipeline] Step '{step.name}' failed: {e}")
+            self._fail(context, step.name, e)
+            return False
+        self._notify("on_step_finished", index, total, step.name, time.perf_counter() - start)
+
+        if index == total - 1:
+            self.succeeded = True
+            self._finish_trace("succeeded")
+            self._done_event.set()
+            self._notify("on_finished", context)
+        elif chain:
+            self._schedule(index + 1, context)
+        return True
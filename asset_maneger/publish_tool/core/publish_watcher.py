@@ -0,0 +1,521 @@
+# File: asset_manager/publish_tool/core/publish_watcher.py
+
+import ctypes
+import ctypes.util
+import datetime
+import getpass
+import json
+import logging
+import os
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+import publish_tool.core.asset_resolver as asset_resolver_module
+import publish_tool.core.catalog as catalog_module
+import publish_tool.core.json_utils as json_utils_module
+import publish_tool.core.version_utils as version_utils_module
+from publish_tool.core.file_utils import PUBLISH_DIR_TEMPLATE
+
+# Project-wide append-only log of publishes, read by the polling backend
+EVENTS_FILE = ".publish_events.jsonl"
+METADATA_FILE = "metadata.json"
+
+POLL_INTERVAL = 2.0  # seconds between journal checks (polling) or wake-ups (inotify)
+COALESCE_DELAY = 0.5  # seconds without new events before a burst is flushed
+MAX_COALESCE_DELAY = 5.0  # a continuous burst is still flushed this often
+FULL_SCAN_INTERVAL = 600.0  # seconds between polling safety scans for changes made outside the tool
+
+# File systems where inotify does not see changes made by other machines
+NETWORK_FILESYSTEMS = ("cifs", "smb3", "smbfs", "nfs", "nfs4", "afs", "9p", "fuse.sshfs", "fuse.rclone")
+
+# Marker returned by a backend when events were lost and everything must be rescanned
+RESCAN = "<rescan>"
+
+# Files written next to publishes that never change what is published
+_IGNORED_SUFFIXES = (version_utils_module.CLAIM_EXT, ".tmp", ".part", ".lock")
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_EVENT = struct.Struct("iIII")
+
+
+def events_file_path(project_root: str) -> str:
+    return os.path.join(project_root, "publish", EVENTS_FILE)
+
+
+def record_publish_event(project_root: str, metadata_dir: str, entry: Optional[dict] = None) -> bool:
+    """
+    Appends a publish to the project's event journal, so polling watchers on
+    other machines pick it up without scanning the publish tree.
+
+    Paths are stored relative to publish/, which is mounted differently on
+    each workstation. Never raises: the journal only speeds up watchers.
+
+    Args:
+        metadata_dir (str): '<...>/<asset_type>/<asset_name>/<department>/data/metadata'
+        entry (dict or None): The history entry that was written.
+
+    Returns:
+        bool: True if the event was recorded.
+    """
+    entry = entry or {}
+    department_dir = os.path.dirname(os.path.dirname(os.path.normpath(metadata_dir)))
+    asset_dir = os.path.dirname(department_dir)
+    event = {
+        "event": "publish",
+        "date": datetime.datetime.now().strftime(json_utils_module.DATE_FORMAT),
+        "asset_type": os.path.basename(os.path.dirname(asset_dir)),
+        "asset_name": os.path.basename(asset_dir),
+        "department": os.path.basename(department_dir),
+        "version": entry.get("version"),
+        "file_name": os.path.basename(entry.get("file_path") or ""),
+        "host": socket.gethostname(),
+        "user": getpass.getuser()
+    }
+    try:
+        json_utils_module.append_json_line(events_file_path(project_root), event)
+        return True
+    except Exception as e:
+        logging.warning(f"[PublishWatcher] Could not record the publish event: {e}")
+        return False
+
+
+def filesystem_type(path: str) -> Optional[str]:
+    """
+    Returns the file system type of the mount holding path (Linux only), e.g. 'ext4' or 'cifs'.
+    """
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split()[1:3] for line in f if len(line.split()) > 2]
+    except OSError:
+        return None
+    path = os.path.realpath(path)
+    best, best_type = "", None
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        inside = path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+        if inside and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type
+
+
+def iter_metadata_dirs(publish_root):
+    """
+    Yields every '<asset_type>/<asset_name>/<department>/data/metadata' folder under publish_root.
+    """
+    def subdirs(path):
+        try:
+            with os.scandir(path) as entries:
+                return [entry.path for entry in entries if entry.is_dir() and not entry.name.startswith(".")]
+        except OSError:
+            return []
+
+    for type_dir in subdirs(publish_root):
+        for asset_dir in subdirs(type_dir):
+            for department_dir in subdirs(asset_dir):
+                metadata_dir = os.path.join(department_dir, "data", "metadata")
+                if os.path.isdir(metadata_dir):
+                    yield metadata_dir
+
+
+class InotifyBackend:
+    """
+    Linux inotify watches on every folder of the publish tree.
+
+    Only sees changes made through the local kernel, so it is used for local
+    disks; folders created later are watched as they appear.
+    """
+    name = "inotify"
+    MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_CREATE | _IN_DELETE
+
+    def __init__(self, publish_root):
+        self.publish_root = publish_root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._watches = {}
+        try:
+            self._watch_tree(publish_root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            # ENOSPC: fs.inotify.max_user_watches is too low for this project
+            raise OSError(error, os.strerror(error), path)
+        self._watches[wd] = path
+
+    def _watch_tree(self, root):
+        """
+        Watches root and every folder below it.
+
+        Returns:
+            list: Files already inside, for folders that appeared after watching began.
+        """
+        files = []
+        for folder, dirs, names in os.walk(root):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            self._watch(folder)
+            files.extend(os.path.join(folder, name) for name in names)
+        return files
+
+    def read(self, timeout, stop_event) -> List[str]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        paths = []
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _IN_EVENT.unpack_from(data, offset)
+                name = data[offset + _IN_EVENT.size:offset + _IN_EVENT.size + length].rstrip(b"\0")
+                offset += _IN_EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    paths.append(RESCAN)
+                    continue
+                if mask & _IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+                folder = self._watches.get(wd)
+                if folder is None:
+                    continue
+                path = os.path.join(folder, os.fsdecode(name))
+                if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    try:
+                        paths.extend(self._watch_tree(path))
+                    except OSError as e:
+                        logging.warning(f"[PublishWatcher] Could not watch '{path}': {e}")
+                        paths.append(RESCAN)
+                paths.append(path)
+        return paths
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingBackend:
+    """
+    Polls the project's publish event journal (see record_publish_event).
+
+    Each poll is one stat of the journal plus a read of the bytes appended
+    since the last poll, whatever the size of the project. Changes made
+    outside the tool (copies, manual edits, compaction) are caught by a
+    safety scan of every history signature every full_scan_interval seconds.
+    """
+    name = "polling"
+
+    def __init__(self, publish_root, interval=POLL_INTERVAL, full_scan_interval=FULL_SCAN_INTERVAL):
+        self.publish_root = publish_root
+        self.interval = interval
+        self.full_scan_interval = full_scan_interval
+        self.journal_path = os.path.join(publish_root, EVENTS_FILE)
+        try:
+            self._offset = os.stat(self.journal_path).st_size
+        except OSError:
+            self._offset = 0
+        self._signatures = None
+        self._next_full_scan = time.monotonic() if full_scan_interval else None
+
+    def _read_journal(self):
+        try:
+            size = os.stat(self.journal_path).st_size
+        except OSError:
+            return []
+        if size < self._offset:
+            # Journal was truncated or replaced: read it from the start
+            self._offset = 0
+        if size == self._offset:
+            return []
+        with open(self.journal_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+
+        paths = []
+        for line in data[:end].split(b"\n"):
+            try:
+                event = json.loads(line) if line.strip() else None
+            except ValueError:
+                continue
+            if not event or not event.get("asset_name"):
+                continue
+            fields = dict(asset_type=event["asset_type"], asset_name=event["asset_name"],
+                          department=event["department"], format_type="ma")
+            # Templates start with 'publish/'
+            metadata_dir = PUBLISH_DIR_TEMPLATE["metadata"].format(**fields).split("/", 1)[1]
+            paths.append(os.path.join(self.publish_root, metadata_dir,
+                                      json_utils_module.get_history_file_name(METADATA_FILE)))
+            if event.get("file_name"):
+                file_dir = PUBLISH_DIR_TEMPLATE["file"].format(**fields).split("/", 1)[1]
+                paths.append(os.path.join(self.publish_root, file_dir, event["file_name"]))
+        return paths
+
+    def _full_scan(self):
+        """
+        Returns the history logs whose signature changed since the last scan
+        (nothing on the first scan, which records the baseline).
+        """
+        signatures = {}
+        for metadata_dir in iter_metadata_dirs(self.publish_root):
+            signatures[os.path.normpath(metadata_dir)] = asset_resolver_module.history_signature(metadata_dir)
+        previous, self._signatures = self._signatures, signatures
+        if previous is None:
+            return []
+        return [
+            os.path.join(metadata_dir, json_utils_module.get_history_file_name(METADATA_FILE))
+            for metadata_dir, signature in signatures.items()
+            if previous.get(metadata_dir) != signature
+        ]
+
+    def read(self, timeout, stop_event) -> List[str]:
+        if stop_event.wait(min(timeout, self.interval)):
+            return []
+        paths = self._read_journal()
+        if self._signatures is not None:
+            # Reported already: keep the safety scan from reporting them again
+            for metadata_dir in {os.path.normpath(os.path.dirname(path)) for path in paths}:
+                if os.path.basename(metadata_dir) == "metadata":
+                    self._signatures[metadata_dir] = asset_resolver_module.history_signature(metadata_dir)
+        if self._next_full_scan is not None and time.monotonic() >= self._next_full_scan:
+            paths.extend(self._full_scan())
+            self._next_full_scan = time.monotonic() + self.full_scan_interval
+        return paths
+
+    def close(self):
+        pass
+
+
+class PublishWatcher:
+    """
+    Watches a project's publish tree and pushes incremental updates.
+
+    Uses inotify on local Linux disks and polls the publish event journal
+    everywhere else (network shares, Windows). Changes are classified with
+    the DirectoryUtils layout,
+
+        publish/<asset_type>/<asset_name>/<department>/<format>/...          -> 'version'
+        publish/<asset_type>/<asset_name>/<department>/data/metadata/...     -> 'history'
+        publish/<asset_type>/<asset_name>/<department>/data/preview_image/.. -> 'preview'
+
+    and coalesced per asset/department until COALESCE_DELAY passes without
+    new events. Each flushed asset/department is reindexed in the catalog
+    and dropped from the asset resolver; then every subscriber is called on
+    the watcher thread with a list of change dicts:
+
+        {"kinds": ["history", "version"], "asset_type", "asset_name",
+         "department", "metadata_dir", "paths": [...], "row": newest catalog row or None}
+
+    A change with kinds ["rescan"] means events were lost and views should reload.
+
+    Example:
+        watcher = PublishWatcher.for_project("E:/grow")
+        watcher.subscribe(lambda changes: print(changes))
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, project_root: str, backend: str = "auto", coalesce_delay: float = COALESCE_DELAY,
+                 poll_interval: float = POLL_INTERVAL):
+        self.project_root = project_root
+        self.publish_root = os.path.join(project_root, "publish")
+        self.backend_choice = backend
+        self.coalesce_delay = coalesce_delay
+        self.poll_interval = poll_interval
+        self.backend = None
+        self.stats = {"events": 0, "flushes": 0, "changes": 0}
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "PublishWatcher":
+        """
+        Returns the shared watcher for a project root.
+        """
+        key = os.path.normcase(os.path.abspath(project_root))
+        with cls._instances_lock:
+            watcher = cls._instances.get(key)
+            if watcher is None:
+                watcher = cls._instances[key] = cls(project_root)
+            return watcher
+
+    # -- subscribers -----------------------------------------------------
+
+    def subscribe(self, callback: Callable[[List[dict]], None]) -> None:
+        """
+        Adds a callback for flushed changes and starts the watcher if needed.
+        Callbacks run on the watcher thread; Qt code should emit a signal.
+        """
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+        self.start()
+
+    def unsubscribe(self, callback: Callable[[List[dict]], None]) -> None:
+        """
+        Removes a callback; the watcher stops with its last subscriber.
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+            idle = not self._subscribers
+        if idle:
+            self.stop()
+
+    # -- lifecycle -------------------------------------------------------
+
+    def _create_backend(self):
+        choice = self.backend_choice
+        if choice == "auto":
+            fs_type = filesystem_type(self.publish_root) if sys.platform.startswith("linux") else None
+            local = fs_type is not None and fs_type not in NETWORK_FILESYSTEMS
+            choice = "inotify" if local and os.path.isdir(self.publish_root) else "polling"
+        if choice == "inotify":
+            try:
+                return InotifyBackend(self.publish_root)
+            except (OSError, AttributeError) as e:
+                logging.warning(f"[PublishWatcher] inotify unavailable, polling instead: {e}")
+        return PollingBackend(self.publish_root, interval=self.poll_interval)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="PublishWatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        try:
+            self.backend = self._create_backend()
+        except Exception as e:
+            logging.error(f"[PublishWatcher] Could not start watching '{self.publish_root}': {e}")
+            return
+        logging.info(f"[PublishWatcher] Watching '{self.publish_root}' ({self.backend.name})")
+
+        pending = {}
+        first = last = 0.0
+        try:
+            while not self._stop.is_set():
+                paths = self.backend.read(self.coalesce_delay if pending else self.poll_interval, self._stop)
+                now = time.monotonic()
+                for path in paths:
+                    self.stats["events"] += 1
+                    if self._collect(pending, path):
+                        first = first or now
+                        last = now
+                if pending and (now - last >= self.coalesce_delay or now - first >= MAX_COALESCE_DELAY):
+                    self._flush(pending)
+                    pending = {}
+                    first = last = 0.0
+        except Exception as e:
+            logging.error(f"[PublishWatcher] Watcher for '{self.publish_root}' stopped: {e}")
+        finally:
+            self.backend.close()
+
+    # -- events ----------------------------------------------------------
+
+    def classify(self, path: str):
+        """
+        Returns ((asset_type, asset_name, department), kind) for a path in
+        the publish tree, or None for paths that do not affect a publish.
+        """
+        if path == RESCAN:
+            return (None, None, None), "rescan"
+        parts = os.path.relpath(path, self.publish_root).replace("\\", "/").split("/")
+        name = parts[-1]
+        if len(parts) < 5 or parts[0] == ".." or name.startswith(".") or name.endswith(_IGNORED_SUFFIXES):
+            return None
+        key = tuple(parts[:3])
+        if parts[3] == "data":
+            kind = {"metadata": "history", "preview_image": "preview"}.get(parts[4])
+            if kind is None or (kind == "history" and len(parts) != 6):
+                return None
+            return key, kind
+        return key, "version"
+
+    def _collect(self, pending, path) -> bool:
+        classified = self.classify(path)
+        if classified is None:
+            return False
+        key, kind = classified
+        item = pending.setdefault(key, {"kinds": set(), "paths": set()})
+        item["kinds"].add(kind)
+        if path != RESCAN:
+            item["paths"].add(path)
+        return True
+
+    def _flush(self, pending):
+        catalog = catalog_module.PublishCatalog.for_project(self.project_root)
+        changes = []
+        for (asset_type, asset_name, department), item in pending.items():
+            if "rescan" in item["kinds"]:
+                catalog.refresh()
+                asset_resolver_module.AssetResolver.for_project(self.project_root).invalidate()
+                version_utils_module.VersionIndex.invalidate()
+                changes.append({"kinds": ["rescan"]})
+                continue
+
+            fields = dict(asset_type=asset_type, asset_name=asset_name, department=department, format_type="ma")
+            metadata_dir = os.path.join(self.project_root, PUBLISH_DIR_TEMPLATE["metadata"].format(**fields))
+            if "history" in item["kinds"]:
+                catalog.refresh_metadata_dir(metadata_dir)
+            if "version" in item["kinds"]:
+                for folder in {os.path.dirname(path) for path in item["paths"]}:
+                    version_utils_module.VersionIndex.invalidate(folder)
+            asset_resolver_module.AssetResolver.forget_metadata_dir(self.project_root, metadata_dir)
+            changes.append({
+                "kinds": sorted(item["kinds"]),
+                "asset_type": asset_type,
+                "asset_name": asset_name,
+                "department": department,
+                "metadata_dir": metadata_dir,
+                "paths": sorted(item["paths"]),
+                "row": catalog.get_latest(asset_name, department, asset_type)
+            })
+
+        self.stats["flushes"] += 1
+        self.stats["changes"] += len(changes)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(changes)
+            except Exception as e:
+                logging.error(f"[PublishWatcher] Subscriber failed: {e}")
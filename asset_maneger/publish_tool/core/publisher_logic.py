@@ -0,0 +1,786 @@
+# File: asset_manager/publish_tool/core/publisher_logic.py
+
+import datetime
+import logging
+import os
+import shutil
+import uuid
+
+import publish_tool.core.asset_scene_utils as asset_scene_utils_module
+import publish_tool.core.user_utils as user_utils_module
+import publish_tool.core.file_utils as file_utils_module
+import publish_tool.core.version_utils as version_utils_module
+import publish_tool.core.json_utils as json_utils_module
+import publish_tool.core.publish_pipeline as publish_pipeline_module
+import publish_tool.core.preview_utils as preview_utils_module
+import publish_tool.core.catalog as catalog_module
+import publish_tool.core.content_store as content_store_module
+import publish_tool.core.delta_store as delta_store_module
+import publish_tool.core.compression_utils as compression_utils_module
+import publish_tool.core.upload_queue as upload_queue_module
+import publish_tool.core.dependency_utils as dependency_utils_module
+import publish_tool.core.validation as validation_module
+import publish_tool.core.thumbnail_utils as thumbnail_utils_module
+import publish_tool.core.asset_resolver as asset_resolver_module
+import publish_tool.core.metadata_service as metadata_service_module
+import publish_tool.core.publish_watcher as publish_watcher_module
+import publish_tool.core.trace_utils as trace_utils_module
+
+
+# Where the open scene is renamed to after a publish when it has no work file of its own
+WORK_SCENE_DIR = os.path.join(os.path.expanduser("~"), ".pip_dev", "work_scenes")
+
+# Department names shown in the UI and their internal short codes
+DEPARTMENTS = {
+    "modeling": "mod",
+    "rigging": "rig",
+    "texturing": "tex"
+}
+
+
+def storage_options_from_config(config_data):
+    """
+    Returns the AssetPublisherLogic storage keyword arguments set in project_config.CONFIG_DATA.
+    """
+    return {
+        "use_content_store": bool(config_data.get("use_content_store", False)),
+        "use_delta_chain": bool(config_data.get("use_delta_chain", False)),
+        "delta_keyframe_interval": int(
+            config_data.get("delta_keyframe_interval", delta_store_module.DEFAULT_KEYFRAME_INTERVAL)
+        ),
+        "compression": config_data.get("compression"),
+        "department_compression": dict(config_data.get("department_compression") or {}),
+        "use_local_staging": bool(config_data.get("use_local_staging", False)),
+        "gather_dependencies": bool(config_data.get("gather_dependencies", False)),
+        "validators": dict(config_data.get("validators") or {}),
+        "profile_publish": bool(config_data.get("profile_publish", False))
+    }
+
+
+class AssetPublisherLogic:
+    """
+    Publish logic without any Qt dependency.
+
+    Used by AssetPublisherUI (which adds viewport capture and Qt progress
+    reporting on top) and by headless batch publishing. All scene access
+    goes through AssetSceneUtils' scene adapter, so it also runs against the
+    fake adapter from publish_tool.testing.fake_cmds.
+    """
+
+    def __init__(self, project_root, project_name, load_metadata=True, use_content_store=False,
+                 use_delta_chain=False, delta_keyframe_interval=delta_store_module.DEFAULT_KEYFRAME_INTERVAL,
+                 compression=None, department_compression=None, use_local_staging=False,
+                 gather_dependencies=False, validators=None, profile_publish=False):
+        """
+        Args:
+            project_root (str): Root folder holding the projects, or 'N/A'.
+            project_name (str): Project folder name.
+            load_metadata (bool): False skips the initial scene read, e.g. when
+                the caller loads the metadata itself after the UI is shown.
+            use_content_store (bool): Deduplicate published scenes through the
+                project's ContentStore (see core/content_store.py).
+            use_delta_chain (bool): Store published scenes as keyframes and
+                deltas against the previous version (see core/delta_store.py).
+            delta_keyframe_interval (int): Every n-th version of a delta chain
+                is stored in full.
+            compression (str or None): Compress published scenes, e.g. 'zlib',
+                'lzma:9' or 'bz2' (see core/compression_utils.py).
+            department_compression (dict or None): Department name -> codec
+                spec overriding `compression`; None as a value disables it.
+            use_local_staging (bool): Save to the local staging dir and let the
+                UploadQueue move the scene to the share in the background
+                (see core/upload_queue.py).
+            gather_dependencies (bool): Copy the scene's textures, references
+                and caches into the publish and repath the published scene
+                (see core/dependency_utils.py).
+            validators (dict or None): Validator name or 'module:ClassName' ->
+                'error' or 'warning', run before every publish (see
+                core/validation.py). Empty or None runs no validators.
+            profile_publish (bool): Run publishes under cProfile and tracemalloc
+                and save the profile next to the publish (see core/trace_utils.py).
+        """
+        self.project_root = os.path.join(project_root, project_name) if project_root != "N/A" else "N/A"
+        self.project_name = project_name
+        self.asset_name = "Unnamed"
+        self.asset_type = "Unknown"
+        self.version = "v001"
+        self.creator = "Unknown"
+        self.publish_dir = "N/A"
+        self.preview_image_path = ""
+        self.preview_cache = preview_utils_module.PreviewCache()
+        self.use_content_store = use_content_store
+        self.delta_store = delta_store_module.DeltaStore(delta_keyframe_interval) if use_delta_chain else None
+        self.compression = compression
+        self.department_compression = dict(department_compression or {})
+        self.gather_dependencies = gather_dependencies
+        self.validators = dict(validators or {})
+        # Kept for the session, so repeated publishes only re-check changed nodes
+        self.validation = None
+        self.validation_error = None
+        if self.validators:
+            try:
+                self.validation = validation_module.ValidationRunner(self.validators)
+            except (ValueError, ImportError, AttributeError) as e:
+                # Reported by every publish until the configuration is fixed
+                logging.error(f"[AssetPublisherLogic] Invalid validators configuration: {e}")
+                self.validation_error = str(e)
+        self.profile_publish = profile_publish
+        if self._compression_configured() and (use_content_store or use_delta_chain):
+            # Compressed files would defeat deduplication and delta encoding
+            logging.warning("[AssetPublisherLogic] Compression is ignored while the content store or delta chains are on.")
+        # The content store and delta chains work on the published file in place
+        self.use_local_staging = use_local_staging and not (use_content_store or use_delta_chain)
+        if use_local_staging and not self.use_local_staging:
+            logging.warning("[AssetPublisherLogic] Local staging is ignored while the content store or delta chains are on.")
+
+        # Load initial metadata
+        if load_metadata:
+            self.load_asset_metadata()
+
+    @staticmethod
+    def _cmds():
+        return asset_scene_utils_module.AssetSceneUtils.get_scene_adapter().cmds
+
+    def update_attributes_from_metadata(self, metadata):
+        """Updates logic attributes based on metadata."""
+        self.asset_name = metadata.get("asset_name", "Unnamed")
+        self.asset_type = metadata.get("asset_type", "Unknown")
+        self.version = metadata.get("version", "v001")
+        self.creator = metadata.get("creator_name", "Unknown")
+        self.publish_dir = metadata.get("publish_path", "N/A")
+        if self.project_root != "N/A" and self.asset_name != "Unnamed" and self.asset_type != "Unknown":
+             self.publish_dir = os.path.join(self.project_root, self.asset_type, self.asset_name, "publish").replace("\\", "/")
+
+    def get_display_fields(self):
+        """
+        Returns the values shown in the UI metadata labels.
+        """
+        return {
+            "Asset Name": self.asset_name,
+            "Asset Type": self.asset_type,
+            "Version": self.version,
+            "Artist": self.creator,
+            "Publish Path": self.publish_dir
+        }
+
+    @staticmethod
+    def get_department_name(department_code):
+        """
+        Returns the UI department name for an internal short code, or None.
+        """
+        for name, code in DEPARTMENTS.items():
+            if code == department_code:
+                return name
+        return None
+
+    def _compression_configured(self):
+        specs = [self.compression] + list(self.department_compression.values())
+        return any(spec and str(spec).lower() != "none" for spec in specs)
+
+    def get_compression(self, department_name):
+        """
+        Returns the compression used for a department's publishes.
+
+        Returns:
+            tuple or None: (codec, level), or None if scenes are stored plain.
+
+        Raises:
+            ValueError: If the configured codec spec is invalid.
+        """
+        if self.use_content_store or self.delta_store:
+            return None
+        spec = self.department_compression.get(department_name, self.compression)
+        return compression_utils_module.parse_codec_spec(spec)
+
+    def get_internal_department(self, department_name):
+        """
+        Returns the internal short code for the selected department.
+        """
+        return DEPARTMENTS.get(department_name.lower(), "mod")  # Default to 'mod'
+
+    def playblast_preview(self, image_path):
+        """
+        Playblasts the current frame to image_path. Must run on the main thread.
+        """
+        cmds = self._cmds()
+        with trace_utils_module.span("mc.playblast"):
+            cmds.playblast(
+                completeFilename=image_path,
+                format='image',
+                width=400,
+                height=300,
+                showOrnaments=False,
+                frame=cmds.currentTime(q=True),
+                viewer=False,
+                offScreen=True,
+                percent=100,
+                compression="jpg"
+            )
+        self.preview_image_path = image_path
+
+    def create_pipeline(self, comment, department_name, dispatch_main=None, with_preview=True):
+        """
+        Builds a publish pipeline and its context without starting it.
+
+        Args:
+            comment (str): Publish comment.
+            department_name (str): Department as shown in the UI, e.g. 'modeling'.
+            dispatch_main (callable or None): Main thread dispatcher, see PublishPipeline.
+            with_preview (bool): False skips the preview steps (e.g. mayapy without a viewport).
+
+        Returns:
+            tuple: (PublishPipeline, PublishContext)
+        """
+        trace = trace_utils_module.Trace(
+            "publish",
+            {"project": self.project_name, "department_name": department_name},
+            profile=self.profile_publish
+        )
+        pipeline = publish_pipeline_module.PublishPipeline(
+            self.build_publish_steps(with_preview=with_preview),
+            dispatch_main=dispatch_main,
+            trace=trace
+        )
+        context = publish_pipeline_module.PublishContext(comment=comment, department_name=department_name,
+                                                         trace=trace)
+        return pipeline, context
+
+    def publish_headless(self, comment, department_name, with_preview=True, on_step_finished=None):
+        """
+        Runs every publish step synchronously on the calling thread.
+
+        Returns:
+            tuple: (succeeded (bool), context (PublishContext), error (str or None))
+        """
+        pipeline, context = self.create_pipeline(comment, department_name, with_preview=with_preview)
+        errors = []
+        pipeline.on_step_finished = on_step_finished
+        pipeline.on_failed = lambda step, error: errors.append(f"{step}: {error}")
+        pipeline.on_cancelled = lambda: errors.append("cancelled")
+        succeeded = pipeline.run(context)
+        return succeeded, context, (errors[0] if errors else None)
+
+    def build_publish_steps(self, with_preview=True):
+        """
+        Returns the ordered publish steps.
+
+        Scene save, playblast and metadata node edits are main thread steps;
+        directory creation, version reservation, the history write and the
+        catalog update can run on the pipeline worker pool.
+        """
+        Step = publish_pipeline_module.PublishStep
+        steps = [
+            Step("Validate", self._step_validate, main_thread=True),
+        ]
+        if self.validators:
+            steps.append(Step("Run validators", self._step_run_validators, main_thread=True))
+        steps += [
+            Step("Create folders", self._step_create_folders),
+            Step("Reserve version", self._step_reserve_version),
+        ]
+        if self.use_content_store:
+            steps.append(Step("Check content", self._step_check_content))
+        steps.append(Step("Save scene", self._step_save_scene, main_thread=True))
+        if self.gather_dependencies:
+            steps += [
+                Step("Find dependencies", self._step_find_dependencies, main_thread=True),
+                Step("Gather dependencies", self._step_gather_dependencies),
+            ]
+        if self.use_content_store:
+            steps.append(Step("Store content", self._step_store_content))
+        if self.delta_store:
+            steps.append(Step("Pack version", self._step_pack_version))
+        if self._compression_configured() and not (self.use_content_store or self.delta_store):
+            steps.append(Step("Compress scene", self._step_compress_scene))
+        if with_preview:
+            steps += [
+                Step("Save preview", self._step_save_preview, main_thread=True),
+                Step("Write preview", self._step_write_preview),
+                Step("Write thumbnails", self._step_write_thumbnails),
+            ]
+        steps.append(Step("Update metadata", self._step_update_metadata, main_thread=True))
+        if self.use_local_staging:
+            # History and catalog are written by the uploader once the scene is on the share
+            steps.append(Step("Queue upload", self._step_queue_upload))
+        else:
+            steps += [
+                Step("Write history", self._step_write_history),
+                Step("Update catalog", self._step_update_catalog),
+            ]
+        return steps
+
+    def _step_validate(self, context):
+        # Step 1: Validate basic fields
+        context["department"] = self.get_internal_department(context["department_name"])
+
+        if not self.asset_name or not self.asset_type or not self.creator:
+            raise ValueError("Missing asset metadata. Please refresh or create an asset.")
+
+        if not context["comment"]:
+            raise ValueError("Publish comment is required.")
+
+        # ✅ Step 2: Strict metadata check from scene
+        metadata = self.load_asset_metadata()
+        if not metadata or metadata.get("asset_name", "") in ["", "Unnamed"]:
+            raise RuntimeError("No valid metadata found in scene. Cannot publish.")
+
+        if not self.preview_cache.is_empty():
+            context["preview_state_key"] = asset_scene_utils_module.AssetSceneUtils.get_viewport_state_key()
+
+        context["compression"] = self.get_compression(context["department_name"])
+
+        cmds = self._cmds()
+        context["scene_path"] = cmds.file(q=True, sceneName=True)
+        if self.use_content_store:
+            context["scene_modified"] = cmds.file(q=True, modified=True)
+
+    def _step_run_validators(self, context):
+        # Step 2b: Scene checks; errors stop the publish, warnings are only logged
+        if self.validation is None:
+            raise ValueError(f"Invalid validators configuration: {self.validation_error}")
+        report = self.validation.run(self._cmds())
+        context["validation"] = report.summary()
+        for issue in report.warnings:
+            logging.warning(f"[AssetPublisherLogic] {issue.validator}: {issue}")
+        if not report.passed:
+            raise ValueError(
+                f"{len(report.errors)} validation error(s):\n{report.format_issues('error')}"
+            )
+
+    def _step_create_folders(self, context):
+        # ✅ Step 3: Only now proceed with directory creation
+        publish_paths = file_utils_module.DirectoryUtils.create_publish_dir_structure(
+            project_root=self.project_root,
+            asset_name=self.asset_name,
+            department=context["department"],
+            asset_type=self.asset_type,
+            format_type="ma"
+        )
+        if not publish_paths:
+            raise RuntimeError("Failed to create publish directory.")
+        context["file_publish_path"], context["metadata_path"], context["preview_image_path"] = publish_paths
+
+    def _step_reserve_version(self, context):
+        # Step 4: Claim the next versioned filename
+        reservation = self._reserve_version(context)
+        if not reservation and not os.path.isdir(context["file_publish_path"]):
+            # The folder was deleted or unmounted while DirectoryUtils still had it cached
+            file_utils_module.DirectoryUtils.invalidate_dir_cache(os.path.dirname(context["file_publish_path"]))
+            self._step_create_folders(context)
+            reservation = self._reserve_version(context)
+        if not reservation:
+            raise RuntimeError("Failed to reserve a publish version.")
+        context["reservation"] = reservation
+        context.on_abort(reservation.release)
+
+        trace = context.get("trace")
+        if trace is not None:
+            trace.attrs.update(asset_name=self.asset_name, asset_type=self.asset_type,
+                               department=context["department"], version=reservation.version_str)
+            trace.profile_path = trace_utils_module.profile_path_for(context["metadata_path"], reservation.file_name)
+
+    def _reserve_version(self, context):
+        return version_utils_module.VersionUtils.reserve_version(
+            path=context["file_publish_path"],
+            base_name=self.asset_name,
+            suffix=context["department"],
+            ext=".ma"
+        )
+
+    def _content_store(self):
+        return content_store_module.ContentStore.for_project(self.project_root)
+
+    def _step_check_content(self, context):
+        # Step 4b: An unmodified scene identical to the latest version needs no save
+        latest = json_utils_module.tail_publish_history(context["metadata_path"], "metadata.json", 1)
+        latest = latest[0] if latest else {}
+        context["latest_entry"] = latest
+        store = self._content_store()
+        if not store.has_object(latest.get("content_digest")):
+            return
+
+        scene_path = context.get("scene_path")
+        if context.get("scene_modified") or not scene_path or not os.path.isfile(scene_path):
+            return
+        if store.digest_file(scene_path)[1] == latest.get("scene_digest"):
+            context["metadata_only"] = True
+            context["content_digest"] = latest["content_digest"]
+            context["scene_digest"] = latest["scene_digest"]
+
+    def _step_save_scene(self, context):
+        # Step 5: Save Maya scene
+        cmds = self._cmds()
+        reservation = context["reservation"]
+        self.version = reservation.version_str
+        context["full_publish_path"] = reservation.full_path
+        if self.use_local_staging:
+            self._save_staged(context)
+        elif context.get("compression"):
+            self._save_local(context)
+        else:
+            self._save_published(context)
+        if self.use_local_staging or self.use_content_store or self.delta_store or context.get("compression"):
+            # The published file is written later by the uploader, becomes a
+            # read-only object shared with other versions, or is replaced by
+            # its packed or compressed form
+            self._restore_work_scene_name(context)
+
+    def _save_published(self, context):
+        cmds = self._cmds()
+        reservation = context["reservation"]
+        with reservation:
+            cmds.file(rename=reservation.full_path)
+            if context.get("metadata_only"):
+                # The versioned file must exist before the claim is released
+                if self._content_store().link(context["content_digest"], reservation.full_path):
+                    return
+                context["metadata_only"] = False
+            with trace_utils_module.span("mc.file.save"):
+                cmds.file(save=True, type="mayaAscii")
+
+    def _save_local(self, context):
+        # Compressed publishes are saved locally and streamed onto the share by
+        # Compress scene, so only compressed bytes cross the network; the claim
+        # stays held until the compressed file is in place
+        cmds = self._cmds()
+        reservation = context["reservation"]
+        os.makedirs(WORK_SCENE_DIR, exist_ok=True)
+        context["local_save_path"] = os.path.join(WORK_SCENE_DIR, reservation.file_name).replace("\\", "/")
+        cmds.file(rename=context["local_save_path"])
+        with trace_utils_module.span("mc.file.save"):
+            cmds.file(save=True, type="mayaAscii")
+
+    @staticmethod
+    def _saved_path(context):
+        """
+        Returns where Save scene wrote the scene: the local save, the staged
+        file or the published path.
+        """
+        return context.get("local_save_path") or context.get("staged_path") or context["full_publish_path"]
+
+    def _work_scene_path(self, context):
+        """
+        Returns the artist's work file, or a local path when the scene was
+        untitled or opened from the department's publish folder.
+        """
+        work_path = context.get("scene_path")
+        publish_dir = os.path.normcase(os.path.normpath(context["file_publish_path"]))
+        if not work_path or os.path.normcase(os.path.normpath(os.path.dirname(work_path))) == publish_dir:
+            os.makedirs(WORK_SCENE_DIR, exist_ok=True)
+            work_path = os.path.join(WORK_SCENE_DIR, context["reservation"].file_name).replace("\\", "/")
+        return work_path
+
+    def _restore_work_scene_name(self, context):
+        # Later saves of the session must never write over a published version
+        context["work_scene_path"] = self._work_scene_path(context)
+        self._cmds().file(rename=context["work_scene_path"])
+
+    def _save_staged(self, context):
+        # Save to local disk; the claim stays held until the uploader has placed the file
+        cmds = self._cmds()
+        reservation = context["reservation"]
+        job = upload_queue_module.UploadQueue.instance().new_job()
+        context.on_abort(job.discard)
+        context["upload_job"] = job
+        context["staged_path"] = job.stage_path(reservation.file_name)
+        cmds.file(rename=context["staged_path"])
+        with trace_utils_module.span("mc.file.save"):
+            cmds.file(save=True, type="mayaAscii")
+
+    def _step_find_dependencies(self, context):
+        # Step 5b: List the external files the scene points to
+        if context.get("metadata_only"):
+            return
+        scene_utils = asset_scene_utils_module.AssetSceneUtils
+        context["scene_dependencies"] = scene_utils.list_file_dependencies()
+        context["workspace_root"] = scene_utils.get_workspace_root()
+
+    def _step_gather_dependencies(self, context):
+        # Step 5c: Copy them next to the publish and point the saved scene at the copies
+        if context.get("metadata_only"):
+            # Same bytes as the latest version, which already points at gathered copies
+            latest = context.get("latest_entry") or {}
+            if latest.get("dependencies"):
+                context["dependencies"] = latest["dependencies"]
+            return
+        if not context.get("scene_dependencies"):
+            return
+        report = dependency_utils_module.gather_dependencies(
+            context["scene_dependencies"],
+            dependency_utils_module.dependencies_dir_for(context["metadata_path"]),
+            workspace_root=context.get("workspace_root")
+        )
+        saved_path = self._saved_path(context)
+        if dependency_utils_module.rewrite_scene_paths(saved_path, report["paths"]) < 0:
+            raise RuntimeError("Failed to repath the saved scene to its gathered dependencies.")
+        for path in report["missing"] + report["failed"]:
+            logging.warning(f"[AssetPublisherLogic] Dependency '{path}' was not gathered; the scene keeps its path.")
+        context["dependencies"] = {
+            "files": len(report["files"]),
+            "copied_bytes": report["copied_bytes"],
+            "reused_bytes": report["reused_bytes"],
+            "missing": report["missing"] + report["failed"]
+        }
+
+    def _step_store_content(self, context):
+        # Step 5d: Deduplicate the saved scene into the content store
+        if context.get("metadata_only"):
+            return
+        store = self._content_store()
+        full_path = context["full_publish_path"]
+        digests = store.digest_file(full_path)
+        latest = context.get("latest_entry") or {}
+
+        if digests[1] == latest.get("scene_digest") and store.has_object(latest.get("content_digest")):
+            # Only save-time noise changed: publish the latest version's bytes again
+            if store.link(latest["content_digest"], full_path):
+                context["metadata_only"] = True
+                context["content_digest"], context["scene_digest"] = latest["content_digest"], digests[1]
+                return
+
+        stored = store.ingest(full_path, digests=digests)
+        if not stored:
+            # The scene is saved either way; it just stays outside the store
+            logging.warning(f"[AssetPublisherLogic] Could not add '{full_path}' to the content store.")
+            return
+        context["content_digest"], context["scene_digest"] = stored.digest, stored.scene_digest
+
+    def _step_pack_version(self, context):
+        # Step 5e: Replace the full scene with a keyframe or a delta against the previous version
+        if context.get("metadata_only"):
+            return
+        reservation = context["reservation"]
+        current = int(reservation.version_str.lstrip("v"))
+        previous = [
+            file_name for version, file_name in version_utils_module.VersionIndex.get_versions(
+                context["file_publish_path"], self.asset_name, context["department"], ".ma"
+            )
+            if version < current
+        ]
+        base_path = None
+        # A compressed previous version (compression was on before) starts a new keyframe
+        if previous and not previous[-1].endswith(compression_utils_module.COMPRESSED_EXTS):
+            base_name = previous[-1]
+            for packed_ext in delta_store_module.PACKED_EXTS:
+                if base_name.endswith(packed_ext):
+                    base_name = base_name[:-len(packed_ext)]
+            base_path = os.path.join(context["file_publish_path"], base_name)
+
+        original_size = os.path.getsize(context["full_publish_path"])
+        packed_path = self.delta_store.pack(context["full_publish_path"], base_path)
+        if not packed_path:
+            # The full scene stays in place; only the space saving is lost
+            logging.warning(f"[AssetPublisherLogic] Could not pack '{context['full_publish_path']}'.")
+            return
+        context["storage"] = "keyframe" if packed_path.endswith(delta_store_module.KEYFRAME_EXT) else "delta"
+        context["original_size"], context["stored_size"] = original_size, os.path.getsize(packed_path)
+
+    def _step_compress_scene(self, context):
+        # Step 5f: Stream the saved scene through the department's codec
+        if not context.get("compression"):
+            return
+        if context.get("local_save_path"):
+            self._publish_local_save(context)
+            return
+        codec, level = context["compression"]
+        saved_path = self._saved_path(context)
+        result = compression_utils_module.compress_file(saved_path, codec, level)
+        if not result:
+            # The plain scene stays in place; only the space saving is lost
+            logging.warning(f"[AssetPublisherLogic] Could not compress '{saved_path}'.")
+            return
+        self._record_compression(context, codec, result)
+
+    def _publish_local_save(self, context):
+        # Compress from local disk straight onto the share, then release the claim
+        codec, level = context["compression"]
+        local_path = context["local_save_path"]
+        full_path = context["full_publish_path"]
+        result = compression_utils_module.compress_file(
+            local_path, codec, level, remove_source=False,
+            target_path=full_path + compression_utils_module.CODECS[codec][0]
+        )
+        if result:
+            self._record_compression(context, codec, result)
+        else:
+            # Publish the plain scene; only the space saving is lost
+            logging.warning(f"[AssetPublisherLogic] Could not compress '{local_path}', publishing it uncompressed.")
+            temp_path = f"{full_path}.{uuid.uuid4().hex[:8]}.tmp"
+            shutil.copyfile(local_path, temp_path)
+            os.replace(temp_path, full_path)
+            context["original_size"] = context["stored_size"] = os.path.getsize(full_path)
+        context["reservation"].release()
+        if local_path != context.get("work_scene_path"):
+            os.remove(local_path)
+
+    @staticmethod
+    def _record_compression(context, codec, result):
+        context["storage"] = codec
+        context["stored_path"] = result["path"]
+        context["original_size"], context["stored_size"] = result["original_size"], result["stored_size"]
+
+    def _step_save_preview(self, context):
+        # Step 6: Save preview image, reusing the last capture if the viewport is unchanged
+        preview_name = f"{self.asset_name}_{context['department']}_prv_{self.version}.jpg"
+        preview_path = os.path.join(context["preview_image_path"], preview_name).replace("\\", "/")
+        context["preview_path"] = preview_path
+
+        entry = self.preview_cache.lookup(context.get("preview_state_key"))
+        context["preview_entry"] = entry
+        if entry:
+            self.preview_image_path = preview_path
+        else:
+            self.playblast_preview(preview_path)
+
+    def _step_write_preview(self, context):
+        # Step 6b: Encode or copy a reused capture off the main thread
+        entry = context.get("preview_entry")
+        if entry and not preview_utils_module.promote_preview(entry, context["preview_path"]):
+            raise RuntimeError("Failed to write preview image.")
+
+    def _step_write_thumbnails(self, context):
+        # Step 6c: Small and medium thumbnails plus the asset's preview atlas; browsing aids never fail the publish
+        entry = context.get("preview_entry")
+        pyramid = thumbnail_utils_module.build_pyramid(
+            context["preview_path"],
+            image=entry.image if entry and entry.image is not None else None
+        )
+        if not pyramid:
+            return
+        context["thumbnails"] = {level: path.replace("\\", "/") for level, (path, _, _) in pyramid.items()}
+
+        _, data, size = pyramid[thumbnail_utils_module.ATLAS_LEVEL]
+        atlas = thumbnail_utils_module.PreviewAtlas(
+            thumbnail_utils_module.atlas_path(self.project_root, self.asset_type, self.asset_name)
+        )
+        atlas.update([{
+            "department": context["department"],
+            "version": self.version,
+            "data": data,
+            "width": size[0],
+            "height": size[1]
+        }])
+
+    def _step_update_metadata(self, context):
+        # Step 7: Update metadata
+        department = context["department"]
+        asset_scene_utils_module.AssetSceneUtils.update_asset_metadata({
+            "department": department,
+            "publisher_name": user_utils_module.UserUtils.get_os_user(),
+            "publish_date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "publish_path": context["file_publish_path"],
+            "preview_image_path": self.preview_image_path,
+            "version": self.version
+        })
+
+        live_metadata = self.load_asset_metadata()
+        if not live_metadata:
+            raise RuntimeError("Could not read updated asset metadata.")
+
+        context["history_entry"] = {
+            "asset_name": live_metadata.get("asset_name", "N/A"),
+            "asset_type": live_metadata.get("asset_type", "N/A"),
+            "version": live_metadata.get("version", "N/A"),
+            "department": department,
+            "publisher": live_metadata.get("publisher_name", "N/A"),
+            "publish_date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "comment": context["comment"],
+            "file_path": context["full_publish_path"],
+            "preview_image": self.preview_image_path
+        }
+        if context.get("storage"):
+            context["history_entry"]["storage"] = context["storage"]
+        if context.get("thumbnails"):
+            context["history_entry"]["thumbnails"] = context["thumbnails"]
+        if context.get("dependencies"):
+            context["history_entry"]["dependencies"] = context["dependencies"]
+        if context.get("validation"):
+            context["history_entry"]["validation"] = context["validation"]
+        if "original_size" not in context:
+            try:
+                context["original_size"] = context["stored_size"] = os.path.getsize(
+                    self._saved_path(context)
+                )
+            except OSError:
+                pass
+        if "original_size" in context:
+            trace_utils_module.count("scene_bytes", context["original_size"])
+            context["history_entry"].update(
+                original_size=context["original_size"],
+                stored_size=context["stored_size"]
+            )
+        if context.get("content_digest"):
+            context["history_entry"].update(
+                content_digest=context["content_digest"],
+                scene_digest=context["scene_digest"],
+                metadata_only=bool(context.get("metadata_only"))
+            )
+
+    @staticmethod
+    def _attach_trace(context):
+        # Timings up to the history write; the event log gets the complete trace
+        trace = context.get("trace")
+        if trace is not None:
+            context["history_entry"]["trace"] = trace.summary()
+
+    def _step_write_history(self, context):
+        # Step 8: Add history
+        self._attach_trace(context)
+        if not json_utils_module.update_publish_history(
+            path=context["metadata_path"],
+            file_name="metadata.json",
+            new_entry=context["history_entry"]
+        ):
+            raise RuntimeError("Failed to write publish history.")
+
+    def _step_queue_upload(self, context):
+        # Step 8 (staging): Hand the staged scene, the version claim and the history entry to the uploader
+        job = context["upload_job"]
+        source = context.get("stored_path") or context["staged_path"]
+        self._attach_trace(context)
+        job.add_file(source, os.path.join(os.path.dirname(context["full_publish_path"]), os.path.basename(source)))
+        job.hold_claim(context["reservation"].claim_path)
+        job.history = {"path": context["metadata_path"], "file_name": "metadata.json", "entry": context["history_entry"]}
+        job.project_root = self.project_root
+        upload_queue_module.UploadQueue.instance().enqueue(job)
+        context["upload_job_id"] = job.id
+
+    def _step_update_catalog(self, context):
+        # Step 9: Index the new history record; the catalog can always be rebuilt, so never fail the publish
+        try:
+            catalog = catalog_module.PublishCatalog.for_project(self.project_root)
+            catalog.refresh_metadata_dir(context["metadata_path"])
+        except Exception as e:
+            logging.warning(f"[AssetPublisherLogic] Could not update the publish catalog: {e}")
+        asset_resolver_module.AssetResolver.forget_metadata_dir(self.project_root, context["metadata_path"])
+        metadata_service_module.notify_published(self.project_root, context["metadata_path"])
+        publish_watcher_module.record_publish_event(self.project_root, context["metadata_path"], context["history_entry"])
+
+    def create_new_asset(self, asset_name, asset_type, department_name):
+        """
+        Creates a new asset metadata node in the scene and reloads metadata.
+
+        Raises:
+            RuntimeError: If the node could not be created.
+        """
+        asset_scene_utils_module.AssetSceneUtils.create_new_asset(
+            department=department_name,
+            asset_type=asset_type,
+            asset_name=asset_name,
+            creator_name=user_utils_module.UserUtils.get_os_user(),
+            publisher_name=user_utils_module.UserUtils.get_os_user(),
+            project_name=self.project_name
+        )
+        self.load_asset_metadata()
+
+    def load_asset_metadata(self):
+        """
+        Loads asset metadata from the scene.
+        """
+        try:
+            metadata = asset_scene_utils_module.AssetSceneUtils.get_asset_data()
+            self.update_attributes_from_metadata(metadata)
+            return metadata
+        except Exception as e:
+            print("Failed to load metadata:", e)
+            return {}
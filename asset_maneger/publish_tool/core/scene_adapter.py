@@ -0,0 +1,297 @@
+# File: asset_manager/publish_tool/core/scene_adapter.py
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class SceneAdapterBase:
+    """
+    Command-only scene adapter operations.
+
+    Subclasses provide `cmds` (the maya.cmds interface) and scene change
+    callbacks. The string attribute helpers here only use `cmds`; the Maya
+    adapter overrides them to look attributes up through OpenMaya.
+    """
+
+    cmds = None
+
+    def add_invalidation_callbacks(self, callback: Callable[[], None]) -> List[int]:
+        return []
+
+    def add_node_change_callbacks(self, node_types: Iterable[str],
+                                  callback: Callable[[Optional[str]], None]) -> List[int]:
+        """
+        Calls `callback(uuid)` when a node of one of `node_types` changes, and
+        `callback(None)` when any node may have changed.
+
+        Returns:
+            list: Callback ids to pass to remove_callbacks; empty if the
+            adapter cannot track nodes, so callers must re-read every node.
+        """
+        return []
+
+    def remove_callbacks(self, callback_ids: List[int]) -> None:
+        pass
+
+    def read_string_attrs(self, node: str, attrs: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Reads string attributes from a node.
+
+        Args:
+            node (str): Node name.
+            attrs (iterable or None): Attribute names, or None for all user-defined attributes.
+
+        Returns:
+            dict: Values of the attributes that exist on the node.
+        """
+        existing = self.cmds.listAttr(node, userDefined=True) or []
+        if attrs is not None:
+            existing = [attr for attr in attrs if attr in existing]
+
+        values = {}
+        for attr in existing:
+            try:
+                values[attr] = self.cmds.getAttr(f"{node}.{attr}")
+            except RuntimeError as e:
+                logging.warning(f"[SceneAdapter] Could not retrieve attribute '{attr}' from '{node}': {e}")
+        return values
+
+    def write_string_attrs(self, node: str, values: Dict[str, str]) -> List[str]:
+        """
+        Writes string attributes, unlocking and relocking locked attributes.
+        The caller is responsible for the node lock.
+
+        Returns:
+            list: Names of attributes that do not exist on the node (not written).
+        """
+        existing = set(self.cmds.listAttr(node, userDefined=True) or [])
+        missing = []
+        for attr, value in values.items():
+            if attr not in existing:
+                missing.append(attr)
+                continue
+            plug = f"{node}.{attr}"
+            locked = self.cmds.getAttr(plug, lock=True)
+            if locked:
+                self.cmds.setAttr(plug, lock=False)
+            self.cmds.setAttr(plug, value, type="string")
+            if locked:
+                self.cmds.setAttr(plug, lock=True)
+        return missing
+
+
+class MayaSceneAdapter(SceneAdapterBase):
+    """
+    Default scene adapter used by AssetSceneUtils.
+
+    An adapter exposes a `cmds` object with the maya.cmds interface and a way
+    to subscribe to scene changes that invalidate cached node handles. Swap
+    it with AssetSceneUtils.set_scene_adapter, e.g. for a FakeSceneAdapter
+    from publish_tool.testing.fake_cmds when running without Maya.
+
+    maya.cmds and OpenMaya are imported on first use.
+    """
+
+    def __init__(self):
+        import maya.cmds as cmds
+        self.cmds = cmds
+        # First id of each add_node_change_callbacks -> {node hash: per-node callback ids}
+        self._node_callbacks = {}
+
+    def add_invalidation_callbacks(self, callback: Callable[[], None]) -> List[int]:
+        """
+        Calls `callback` after a scene is opened or created and whenever a
+        network node is added or removed.
+
+        Returns:
+            list: Callback ids to pass to remove_callbacks.
+        """
+        import maya.api.OpenMaya as om2
+
+        def on_scene(*_):
+            callback()
+
+        def on_node(*_):
+            callback()
+
+        callback_ids = []
+        try:
+            callback_ids.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterOpen, on_scene))
+            callback_ids.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterNew, on_scene))
+            callback_ids.append(om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterImport, on_scene))
+            callback_ids.append(om2.MDGMessage.addNodeAddedCallback(on_node, "network"))
+            callback_ids.append(om2.MDGMessage.addNodeRemovedCallback(on_node, "network"))
+        except Exception as e:
+            logging.warning(f"[SceneAdapter] Could not register scene callbacks: {e}")
+        return callback_ids
+
+    def add_node_change_callbacks(self, node_types: Iterable[str],
+                                  callback: Callable[[Optional[str]], None]) -> List[int]:
+        """
+        Calls `callback(uuid)` when a node of one of `node_types` changes: an
+        attribute is set, connected or disconnected, or the node is renamed,
+        added or removed. `callback(None)` follows opening, creating,
+        importing or referencing a scene and any connection change in the
+        scene, which covers construction history being added or removed.
+
+        Every tracked node carries attribute-changed and name-changed
+        MNodeMessage callbacks. These fire on edits only, never on
+        evaluation, so playback runs no Python. Edits to an upstream node's
+        own attributes are not seen. Nodes created while a file loads are
+        picked up in one pass afterwards.
+
+        Returns:
+            list: Callback ids to pass to remove_callbacks.
+        """
+        import maya.api.OpenMaya as om2
+
+        node_types = tuple(node_types)
+        node_callbacks = {}
+        loading = []
+
+        def watch(node):
+            handle = om2.MObjectHandle(node)
+            if handle.hashCode() in node_callbacks:
+                return
+
+            def on_change(*_):
+                if handle.isValid():
+                    callback(om2.MFnDependencyNode(handle.object()).uuid().asString())
+
+            node_callbacks[handle.hashCode()] = [
+                om2.MNodeMessage.addAttributeChangedCallback(node, on_change),
+                om2.MNodeMessage.addNameChangedCallback(node, on_change)
+            ]
+
+        def unwatch_all():
+            for ids in node_callbacks.values():
+                om2.MMessage.removeCallbacks(ids)
+            node_callbacks.clear()
+
+        def watch_all():
+            selection = om2.MSelectionList()
+            for node_type in node_types:
+                try:
+                    names = self.cmds.ls(type=node_type) or []
+                except RuntimeError:
+                    # Node type of an unloaded plugin
+                    names = []
+                for name in names:
+                    selection.add(name)
+            for index in range(selection.length()):
+                watch(selection.getDependNode(index))
+
+        def on_before_load(*_):
+            loading.append(True)
+
+        def on_before_replace(*_):
+            loading.append(True)
+            unwatch_all()
+
+        def on_after_load(*_):
+            if loading:
+                loading.pop()
+            watch_all()
+            callback(None)
+
+        def on_added(node, *_):
+            if loading:
+                return
+            watch(node)
+            callback(om2.MFnDependencyNode(node).uuid().asString())
+
+        def on_connection(*_):
+            callback(None)
+
+        def on_removed(node, *_):
+            ids = node_callbacks.pop(om2.MObjectHandle(node).hashCode(), None)
+            if ids:
+                om2.MMessage.removeCallbacks(ids)
+            callback(om2.MFnDependencyNode(node).uuid().asString())
+
+        callback_ids = []
+        try:
+            for message in (om2.MSceneMessage.kBeforeNew, om2.MSceneMessage.kBeforeOpen):
+                callback_ids.append(om2.MSceneMessage.addCallback(message, on_before_replace))
+            for message in (om2.MSceneMessage.kBeforeImport, om2.MSceneMessage.kBeforeCreateReference,
+                            om2.MSceneMessage.kBeforeLoadReference):
+                callback_ids.append(om2.MSceneMessage.addCallback(message, on_before_load))
+            for message in (om2.MSceneMessage.kAfterNew, om2.MSceneMessage.kAfterOpen,
+                            om2.MSceneMessage.kAfterImport, om2.MSceneMessage.kAfterCreateReference,
+                            om2.MSceneMessage.kAfterLoadReference):
+                callback_ids.append(om2.MSceneMessage.addCallback(message, on_after_load))
+            for node_type in node_types:
+                callback_ids.append(om2.MDGMessage.addNodeAddedCallback(on_added, node_type))
+                callback_ids.append(om2.MDGMessage.addNodeRemovedCallback(on_removed, node_type))
+            callback_ids.append(om2.MDGMessage.addConnectionCallback(on_connection))
+            watch_all()
+        except Exception as e:
+            logging.warning(f"[SceneAdapter] Could not register node change callbacks: {e}")
+            unwatch_all()
+            self.remove_callbacks(callback_ids)
+            return []
+        self._node_callbacks[callback_ids[0]] = node_callbacks
+        return callback_ids
+
+    def remove_callbacks(self, callback_ids: List[int]) -> None:
+        if not callback_ids:
+            return
+        import maya.api.OpenMaya as om2
+        try:
+            for callback_id in callback_ids:
+                for ids in self._node_callbacks.pop(callback_id, {}).values():
+                    om2.MMessage.removeCallbacks(ids)
+            om2.MMessage.removeCallbacks(callback_ids)
+        except Exception as e:
+            logging.warning(f"[SceneAdapter] Could not remove scene callbacks: {e}")
+
+    @staticmethod
+    def _depend_node(node):
+        import maya.api.OpenMaya as om2
+        selection = om2.MSelectionList()
+        selection.add(node)
+        return om2.MFnDependencyNode(selection.getDependNode(0))
+
+    def read_string_attrs(self, node: str, attrs: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Reads string attributes by plug in one pass, without a getAttr per attribute.
+        """
+        if attrs is None:
+            attrs = self.cmds.listAttr(node, userDefined=True) or []
+
+        fn_node = self._depend_node(node)
+        values = {}
+        for attr in attrs:
+            if not fn_node.hasAttribute(attr):
+                continue
+            try:
+                values[attr] = fn_node.findPlug(attr, False).asString()
+            except RuntimeError:
+                values[attr] = self.cmds.getAttr(f"{node}.{attr}")
+        return values
+
+    def write_string_attrs(self, node: str, values: Dict[str, str]) -> List[str]:
+        """
+        Writes string attributes with undoable setAttr commands inside one
+        undo chunk, so the whole update undoes in a single step. Attribute
+        existence and locks are read through OpenMaya instead of a listAttr
+        and a getAttr per attribute.
+        """
+        fn_node = self._depend_node(node)
+        missing = []
+        self.cmds.undoInfo(openChunk=True, chunkName="write_string_attrs")
+        try:
+            for attr, value in values.items():
+                if not fn_node.hasAttribute(attr):
+                    missing.append(attr)
+                    continue
+                plug = f"{node}.{attr}"
+                locked = fn_node.findPlug(attr, False).isLocked
+                if locked:
+                    self.cmds.setAttr(plug, lock=False)
+                self.cmds.setAttr(plug, value, type="string")
+                if locked:
+                    self.cmds.setAttr(plug, lock=True)
+        finally:
+            self.cmds.undoInfo(closeChunk=True)
+        return missing
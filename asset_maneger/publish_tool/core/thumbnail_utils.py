@@ -0,0 +1,283 @@
+# File: asset_manager/publish_tool/core/thumbnail_utils.py
+
+import contextlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import re
+import struct
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+# Pyramid levels below the full 400x300 preview, largest first: each level
+# is scaled from the one above it.
+THUMBNAIL_SIZES = (
+    ("medium", (160, 120)),
+    ("small", (64, 48)),
+)
+ATLAS_LEVEL = "small"
+THUMBNAIL_DIR_NAME = "thumbnails"
+THUMBNAIL_QUALITY = 85
+ATLAS_TEMPLATE = "publish/{asset_type}/{asset_name}/preview_atlas.bin"
+
+LOCK_TIMEOUT = 60  # seconds before an atlas lock counts as abandoned
+LOCK_WAIT = 10  # seconds to wait for a busy atlas
+
+_ATLAS_MAGIC = b"PTAT"
+_ATLAS_FORMAT = 1
+_ATLAS_HEADER = struct.Struct("<4sBI")  # magic, format, index length
+_PREVIEW_VERSION = re.compile(r"_(v\d+)\.jpe?g$", re.IGNORECASE)
+
+
+def _imaging_backend() -> Optional[str]:
+    """
+    Returns 'pil' if Pillow is importable, else 'qt' for PySide2 (always
+    there inside Maya), else None.
+    """
+    if importlib.util.find_spec("PIL") is not None:
+        return "pil"
+    if importlib.util.find_spec("PySide2") is not None:
+        return "qt"
+    return None
+
+
+def _scale_pil(source, sizes):
+    from PIL import Image
+
+    image = Image.open(source)
+    # JPEG draft mode decodes straight at a reduced DCT scale
+    image.draft("RGB", sizes[0][1])
+    image = image.convert("RGB")
+    results = {}
+    for level, size in sizes:
+        image = image.copy()
+        image.thumbnail(size, Image.BILINEAR)
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=THUMBNAIL_QUALITY)
+        results[level] = (buffer.getvalue(), image.size)
+    return results
+
+
+def _scale_qt(source, sizes):
+    from PySide2 import QtCore, QtGui
+
+    image = source if isinstance(source, QtGui.QImage) else QtGui.QImage(source)
+    if image.isNull():
+        raise IOError(f"Could not read preview '{source}'.")
+    results = {}
+    for level, (width, height) in sizes:
+        image = image.scaled(width, height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        byte_array = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(byte_array)
+        buffer.open(QtCore.QIODevice.WriteOnly)
+        image.save(buffer, "JPG", THUMBNAIL_QUALITY)
+        results[level] = (bytes(byte_array), (image.width(), image.height()))
+    return results
+
+
+def thumbnail_path(preview_path: str, level: str) -> str:
+    """
+    Returns the pyramid file for a preview, e.g.
+    '.../preview_image/thumbnails/tree_mod_prv_v004_small.jpg'.
+    """
+    directory, file_name = os.path.split(preview_path)
+    stem = os.path.splitext(file_name)[0]
+    return os.path.join(directory, THUMBNAIL_DIR_NAME, f"{stem}_{level}.jpg")
+
+
+def atlas_path(project_root: str, asset_type: str, asset_name: str) -> str:
+    return os.path.join(project_root, ATLAS_TEMPLATE.format(asset_type=asset_type, asset_name=asset_name))
+
+
+def preview_version(preview_path: str) -> Optional[str]:
+    """
+    Returns the version of a preview file name, e.g. 'tree_mod_prv_v004.jpg' -> 'v004'.
+    """
+    match = _PREVIEW_VERSION.search(os.path.basename(preview_path))
+    return match.group(1).lower() if match else None
+
+
+@trace_utils_module.traced("thumbnail_utils.build_pyramid")
+def build_pyramid(preview_path: str, image=None, force: bool = True) -> Optional[Dict[str, Tuple[str, bytes, tuple]]]:
+    """
+    Writes the small and medium thumbnails of a preview.
+
+    Args:
+        preview_path (str): The full-size preview JPEG.
+        image (QImage or None): The preview already in memory, scaled
+            directly instead of decoding preview_path again.
+        force (bool): False skips levels that are newer than the preview
+            (their bytes are then read back from disk).
+
+    Returns:
+        dict or None: level -> (path, jpeg_bytes, (width, height)), or None
+        if no imaging backend is available or the preview cannot be read.
+    """
+    try:
+        source_mtime = os.stat(preview_path).st_mtime if image is None else None
+        if not force and source_mtime is not None:
+            existing = {}
+            for level, _ in THUMBNAIL_SIZES:
+                path = thumbnail_path(preview_path, level)
+                if os.path.isfile(path) and os.stat(path).st_mtime >= source_mtime:
+                    with open(path, "rb") as f:
+                        existing[level] = (path, f.read(), None)
+            if len(existing) == len(THUMBNAIL_SIZES):
+                return existing
+
+        backend = "qt" if image is not None else _imaging_backend()
+        if backend is None:
+            logging.warning("[ThumbnailUtils] Neither Pillow nor PySide2 is available; no thumbnails written.")
+            return None
+        scaled = (_scale_qt if backend == "qt" else _scale_pil)(image if image is not None else preview_path,
+                                                               THUMBNAIL_SIZES)
+
+        os.makedirs(os.path.join(os.path.dirname(preview_path), THUMBNAIL_DIR_NAME), exist_ok=True)
+        results = {}
+        for level, (data, size) in scaled.items():
+            path = thumbnail_path(preview_path, level)
+            temp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            trace_utils_module.count("bytes_written", len(data))
+            results[level] = (path, data, size)
+        return results
+    except Exception as e:
+        logging.error(f"[ThumbnailUtils] Failed to build thumbnails for '{preview_path}': {e}")
+        return None
+
+
+class PreviewAtlas:
+    """
+    One file per asset packing the small thumbnail of every published
+    version of every department, so a browser reads a whole asset at once:
+
+        <project_root>/publish/<asset_type>/<asset_name>/preview_atlas.bin
+
+    Layout: 'PTAT', format byte, index length (uint32 LE), a JSON index of
+    {department, version, offset, length, width, height} and then the
+    concatenated JPEG bytes; offsets are relative to the end of the index.
+
+    Writers replace the whole file atomically under a lock file, so readers
+    never need a lock.
+
+    Example:
+        atlas = PreviewAtlas(atlas_path("E:/grow", "prop", "tree"))
+        jpeg_bytes = atlas.load()[("mod", "v004")]["data"]
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @staticmethod
+    def parse(data: bytes) -> Dict[Tuple[str, str], dict]:
+        """
+        Parses atlas bytes into {(department, version): entry}; each entry
+        also carries its JPEG bytes under 'data'.
+        """
+        magic, file_format, index_length = _ATLAS_HEADER.unpack_from(data, 0)
+        if magic != _ATLAS_MAGIC or file_format != _ATLAS_FORMAT:
+            raise ValueError("Not a preview atlas.")
+        start = _ATLAS_HEADER.size
+        blob = memoryview(data)[start + index_length:]
+        entries = {}
+        for entry in json.loads(data[start:start + index_length].decode("utf-8")):
+            entry["data"] = bytes(blob[entry["offset"]:entry["offset"] + entry["length"]])
+            entries[(entry["department"], entry["version"])] = entry
+        return entries
+
+    def load(self) -> Dict[Tuple[str, str], dict]:
+        """
+        Reads the atlas in one read. Returns an empty dict if it does not exist or is unreadable.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                return self.parse(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"[PreviewAtlas] Ignoring unreadable atlas '{self.path}': {e}")
+            return {}
+
+    def _write(self, entries):
+        index, chunks, offset = [], [], 0
+        for key in sorted(entries):
+            entry = entries[key]
+            data = entry["data"]
+            index.append({
+                "department": entry["department"],
+                "version": entry["version"],
+                "offset": offset,
+                "length": len(data),
+                "width": entry.get("width"),
+                "height": entry.get("height")
+            })
+            chunks.append(data)
+            offset += len(data)
+        index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+
+        temp_path = f"{self.path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_ATLAS_HEADER.pack(_ATLAS_MAGIC, _ATLAS_FORMAT, len(index_bytes)))
+            f.write(index_bytes)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_path, self.path)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        lock_path = self.path + ".lock"
+        deadline = time.monotonic() + LOCK_WAIT
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(lock_path).st_mtime > LOCK_TIMEOUT:
+                        os.remove(lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Atlas '{self.path}' is locked.")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+    @trace_utils_module.traced("PreviewAtlas.update")
+    def update(self, thumbnails: List[dict], replace_all: bool = False) -> bool:
+        """
+        Adds or replaces thumbnails in the atlas.
+
+        Args:
+            thumbnails (list): Dicts with department, version, data (JPEG
+                bytes) and optionally width and height.
+            replace_all (bool): Drop entries that are not in `thumbnails`
+                (used by backfill to rebuild an atlas).
+
+        Returns:
+            bool: True if the atlas was written.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with self._locked():
+                entries = {} if replace_all else self.load()
+                for thumbnail in thumbnails:
+                    entries[(thumbnail["department"], thumbnail["version"])] = thumbnail
+                self._write(entries)
+            return True
+        except Exception as e:
+            logging.error(f"[PreviewAtlas] Failed to update '{self.path}': {e}")
+            return False
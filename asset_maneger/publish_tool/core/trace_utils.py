@@ -0,0 +1,297 @@
+# File: asset_manager/publish_tool/core/trace_utils.py
+
+import collections
+import contextlib
+import cProfile
+import functools
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+import uuid
+from typing import Dict, List, Optional
+
+EVENT_LOG_DIR = os.path.join(os.path.expanduser("~"), ".pip_dev", "traces")
+EVENT_LOG_FILE = "publish_events.jsonl"
+EVENT_LOG_MAX_BYTES = 20 * 1024 * 1024  # rotated to publish_events.jsonl.1 past this size
+PROFILE_DIR_NAME = "profile"  # next to data/metadata and data/preview_image
+MEMORY_TOP_LINES = 30
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+class Trace:
+    """
+    Timing spans and counters of one publish.
+
+    The pipeline runs every step inside Trace.step(), which makes the trace
+    current on the thread running the step, so core utils report into it
+    through the module functions span(), traced() and count() without
+    having the trace passed in. Outside a traced step those are no-ops.
+
+    With profile=True every step also runs under its own cProfile profiler
+    (steps hop between Maya's main thread and the worker pool, and cProfile
+    only sees the thread it was enabled on) and tracemalloc is started for
+    the whole publish. finish() merges and saves both to profile_path.
+
+    Example:
+        trace = Trace("publish", {"asset": "tree"})
+        with trace.step("Save scene"):
+            with span("mc.file.save"):
+                ...
+            count("bytes_written", 1024)
+        trace.finish("succeeded")
+    """
+
+    def __init__(self, name: str, attrs: Optional[dict] = None, profile: bool = False):
+        self.name = name
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.attrs = dict(attrs or {})
+        self.profile = profile
+        self.profile_path = None  # set once the publish path is known; without it nothing is saved
+        self.spans = []
+        self.counters = collections.Counter()
+        self.status = None
+        self.seconds = None
+        self._start = time.perf_counter()
+        self._start_time = time.time()
+        self._lock = threading.Lock()
+        self._profiles = []
+        self._started_tracemalloc = False
+        if profile and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    @contextlib.contextmanager
+    def activate(self):
+        """
+        Makes this the current trace of the calling thread.
+        """
+        previous = getattr(_local, "trace", None)
+        previous_stack = getattr(_local, "stack", None)
+        _local.trace, _local.stack = self, []
+        try:
+            yield self
+        finally:
+            _local.trace, _local.stack = previous, previous_stack
+
+    @contextlib.contextmanager
+    def span(self, name: str, kind: str = "op", **attrs):
+        stack = _local.stack if getattr(_local, "trace", None) is self else []
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            record = {
+                "name": name,
+                "kind": kind,
+                "parent": parent,
+                "start": round(start - self._start, 6),
+                "seconds": round(seconds, 6),
+                "thread": threading.current_thread().name
+            }
+            if attrs:
+                record["attrs"] = attrs
+            with self._lock:
+                self.spans.append(record)
+
+    @contextlib.contextmanager
+    def step(self, name: str):
+        """
+        Runs a pipeline step: activates the trace, records a 'step' span and
+        profiles the step if profiling is on.
+        """
+        profiler = cProfile.Profile() if self.profile else None
+        with self.activate(), self.span(name, kind="step"):
+            if profiler:
+                profiler.enable()
+            try:
+                yield
+            finally:
+                if profiler:
+                    profiler.disable()
+                    with self._lock:
+                        self._profiles.append(profiler)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def summary(self) -> dict:
+        """
+        Compact form recorded in the history entry: seconds per step, total
+        seconds per op span name, and the counters.
+        """
+        steps, ops = {}, collections.defaultdict(float)
+        with self._lock:
+            for record in self.spans:
+                if record["kind"] == "step":
+                    steps[record["name"]] = round(steps.get(record["name"], 0.0) + record["seconds"], 4)
+                else:
+                    ops[record["name"]] += record["seconds"]
+            counters = dict(self.counters)
+        summary = {
+            "trace_id": self.trace_id,
+            "seconds": round(self.seconds if self.seconds is not None else time.perf_counter() - self._start, 4),
+            "steps": steps,
+            "ops": {name: round(seconds, 4) for name, seconds in ops.items()},
+            "counters": counters
+        }
+        if self.profile and self.profile_path:
+            summary["profile"] = self.profile_path.replace("\\", "/")
+        return summary
+
+    def events(self) -> List[dict]:
+        """
+        Returns one event per span plus a closing event for the whole trace.
+        """
+        base = {"trace_id": self.trace_id, "trace": self.name}
+        with self._lock:
+            events = [dict(base, event="span", **record) for record in self.spans]
+        closing = dict(base, event="trace", status=self.status, started_at=round(self._start_time, 3),
+                       **self.summary())
+        closing.update(self.attrs)
+        events.append(closing)
+        return events
+
+    def finish(self, status: str, log_path: Optional[str] = None) -> None:
+        """
+        Ends the trace: writes its events to the JSONL sink and, when
+        profiling, saves the profile. Never raises.
+        """
+        if self.status is not None:
+            return
+        self.status = status
+        self.seconds = time.perf_counter() - self._start
+        write_events(self.events(), log_path)
+        if self.profile:
+            self._save_profile()
+
+    def _save_profile(self):
+        snapshot, peak = None, None
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        if not self.profile_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.profile_path), exist_ok=True)
+            with self._lock:
+                profiles = list(self._profiles)
+            if profiles:
+                stats = pstats.Stats(profiles[0])
+                for profiler in profiles[1:]:
+                    stats.add(profiler)
+                stats.dump_stats(self.profile_path)
+            if snapshot is not None:
+                lines = [f"peak traced memory: {peak / 1024 ** 2:.1f} MB", ""]
+                lines += [str(stat) for stat in snapshot.statistics("lineno")[:MEMORY_TOP_LINES]]
+                with open(memory_report_path(self.profile_path), "w", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            logging.error(f"[Trace] Failed to save profile '{self.profile_path}': {e}")
+
+
+def current_trace() -> Optional[Trace]:
+    return getattr(_local, "trace", None)
+
+
+def span(name: str, **attrs):
+    """
+    Times a block in the current trace; a no-op context outside a traced step.
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return contextlib.nullcontext()
+    return trace.span(name, **attrs)
+
+
+def traced(name: str):
+    """
+    Decorator timing every call of a function as a span named `name`.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = getattr(_local, "trace", None)
+            if trace is None:
+                return func(*args, **kwargs)
+            with trace.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name: str, value: int = 1) -> None:
+    """
+    Adds to a counter of the current trace, e.g. count("bytes_written", n).
+    """
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.count(name, value)
+
+
+def profile_path_for(metadata_path: str, file_name: str) -> str:
+    """
+    Returns where the profile of a publish is saved, e.g.
+    '.../mod/data/profile/tree_mod_v004.prof' for metadata in '.../mod/data/metadata'.
+    """
+    stem = file_name.split(".", 1)[0]
+    return os.path.join(os.path.dirname(metadata_path), PROFILE_DIR_NAME, f"{stem}.prof")
+
+
+def memory_report_path(profile_path: str) -> str:
+    return os.path.splitext(profile_path)[0] + "_memory.txt"
+
+
+def default_log_path() -> str:
+    return os.path.join(EVENT_LOG_DIR, EVENT_LOG_FILE)
+
+
+def write_events(events: List[dict], log_path: Optional[str] = None) -> bool:
+    """
+    Appends events to the JSONL sink in one write, rotating it past EVENT_LOG_MAX_BYTES.
+    """
+    log_path = log_path or default_log_path()
+    data = "".join(json.dumps(event, default=str, separators=(",", ":")) + "\n" for event in events)
+    try:
+        with _log_lock:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            try:
+                if os.path.getsize(log_path) > EVENT_LOG_MAX_BYTES:
+                    os.replace(log_path, log_path + ".1")
+            except OSError:
+                pass
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(data)
+        return True
+    except Exception as e:
+        logging.error(f"[Trace] Failed to write trace events to '{log_path}': {e}")
+        return False
+
+
+def read_events(log_path: Optional[str] = None) -> List[dict]:
+    """
+    Reads every event of the JSONL sink, skipping damaged lines.
+    """
+    events = []
+    try:
+        with open(log_path or default_log_path(), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return events
@@ -0,0 +1,596 @@
+# File: asset_manager/publish_tool/core/upload_queue.py
+
+import errno
+import hashlib
+import json
+import logging
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+import publish_tool.core.asset_resolver as asset_resolver_module
+import publish_tool.core.catalog as catalog_module
+import publish_tool.core.metadata_service as metadata_service_module
+import publish_tool.core.publish_watcher as publish_watcher_module
+import publish_tool.core.json_utils as json_utils_module
+import publish_tool.core.version_utils as version_utils_module
+
+STAGING_DIR = os.path.join(os.path.expanduser("~"), ".pip_dev", "staging")
+JOURNAL_FILE = "job.json"
+LOCK_FILE = "job.lock"
+PART_EXT = ".part"
+COPY_CHUNK_SIZE = 16 * 1024 * 1024
+HASH_BLOCK_SIZE = 1024 * 1024
+HEARTBEAT_INTERVAL = 30  # seconds between claim/lock refreshes while uploading
+LOCK_TIMEOUT = 120  # seconds before another session's job lock counts as abandoned
+RETRY_DELAY = 5  # seconds, multiplied by the attempt number
+
+# copy_file_range/sendfile errors that mean "not supported here", not "copy failed"
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+_SENDFILE_TO_FILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+
+class UploadConflict(Exception):
+    """Raised when a staged version can no longer be uploaded under its version number."""
+
+
+def sha256_file(path: str) -> str:
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def copy_file(source: str, target: str, offset: int = 0, progress: Optional[Callable[[int], None]] = None,
+              chunk_size: int = COPY_CHUNK_SIZE) -> str:
+    """
+    Copies source to target, continuing a partial target from `offset`.
+
+    Uses os.copy_file_range (in-kernel, server-side on some network file
+    systems), then os.sendfile on Linux, then a buffered copy with one
+    large reusable buffer, falling back whenever the faster call is not
+    supported for this pair of files. The target is fsynced before returning.
+
+    Args:
+        source (str): File to copy.
+        target (str): Destination; truncated to `offset` first.
+        offset (int): Bytes already copied by an earlier, interrupted call.
+        progress (callable or None): Called with the bytes copied so far.
+        chunk_size (int): Bytes per system call.
+
+    Returns:
+        str: The copy method that finished the file.
+    """
+    size = os.path.getsize(source)
+    method = "copy_file_range" if hasattr(os, "copy_file_range") else ("sendfile" if _SENDFILE_TO_FILE else "buffered")
+    buffer = None
+    position = offset
+
+    with open(source, "rb", buffering=0) as src, open(target, "r+b" if offset else "wb", buffering=0) as dst:
+        dst.truncate(offset)
+        while position < size:
+            count = min(chunk_size, size - position)
+            try:
+                if method == "copy_file_range":
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), count, position, position)
+                elif method == "sendfile":
+                    os.lseek(dst.fileno(), position, os.SEEK_SET)
+                    copied = os.sendfile(dst.fileno(), src.fileno(), position, count)
+                else:
+                    if buffer is None:
+                        buffer = memoryview(bytearray(chunk_size))
+                    src.seek(position)
+                    dst.seek(position)
+                    copied = src.readinto(buffer[:count])
+                    dst.write(buffer[:copied])
+            except OSError as e:
+                if method == "buffered" or e.errno not in _FALLBACK_ERRNOS:
+                    raise
+                logging.debug(f"[UploadQueue] {method} not supported for '{target}': {e}")
+                method = "sendfile" if method == "copy_file_range" and _SENDFILE_TO_FILE else "buffered"
+                continue
+
+            if not copied:
+                raise IOError(f"'{source}' shrank while it was copied.")
+            position += copied
+            if progress:
+                progress(position)
+        os.fsync(dst.fileno())
+    return method
+
+
+class UploadJob:
+    """
+    One staged publish waiting to be moved to the project share.
+
+    The job folder under the staging dir holds the staged files and a
+    journal (job.json) that is rewritten atomically on every state change,
+    so a job survives a Maya restart and resumes where it stopped.
+
+    Attributes:
+        id (str): Job id, also the job folder name.
+        state (str): 'pending', 'uploading', 'done' or 'failed'.
+        files (list): Dicts with source, target, size, sha256 and done.
+        claim_path (str): Version claim held until the files are in place.
+        claim_token (str): Content of that claim, to recognize it as ours.
+        history (dict): update_publish_history arguments, written after upload.
+        history_written (bool): True once the history entry has been appended.
+        project_root (str): Project whose catalog is refreshed after upload.
+    """
+
+    def __init__(self, job_dir: str, job_id: Optional[str] = None):
+        self.job_dir = job_dir
+        self.id = job_id or os.path.basename(job_dir)
+        self.created_at = time.time()
+        self.state = "pending"
+        self.attempts = 0
+        self.error = None
+        self.files = []
+        self.claim_path = None
+        self.claim_token = None
+        self.history = None
+        self.history_written = False
+        self.project_root = None
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.job_dir, JOURNAL_FILE)
+
+    @property
+    def bytes_total(self) -> int:
+        return sum(f["size"] for f in self.files)
+
+    def stage_path(self, file_name: str) -> str:
+        return os.path.join(self.job_dir, file_name)
+
+    def add_file(self, source: str, target: str) -> None:
+        """
+        Adds a staged file, hashing it now so the upload can be verified.
+        """
+        self.files.append({
+            "source": source,
+            "target": target,
+            "size": os.path.getsize(source),
+            "sha256": sha256_file(source),
+            "done": False
+        })
+
+    def hold_claim(self, claim_path: str) -> None:
+        """
+        Takes over a version claim from a VersionReservation; it is released
+        once the files are uploaded.
+        """
+        self.claim_path = claim_path
+        with open(claim_path, "rb") as f:
+            self.claim_token = f.read().decode("utf-8", "replace")
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "state": self.state,
+            "attempts": self.attempts,
+            "error": self.error,
+            "files": self.files,
+            "claim_path": self.claim_path,
+            "claim_token": self.claim_token,
+            "history": self.history,
+            "history_written": self.history_written,
+            "project_root": self.project_root
+        }
+
+    def save(self) -> None:
+        temp_path = f"{self.journal_path}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=4)
+        os.replace(temp_path, self.journal_path)
+
+    @classmethod
+    def load(cls, job_dir: str) -> Optional["UploadJob"]:
+        try:
+            with open(os.path.join(job_dir, JOURNAL_FILE), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"[UploadQueue] Skipping unreadable job '{job_dir}': {e}")
+            return None
+        job = cls(job_dir, data.get("id"))
+        for key in ("created_at", "state", "attempts", "error", "files", "claim_path",
+                    "claim_token", "history", "history_written", "project_root"):
+            if key in data:
+                setattr(job, key, data[key])
+        return job
+
+    def discard(self) -> None:
+        """
+        Deletes the job folder with its staged files and journal.
+        """
+        shutil.rmtree(self.job_dir, ignore_errors=True)
+
+
+class UploadQueue:
+    """
+    Write-behind uploader for staged publishes.
+
+    Publishes save to the local staging dir and enqueue an UploadJob; one
+    background thread then copies each file next to its target as
+    '<target>.<job>.part', verifies its sha256, renames it into place,
+    writes the held-back history entry, refreshes the catalog and finally
+    releases the version claim. Interrupted copies continue from the size
+    of the .part file. Network errors are retried with a growing delay.
+
+    Example:
+        uploads = UploadQueue.instance()
+        uploads.resume()  # jobs left over from an earlier session
+        uploads.status()
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, staging_dir: Optional[str] = None, verify: bool = True, max_attempts: int = 3):
+        self.staging_dir = staging_dir or STAGING_DIR
+        self.verify = verify
+        self.max_attempts = max_attempts
+        self._jobs = {}
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._active = None
+        self._progress = 0
+        self._thread = None
+
+    @classmethod
+    def instance(cls, staging_dir: Optional[str] = None) -> "UploadQueue":
+        """
+        Returns the shared queue for a staging dir.
+        """
+        key = os.path.normcase(os.path.abspath(staging_dir or STAGING_DIR))
+        with cls._instances_lock:
+            uploads = cls._instances.get(key)
+            if uploads is None:
+                uploads = cls._instances[key] = cls(staging_dir)
+            return uploads
+
+    # -- queueing --------------------------------------------------------
+
+    def new_job(self) -> UploadJob:
+        """
+        Creates an empty job folder to stage files into.
+        """
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        job_dir = os.path.join(self.staging_dir, job_id)
+        os.makedirs(job_dir)
+        return UploadJob(job_dir, job_id)
+
+    def enqueue(self, job: UploadJob) -> None:
+        job.state = "pending"
+        job.error = None
+        job.save()
+        with self._lock:
+            self._jobs[job.id] = job
+        self._queue.put(job)
+        self._ensure_worker()
+
+    def resume(self) -> int:
+        """
+        Re-enqueues unfinished jobs found in the staging dir, e.g. after a
+        Maya restart. Failed jobs are listed in status() but not retried.
+
+        Returns:
+            int: Number of jobs enqueued.
+        """
+        try:
+            job_dirs = sorted(e.path for e in os.scandir(self.staging_dir) if e.is_dir())
+        except OSError:
+            return 0
+
+        resumed = 0
+        for job_dir in job_dirs:
+            with self._lock:
+                if os.path.basename(job_dir) in self._jobs:
+                    continue
+            job = UploadJob.load(job_dir)
+            if job is None:
+                continue
+            if job.state == "done":
+                job.discard()
+            elif job.state == "failed":
+                with self._lock:
+                    self._jobs[job.id] = job
+            else:
+                self.enqueue(job)
+                resumed += 1
+        return resumed
+
+    def retry_failed(self) -> int:
+        """
+        Puts failed jobs back in the queue.
+
+        Returns:
+            int: Number of jobs retried.
+        """
+        with self._lock:
+            failed = [job for job in self._jobs.values() if job.state == "failed"]
+        for job in failed:
+            job.attempts = 0
+            self.enqueue(job)
+        return len(failed)
+
+    def discard(self, job_id: str) -> bool:
+        """
+        Drops a job that is not uploading, deleting its staged files, and
+        releases its version claim if it still holds it.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job is self._active:
+                return False
+        if job is None:
+            job = UploadJob.load(os.path.join(self.staging_dir, job_id))
+            if job is None:
+                return False
+        if not self._acquire_lock(job):
+            # Being uploaded by another Maya session
+            return False
+        with self._lock:
+            self._jobs.pop(job.id, None)
+        if self._owns_claim(job):
+            os.remove(job.claim_path)
+        job.state = "failed"
+        job.discard()
+        return True
+
+    # -- status ----------------------------------------------------------
+
+    def jobs(self) -> List[dict]:
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def status(self) -> Dict:
+        """
+        Returns a snapshot for display.
+
+        Returns:
+            dict: pending and failed job counts, and for the job being
+            uploaded its file name, bytes_done and bytes_total.
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+            active = self._active
+            progress = self._progress
+        result = {
+            "pending": sum(1 for job in jobs if job.state == "pending"),
+            "failed": sum(1 for job in jobs if job.state == "failed"),
+            "uploading": None,
+            "bytes_done": 0,
+            "bytes_total": 0
+        }
+        if active is not None:
+            current = next((f for f in active.files if not f["done"]), None)
+            result.update(
+                uploading=os.path.basename(current["target"]) if current else active.id,
+                bytes_done=sum(f["size"] for f in active.files if f["done"]) + (progress if current else 0),
+                bytes_total=active.bytes_total
+            )
+        return result
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until nothing is pending or uploading.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._active is not None or any(job.state == "pending" for job in self._jobs.values()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    # -- worker ----------------------------------------------------------
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="PublishUploadQueue", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                if self._jobs.get(job.id) is not job or job.state != "pending":
+                    continue
+                self._active = job
+                self._progress = 0
+            try:
+                self._process(job)
+            except Exception as e:
+                logging.error(f"[UploadQueue] Job {job.id} stopped unexpectedly: {e}")
+            finally:
+                with self._idle:
+                    self._active = None
+                    self._idle.notify_all()
+
+    def _process(self, job):
+        if not os.path.isfile(job.journal_path):
+            # Finished or discarded by another Maya session on this machine
+            with self._lock:
+                self._jobs.pop(job.id, None)
+            return
+        if not self._acquire_lock(job):
+            # Locked by another session, or by one that crashed: look again once the lock could expire
+            threading.Timer(LOCK_TIMEOUT, self._requeue, (job,)).start()
+            return
+        try:
+            job.state = "uploading"
+            job.attempts += 1
+            job.save()
+            self._upload(job)
+        except Exception as e:
+            job.error = str(e)
+            retry = not isinstance(e, UploadConflict) and job.attempts < self.max_attempts
+            job.state = "pending" if retry else "failed"
+            job.save()
+            logging.error(f"[UploadQueue] Upload of job {job.id} failed (attempt {job.attempts}): {e}")
+            if retry:
+                threading.Timer(RETRY_DELAY * job.attempts, self._requeue, (job,)).start()
+            return
+        finally:
+            self._release_lock(job)
+
+        with self._lock:
+            self._jobs.pop(job.id, None)
+        job.discard()
+
+    def _requeue(self, job):
+        with self._lock:
+            if self._jobs.get(job.id) is not job:
+                return
+        self._queue.put(job)
+        self._ensure_worker()
+
+    def _acquire_lock(self, job) -> bool:
+        lock_path = os.path.join(job.job_dir, LOCK_FILE)
+        for _ in range(2):
+            try:
+                os.close(os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(lock_path).st_mtime < LOCK_TIMEOUT:
+                        return False
+                    os.remove(lock_path)
+                except OSError:
+                    pass
+            except OSError:
+                return False
+        return False
+
+    @staticmethod
+    def _release_lock(job):
+        try:
+            os.remove(os.path.join(job.job_dir, LOCK_FILE))
+        except OSError:
+            pass
+
+    def _heartbeat(self, job):
+        for path in (job.claim_path, os.path.join(job.job_dir, LOCK_FILE)):
+            if path:
+                try:
+                    os.utime(path, None)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _owns_claim(job) -> bool:
+        try:
+            with open(job.claim_path, "rb") as f:
+                return f.read().decode("utf-8", "replace") == job.claim_token
+        except (OSError, TypeError):
+            return False
+
+    def _ensure_claim(self, job):
+        """
+        Makes sure the job still holds its version. A claim that expired
+        while Maya was closed is taken again, unless another publish has
+        used the version in the meantime.
+        """
+        if not job.claim_path or self._owns_claim(job):
+            self._heartbeat(job)
+            return
+        taken = [
+            f for f in job.files
+            if not f["done"] and os.path.isfile(f["target"]) and sha256_file(f["target"]) != f["sha256"]
+        ]
+        if taken or os.path.exists(job.claim_path):
+            raise UploadConflict(
+                f"Version claim '{os.path.basename(job.claim_path)}' was taken over while the upload was "
+                f"pending; the staged files are kept in '{job.job_dir}'."
+            )
+        try:
+            fd = os.open(job.claim_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0))
+        except FileExistsError:
+            raise UploadConflict(f"Version claim '{os.path.basename(job.claim_path)}' is held by another publish.")
+        try:
+            os.write(fd, job.claim_token.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def _upload(self, job):
+        self._ensure_claim(job)
+        last_beat = [time.monotonic()]
+
+        def on_progress(position):
+            with self._lock:
+                self._progress = position
+            if time.monotonic() - last_beat[0] > HEARTBEAT_INTERVAL:
+                self._heartbeat(job)
+                last_beat[0] = time.monotonic()
+
+        for entry in job.files:
+            if entry["done"]:
+                continue
+            self._upload_file(job, entry, on_progress)
+            entry["done"] = True
+            job.save()
+
+        if job.history and not job.history_written:
+            if not json_utils_module.update_publish_history(
+                path=job.history["path"],
+                file_name=job.history["file_name"],
+                new_entry=job.history["entry"]
+            ):
+                raise IOError("Failed to write publish history.")
+            # Written once: a retry after a later failure must not append it again
+            job.history_written = True
+            job.save()
+
+        if job.history and job.project_root:
+            try:
+                catalog = catalog_module.PublishCatalog.for_project(job.project_root)
+                catalog.refresh_metadata_dir(job.history["path"])
+            except Exception as e:
+                logging.warning(f"[UploadQueue] Could not update the publish catalog: {e}")
+            asset_resolver_module.AssetResolver.forget_metadata_dir(job.project_root, job.history["path"])
+            metadata_service_module.notify_published(job.project_root, job.history["path"])
+            publish_watcher_module.record_publish_event(job.project_root, job.history["path"], job.history["entry"])
+
+        if job.claim_path and self._owns_claim(job):
+            os.remove(job.claim_path)
+            version_utils_module.VersionIndex.invalidate(os.path.dirname(job.claim_path))
+        job.state = "done"
+        job.save()
+
+    def _upload_file(self, job, entry, on_progress):
+        target = entry["target"]
+        if os.path.isfile(target):
+            # Renamed into place before an interruption
+            if sha256_file(target) == entry["sha256"]:
+                return
+            raise UploadConflict(f"'{target}' exists with different content.")
+
+        part_path = f"{target}.{job.id[-8:]}{PART_EXT}"
+        offset = 0
+        if os.path.isfile(part_path):
+            offset = os.path.getsize(part_path)
+            if offset > entry["size"]:
+                offset = 0
+        with self._lock:
+            self._progress = offset
+
+        copy_file(entry["source"], part_path, offset=offset, progress=on_progress)
+        if self.verify and sha256_file(part_path) != entry["sha256"]:
+            os.remove(part_path)
+            raise IOError(f"Checksum mismatch after copying '{os.path.basename(target)}'.")
+        os.replace(part_path, target)
+        version_utils_module.VersionIndex.invalidate(os.path.dirname(target))
@@ -0,0 +1,525 @@
+# File: asset_manager/publish_tool/core/validation.py
+"""
+Pluggable pre-publish scene validation.
+
+A validator declares the node types it inspects and implements two parts:
+
+    snapshot(cmds, node)  cheap scene queries on the main thread; the result
+                          is both the check's input and the node's fingerprint
+    check(node, snapshot) returns the problems found, as messages
+
+ValidationRunner keeps every validator's result per node (by UUID) and
+only checks a node again when its snapshot changed, so a second publish
+attempt after fixing one mesh re-checks that mesh only. Scene adapters that
+report node changes (MNodeMessage callbacks in Maya) also spare the
+snapshots: a node nothing touched since the last run keeps its result
+without being queried. Checks of validators with needs_maya = False run
+on a thread pool off the main thread; pure Python checks still share the
+GIL, so the pool pays off for checks that read files or call into C.
+
+Studio validators plug in by subclassing Validator and are enabled in
+project_config by registered name or as 'module:ClassName':
+
+    "validators": {"naming": "warning", "studio_checks.uv:UVOverlapValidator": "error"}
+"""
+
+import importlib
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+import publish_tool.core.asset_scene_utils as asset_scene_utils_module
+import publish_tool.core.trace_utils as trace_utils_module
+
+SEVERITIES = ("error", "warning")
+VALIDATION_WORKERS = 4
+
+# Cameras every scene starts with; never renamed or frozen
+DEFAULT_CAMERAS = frozenset(["persp", "top", "front", "side"])
+
+# Registered name -> Validator subclass
+VALIDATORS = {}
+
+
+def register_validator(cls):
+    """
+    Class decorator adding a Validator subclass to VALIDATORS under its `name`.
+    """
+    VALIDATORS[cls.name] = cls
+    return cls
+
+
+def load_validator(spec: str):
+    """
+    Returns the Validator class for a registered name or a 'module:ClassName' spec.
+
+    Raises:
+        ValueError: If the spec names no validator.
+    """
+    if spec in VALIDATORS:
+        return VALIDATORS[spec]
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown validator '{spec}', expected one of {tuple(VALIDATORS)} or 'module:ClassName'.")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def short_name(node: str) -> str:
+    """
+    Returns a node name without its DAG path and namespace.
+    """
+    return node.rpartition("|")[2].rpartition(":")[2]
+
+
+class Issue(NamedTuple):
+    validator: str
+    severity: str
+    node: str
+    message: str
+
+    def __str__(self):
+        return f"{self.node}: {self.message}" if self.node else self.message
+
+
+class Validator:
+    """
+    Base class of scene validators.
+
+    Attributes:
+        name (str): Registered name used in project_config.
+        label (str): Shown in the UI.
+        node_types (tuple): Node types passed to cmds.ls(type=...).
+        list_flags (dict): Extra cmds.ls flags, e.g. {"noIntermediate": True}.
+        attributes (tuple): Attributes read into the default snapshot.
+        needs_maya (bool): True if check() queries the scene itself; such
+            checks run on the main thread, the others on a thread pool.
+        track_changes (bool): False if snapshot() reads nodes other than the
+            one it is given; its snapshot is then taken on every run instead
+            of only for nodes the scene adapter reported as changed.
+        version (int): Bump when check() changes, to drop cached results.
+    """
+
+    name = ""
+    label = ""
+    node_types = ()
+    list_flags = {}
+    attributes = ()
+    needs_maya = False
+    track_changes = True
+    version = 1
+
+    def __init__(self, severity: str = "error"):
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity '{severity}' for validator '{self.name}', expected one of {SEVERITIES}.")
+        self.severity = severity
+        self.name = self.name or type(self).__name__
+
+    @staticmethod
+    def _cmds():
+        return asset_scene_utils_module.AssetSceneUtils.get_scene_adapter().cmds
+
+    def skip(self, node: str) -> bool:
+        """
+        Returns True for nodes this validator ignores.
+        """
+        return False
+
+    def snapshot(self, cmds, node: str):
+        """
+        Returns the node state check() depends on, or None to skip the node.
+
+        Runs on the main thread. A node is checked again only when its
+        snapshot differs from the last one, so it must cover everything
+        check() looks at. The default is the node name and the values of
+        `attributes`.
+        """
+        return (node,) + tuple(cmds.getAttr(f"{node}.{attr}") for attr in self.attributes)
+
+    def check(self, node: str, snapshot) -> List[str]:
+        """
+        Returns the problems of one node as messages; an empty list passes.
+        """
+        raise NotImplementedError
+
+
+class ValidatorResult(NamedTuple):
+    name: str
+    label: str
+    seconds: float
+    nodes: int
+    checked: int
+    cached: int
+    issues: List[Issue]
+
+
+class ValidationReport:
+    """
+    Outcome of one ValidationRunner.run(), with per-validator timings.
+    """
+
+    def __init__(self, results: List[ValidatorResult], seconds: float):
+        self.results = results
+        self.seconds = seconds
+
+    @property
+    def issues(self) -> List[Issue]:
+        return [issue for result in self.results for issue in result.issues]
+
+    @property
+    def errors(self) -> List[Issue]:
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> List[Issue]:
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors
+
+    def format_issues(self, severity: Optional[str] = None, limit: int = 20) -> str:
+        """
+        Returns up to `limit` issues as lines, grouped by validator.
+        """
+        issues = [issue for issue in self.issues if severity is None or issue.severity == severity]
+        lines = [f"[{issue.validator}] {issue}" for issue in issues[:limit]]
+        if len(issues) > limit:
+            lines.append(f"... and {len(issues) - limit} more")
+        return "\n".join(lines)
+
+    def summary(self) -> dict:
+        """
+        Compact form recorded in the history entry: seconds, nodes, checked
+        and cached nodes and the issue count per validator.
+        """
+        return {
+            result.name: {
+                "seconds": round(result.seconds, 4),
+                "nodes": result.nodes,
+                "checked": result.checked,
+                "cached": result.cached,
+                "issues": len(result.issues)
+            }
+            for result in self.results
+        }
+
+
+class ValidationRunner:
+    """
+    Runs a set of validators, reusing per-node results across runs.
+
+    Keep one runner per session (AssetPublisherLogic holds it) so repeated
+    publish attempts only check what changed in between.
+    """
+
+    def __init__(self, validators: Dict[str, str], workers: int = VALIDATION_WORKERS):
+        """
+        Args:
+            validators (dict): Validator name or 'module:ClassName' -> severity
+                ('error' fails the publish, 'warning' is only reported).
+            workers (int): Threads for the checks that don't need Maya.
+
+        Raises:
+            ValueError: If a validator or severity is unknown.
+        """
+        self.validators = [load_validator(spec)(severity) for spec, severity in validators.items()]
+        self.workers = workers
+        self.last_report = None
+        # validator name -> {node uuid: (validator version, snapshot, messages)}
+        self._results = {validator.name: {} for validator in self.validators}
+        # UUIDs of nodes changed since the last run; _all_changed when unknown
+        self._adapter = None
+        self._callback_ids = []
+        self._changed = set()
+        self._all_changed = True
+
+    def clear_cache(self) -> None:
+        for results in self._results.values():
+            results.clear()
+
+    def stop_tracking(self) -> None:
+        """
+        Removes the node change callbacks; the next run takes every snapshot again.
+        """
+        if self._adapter is not None:
+            self._adapter.remove_callbacks(self._callback_ids)
+        self._adapter = None
+        self._callback_ids = []
+        self._all_changed = True
+
+    def _on_node_changed(self, uuid):
+        if uuid is None:
+            self._all_changed = True
+        else:
+            self._changed.add(uuid)
+
+    def _track_changes(self, cmds) -> bool:
+        """
+        Registers node change callbacks with the current scene adapter.
+
+        Returns:
+            bool: True if changes of the validated nodes are being tracked.
+        """
+        adapter = asset_scene_utils_module.AssetSceneUtils.get_scene_adapter()
+        if adapter.cmds is not cmds:
+            # Validating through another cmds than the adapter's
+            return False
+        if adapter is not self._adapter:
+            self.stop_tracking()
+            node_types = sorted({
+                node_type for validator in self.validators if validator.track_changes
+                for node_type in validator.node_types
+            })
+            if node_types:
+                self._callback_ids = adapter.add_node_change_callbacks(node_types, self._on_node_changed)
+            self._adapter = adapter
+        return bool(self._callback_ids)
+
+    @staticmethod
+    def _list_nodes(cmds, validator, listed):
+        # One ls per node type and flag set, shared by validators inspecting the same types
+        nodes = []
+        for node_type in validator.node_types:
+            key = (node_type, tuple(sorted(validator.list_flags.items())))
+            if key not in listed:
+                try:
+                    names = cmds.ls(type=node_type, long=True, **validator.list_flags) or []
+                except RuntimeError:
+                    # Node type of an unloaded plugin
+                    names = []
+                uuids = cmds.ls(names, uuid=True) if names else []
+                listed[key] = list(zip(names, uuids))
+            nodes.extend(listed[key])
+        return nodes
+
+    def _prepare(self, cmds, validator, listed, changed):
+        """
+        Takes snapshots and splits the nodes into cached results and nodes to check.
+
+        Args:
+            changed (set or None): UUIDs of the nodes changed since the last
+                run, or None to take the snapshot of every node.
+        """
+        previous = self._results[validator.name]
+        current, pending, cached_messages = {}, [], []
+        unchanged = 0
+        for node, uuid in self._list_nodes(cmds, validator, listed):
+            if validator.skip(node):
+                continue
+            known = previous.get(uuid)
+            if (known and known[0] == validator.version and changed is not None
+                    and validator.track_changes and uuid not in changed):
+                current[uuid] = known
+                cached_messages.append((node, known[2]))
+                unchanged += 1
+                continue
+            try:
+                snapshot = validator.snapshot(cmds, node)
+            except Exception as e:
+                logging.warning(f"[ValidationRunner] {validator.name}: could not inspect '{node}': {e}")
+                continue
+            if snapshot is None:
+                continue
+            if known and known[0] == validator.version and known[1] == snapshot:
+                current[uuid] = known
+                cached_messages.append((node, known[2]))
+            else:
+                pending.append((uuid, node, snapshot))
+        trace_utils_module.count("validation_snapshots_skipped", unchanged)
+        return current, pending, cached_messages
+
+    @staticmethod
+    def _check(validator, pending):
+        checked = []
+        for uuid, node, snapshot in pending:
+            try:
+                messages = list(validator.check(node, snapshot) or [])
+            except Exception as e:
+                logging.error(f"[ValidationRunner] {validator.name} failed on '{node}': {e}")
+                messages = [f"Validator failed: {e}"]
+            checked.append((uuid, node, snapshot, messages))
+        return checked
+
+    def run(self, cmds=None) -> ValidationReport:
+        """
+        Validates the open scene. Must be called on the main thread.
+
+        Returns:
+            ValidationReport: Issues and per-validator timings.
+        """
+        cmds = cmds or Validator._cmds()
+        start = time.perf_counter()
+        tracked = self._track_changes(cmds)
+        # Consumed only once the results are stored, so a failed run loses no changes
+        all_changed = self._all_changed or not tracked
+        changed = set(self._changed)
+        listed = {}
+        prepared = {}
+        prepare_seconds = {}
+        for validator in self.validators:
+            validator_start = time.perf_counter()
+            with trace_utils_module.span(f"validate.{validator.name}.snapshot"):
+                prepared[validator.name] = self._prepare(cmds, validator, listed, None if all_changed else changed)
+            prepare_seconds[validator.name] = time.perf_counter() - validator_start
+
+        def timed_check(validator):
+            check_start = time.perf_counter()
+            checked = self._check(validator, prepared[validator.name][1])
+            return checked, time.perf_counter() - check_start
+
+        outcomes = {}
+        concurrent = [v for v in self.validators if not v.needs_maya and prepared[v.name][1]]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(concurrent) or 1))) as pool:
+            futures = {validator.name: pool.submit(timed_check, validator) for validator in concurrent}
+            for validator in self.validators:
+                if validator.name not in futures:
+                    with trace_utils_module.span(f"validate.{validator.name}.check"):
+                        outcomes[validator.name] = timed_check(validator)
+            for name, future in futures.items():
+                outcomes[name] = future.result()
+
+        results = []
+        for validator in self.validators:
+            current, pending, cached_messages = prepared[validator.name]
+            checked, check_seconds = outcomes[validator.name]
+            issues = [
+                Issue(validator.name, validator.severity, node, message)
+                for node, messages in cached_messages for message in messages
+            ]
+            for uuid, node, snapshot, messages in checked:
+                current[uuid] = (validator.version, snapshot, messages)
+                issues.extend(Issue(validator.name, validator.severity, node, message) for message in messages)
+            # Nodes gone from the scene drop out of the cache here
+            self._results[validator.name] = current
+            results.append(ValidatorResult(
+                name=validator.name,
+                label=validator.label or validator.name,
+                seconds=prepare_seconds[validator.name] + check_seconds,
+                nodes=len(current),
+                checked=len(checked),
+                cached=len(cached_messages),
+                issues=issues
+            ))
+            trace_utils_module.count("validation_nodes_checked", len(checked))
+            trace_utils_module.count("validation_nodes_cached", len(cached_messages))
+
+        self._changed -= changed
+        if tracked and all_changed:
+            self._all_changed = False
+        self.last_report = ValidationReport(results, time.perf_counter() - start)
+        return self.last_report
+
+
+def _vector(value):
+    # getAttr returns compound attributes as [(x, y, z)]
+    if isinstance(value, list) and len(value) == 1 and isinstance(value[0], tuple):
+        return value[0]
+    return tuple(value) if isinstance(value, (list, tuple)) else (value,)
+
+
+@register_validator
+class NamingValidator(Validator):
+    """
+    Flags Maya default names (pCube1, group3, ...) and names with characters
+    other than letters, digits and underscores.
+    """
+
+    name = "naming"
+    label = "Naming"
+    node_types = ("transform",)
+    DEFAULT_NAME = re.compile(
+        r"^(pCube|pSphere|pCylinder|pCone|pPlane|pTorus|pPipe|pPrism|pPyramid|pHelix|polySurface|"
+        r"nurbsSphere|nurbsCube|nurbsCylinder|nurbsPlane|nurbsCircle|curve|group|null|transform|locator)\d+$"
+    )
+    VALID_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+
+    def skip(self, node):
+        return short_name(node) in DEFAULT_CAMERAS
+
+    def check(self, node, snapshot):
+        name = short_name(node)
+        if self.DEFAULT_NAME.match(name):
+            return [f"Default name '{name}'."]
+        if not self.VALID_NAME.match(name):
+            return [f"Name '{name}' should start with a letter and use only letters, digits and '_'."]
+        return []
+
+
+@register_validator
+class FrozenTransformsValidator(Validator):
+    """
+    Flags transforms with translation, rotation or scale left unfrozen.
+    """
+
+    name = "frozen_transforms"
+    label = "Frozen transforms"
+    node_types = ("transform",)
+    attributes = ("translate", "rotate", "scale")
+    TOLERANCE = 1e-5
+
+    def skip(self, node):
+        return short_name(node) in DEFAULT_CAMERAS
+
+    def check(self, node, snapshot):
+        _, translate, rotate, scale = snapshot
+        problems = []
+        for label, value, identity in (("translation", translate, 0.0), ("rotation", rotate, 0.0), ("scale", scale, 1.0)):
+            if any(abs(component - identity) > self.TOLERANCE for component in _vector(value)):
+                problems.append(label)
+        return [f"Unfrozen {', '.join(problems)}."] if problems else []
+
+
+@register_validator
+class MeshHistoryValidator(Validator):
+    """
+    Flags meshes whose shape is still driven by construction history.
+    """
+
+    name = "mesh_history"
+    label = "Construction history"
+    node_types = ("mesh",)
+    list_flags = {"noIntermediate": True}
+
+    def snapshot(self, cmds, node):
+        inputs = cmds.listConnections(f"{node}.inMesh", source=True, destination=False) or []
+        return node, tuple(inputs)
+
+    def check(self, node, snapshot):
+        _, inputs = snapshot
+        return [f"Has construction history ({', '.join(inputs)})."] if inputs else []
+
+
+@register_validator
+class MeshUVValidator(Validator):
+    """
+    Flags meshes without UVs and UV sets reaching into negative tiles.
+
+    The snapshot holds the UV count and bounds of every UV set, so the
+    check reads only the snapshot and runs off the main thread.
+    """
+
+    name = "mesh_uvs"
+    label = "UVs"
+    node_types = ("mesh",)
+    list_flags = {"noIntermediate": True}
+    version = 2
+
+    def snapshot(self, cmds, node):
+        uv_sets = []
+        for uv_set in cmds.polyUVSet(node, query=True, allUVSets=True) or []:
+            count = cmds.polyEvaluate(node, uvcoord=True, uvSetName=uv_set)
+            bounds = cmds.polyEvaluate(node, boundingBox2d=True, uvSetName=uv_set) if count else None
+            uv_sets.append((uv_set, count, tuple(tuple(axis) for axis in bounds) if bounds else None))
+        return node, tuple(uv_sets)
+
+    def check(self, node, snapshot):
+        _, uv_sets = snapshot
+        if not any(count for _, count, _ in uv_sets):
+            return ["Has no UVs."]
+        return [
+            f"UV set '{uv_set}' reaches into negative UV space."
+            for uv_set, count, bounds in uv_sets
+            if bounds and (bounds[0][0] < 0.0 or bounds[1][0] < 0.0)
+        ]
@@ -1,21 +1,218 @@
 import os
 import re
+import json
+import time
+import uuid
+import random
+import socket
 import logging
+import threading
+from functools import lru_cache
+from typing import Optional
+
+import publish_tool.core.trace_utils as trace_utils_module
+
+CLAIM_EXT = ".claim"
+CLAIM_TIMEOUT = 15 * 60  # seconds before an unreleased claim counts as abandoned
+
+# A version may be stored packed, e.g. 'tree_mod_v005.ma.delta' (see delta_store.DeltaStore)
+# or compressed, e.g. 'tree_mod_v005.ma.xz' (see compression_utils)
+PACKED_SUFFIXES = (".key", ".delta", ".gz", ".xz", ".bz2")
+
+
+class VersionIndex:
+    """
+    Per-directory cache of parsed version files.
+
+    Each directory is listed once with ``os.scandir`` and the parsed
+    ``(version, file_name)`` pairs are kept until the directory mtime changes,
+    so repeated queries against the same folder only cost a single ``stat``.
+
+    Example:
+        versions = VersionIndex.get_versions(path, "da", "mod", ".ma")
+        latest = VersionIndex.latest(path, "da", "mod", count=3)
+    """
+
+    _cache = {}
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        raise NotImplementedError("VersionIndex is a static utility class and cannot be instantiated.")
+
+    @staticmethod
+    def _cache_key(path, base_name, suffix, ext):
+        return (
+            os.path.normcase(os.path.abspath(path)),
+            base_name.lower(),
+            (suffix or "").lower(),
+            ext.lower()
+        )
+
+    @staticmethod
+    def get_versions(path, base_name, suffix=None, ext=".ma"):
+        """
+        Returns all versioned files in a directory, sorted by version.
+
+        Args:
+            path (str): Directory to search.
+            base_name (str): Base name like 'da'.
+            suffix (str or None): Optional suffix like 'mod'.
+            ext (str): File extension (default: '.ma').
+
+        Returns:
+            list: Sorted list of (version (int), file_name (str)) tuples.
+            Empty if the directory does not exist. A version stored both
+            plain and packed is listed once, with the plain file name.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+
+        key = VersionIndex._cache_key(path, base_name, suffix, ext)
+        with VersionIndex._lock:
+            cached = VersionIndex._cache.get(key)
+        if cached and cached[0] == mtime:
+            return list(cached[1])
+
+        pattern = VersionUtils._get_version_pattern(base_name, suffix, ext)
+        found = {}
+        trace_utils_module.count("dir_scans")
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    match = pattern.match(entry.name)
+                    if match:
+                        version = int(match.group(1))
+                        if version not in found or not match.group(2):
+                            found[version] = entry.name
+        except OSError as e:
+            logging.error(f"[VersionIndex] Failed to scan '{path}': {e}")
+            return []
+
+        versions = sorted(found.items())
+        with VersionIndex._lock:
+            VersionIndex._cache[key] = (mtime, tuple(versions))
+        return versions
+
+    @staticmethod
+    def latest(path, base_name, suffix=None, ext=".ma", count=1):
+        """
+        Returns the newest versions in a directory.
+
+        Args:
+            count (int): Number of versions to return.
+
+        Returns:
+            list: Up to `count` (version, file_name) tuples, newest first.
+        """
+        versions = VersionIndex.get_versions(path, base_name, suffix, ext)
+        return versions[::-1][:max(count, 0)]
+
+    @staticmethod
+    def find_gaps(path, base_name, suffix=None, ext=".ma"):
+        """
+        Returns version numbers missing between v1 and the latest version.
+
+        Returns:
+            list: Sorted list of missing version numbers (int).
+        """
+        numbers = {version for version, _ in VersionIndex.get_versions(path, base_name, suffix, ext)}
+        if not numbers:
+            return []
+        return [n for n in range(1, max(numbers) + 1) if n not in numbers]
+
+    @staticmethod
+    def invalidate(path=None):
+        """
+        Drops cached listings for a directory, or for every directory if path is None.
+
+        Call this after writing into a directory whose mtime granularity may
+        hide the change (e.g. some network shares report whole seconds).
+        """
+        with VersionIndex._lock:
+            if path is None:
+                VersionIndex._cache.clear()
+                return
+            norm_path = os.path.normcase(os.path.abspath(path))
+            for key in [k for k in VersionIndex._cache if k[0] == norm_path]:
+                del VersionIndex._cache[key]
+
+
+class VersionReservation:
+    """
+    A version number claimed on disk by VersionUtils.reserve_version.
+
+    The claim is a '<file_name>.claim' marker next to the versioned file. It
+    must be released once the file has been written (or the publish aborted);
+    claims that are never released expire after CLAIM_TIMEOUT.
+
+    Example:
+        with VersionUtils.reserve_version(path, "da", "mod") as reservation:
+            mc.file(rename=reservation.full_path)
+            mc.file(save=True, type="mayaAscii")
+    """
+
+    def __init__(self, full_path, file_name, version_str, claim_path):
+        self.full_path = full_path
+        self.file_name = file_name
+        self.version_str = version_str
+        self.claim_path = claim_path
+
+    def refresh(self):
+        """
+        Bumps the claim mtime so long-running publishes are not treated as abandoned.
+        """
+        try:
+            os.utime(self.claim_path, None)
+        except OSError as e:
+            logging.warning(f"[VersionUtils] Could not refresh claim '{self.claim_path}': {e}")
+
+    def release(self):
+        """
+        Removes the claim marker.
+
+        Returns:
+            bool: True if the claim was removed or already gone.
+        """
+        try:
+            os.remove(self.claim_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.error(f"[VersionUtils] Failed to release claim '{self.claim_path}': {e}")
+            return False
+        VersionIndex.invalidate(os.path.dirname(self.claim_path))
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+    def __repr__(self):
+        return f"VersionReservation({self.file_name!r})"
 
 
 class VersionUtils:
     @staticmethod
+    @lru_cache(maxsize=256)
     def _get_version_pattern(base_name, suffix=None, ext=".ma"):
         """
-        Creates a regex pattern to match versioned file names.
+        Creates a regex pattern to match versioned file names, plain or packed
+        (PACKED_SUFFIXES).
 
         Returns:
-            Compiled regex pattern.
+            Compiled regex pattern. Group 1 is the version number, group 2 the
+            packed suffix (empty for plain files).
         """
+        packed = "|".join(re.escape(s) for s in PACKED_SUFFIXES)
         if suffix:
-            pattern = rf"{re.escape(base_name)}_{re.escape(suffix)}_v(\d+){re.escape(ext)}$"
+            pattern = rf"{re.escape(base_name)}_{re.escape(suffix)}_v(\d+){re.escape(ext)}({packed})?$"
         else:
-            pattern = rf"{re.escape(base_name)}_v(\d+){re.escape(ext)}$"
+            pattern = rf"{re.escape(base_name)}_v(\d+){re.escape(ext)}({packed})?$"
         return re.compile(pattern, re.IGNORECASE)
 
     @staticmethod
@@ -36,18 +233,11 @@ class VersionUtils:
             logging.error(f"Path does not exist: {path}")
             return None, None
 
-        pattern = VersionUtils._get_version_pattern(base_name, suffix, ext)
-
-        versions = [
-            (int(match.group(1)), fname)
-            for fname in os.listdir(path)
-            if (match := pattern.match(fname))
-        ]
-
-        if not versions:
+        latest = VersionIndex.latest(path, base_name, suffix, ext)
+        if not latest:
             return None, None
 
-        return max(versions, key=lambda x: x[0])
+        return latest[0]
 
     @staticmethod
     def update_version(path, base_name, suffix=None, ext=".ma", padding=3):
@@ -67,12 +257,133 @@ class VersionUtils:
         latest_version, _ = VersionUtils.find_latest_version(path, base_name, suffix, ext)
         next_version = (latest_version + 1) if latest_version is not None else 1
 
-        version_str = f"v{next_version:0{padding}d}"
-        name_parts = [base_name, suffix, version_str] if suffix else [base_name, version_str]
-        file_name = "_".join(filter(None, name_parts)) + ext
+        file_name, version_str = VersionUtils._build_file_name(base_name, suffix, next_version, ext, padding)
 
         return os.path.join(path, file_name), file_name, version_str
 
+    @staticmethod
+    def _build_file_name(base_name, suffix, version, ext, padding):
+        version_str = f"v{version:0{padding}d}"
+        name_parts = [base_name, suffix, version_str] if suffix else [base_name, version_str]
+        return "_".join(filter(None, name_parts)) + ext, version_str
+
+    @staticmethod
+    def _expire_claim(claim_path, stale_timeout):
+        """
+        Removes a claim whose mtime is older than stale_timeout.
+
+        The claim is first renamed to a unique name so that only one process
+        can win the removal. If the renamed claim turns out to have been
+        refreshed in the meantime it is linked back into place.
+        """
+        try:
+            if time.time() - os.stat(claim_path).st_mtime < stale_timeout:
+                return
+            tomb_path = f"{claim_path}.{uuid.uuid4().hex}.stale"
+            os.rename(claim_path, tomb_path)
+        except OSError:
+            return
+
+        try:
+            if time.time() - os.stat(tomb_path).st_mtime < stale_timeout:
+                try:
+                    os.link(tomb_path, claim_path)
+                except OSError:
+                    pass
+            else:
+                logging.warning(f"[VersionUtils] Released abandoned claim '{claim_path}'")
+        finally:
+            try:
+                os.remove(tomb_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    @trace_utils_module.traced("VersionUtils.reserve_version")
+    def reserve_version(
+        path,
+        base_name,
+        suffix=None,
+        ext=".ma",
+        padding=3,
+        stale_timeout=CLAIM_TIMEOUT,
+        max_attempts=50
+    ) -> Optional[VersionReservation]:
+        """
+        Atomically claims the next version number in a directory.
+
+        The claim is an exclusively created marker file, so concurrent
+        publishers never receive the same version and no global lock is
+        needed: on collision the directory is rescanned and the next number
+        is tried. Claims older than stale_timeout whose version was never
+        written are released.
+
+        Args:
+            path (str): Target directory.
+            base_name (str): Asset name.
+            suffix (str or None): Optional suffix.
+            ext (str): Extension (default: '.ma').
+            padding (int): Zero padding for version number.
+            stale_timeout (float): Seconds after which an unreleased claim is abandoned.
+            max_attempts (int): Number of collisions tolerated before giving up.
+
+        Returns:
+            Optional[VersionReservation]: The claimed version, or None on failure.
+        """
+        if not os.path.isdir(path):
+            logging.error(f"Path does not exist: {path}")
+            return None
+
+        claim_body = json.dumps({
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "claimed_at": time.time()
+        }).encode("utf-8")
+
+        for attempt in range(max_attempts):
+            files = VersionIndex.get_versions(path, base_name, suffix, ext)
+            claims = VersionIndex.get_versions(path, base_name, suffix, ext + CLAIM_EXT)
+            written = {version for version, _ in files}
+
+            live_claims = []
+            for version, claim_name in claims:
+                if version not in written:
+                    VersionUtils._expire_claim(os.path.join(path, claim_name), stale_timeout)
+                if os.path.exists(os.path.join(path, claim_name)):
+                    live_claims.append(version)
+
+            next_version = max(list(written) + live_claims, default=0) + 1
+            file_name, version_str = VersionUtils._build_file_name(base_name, suffix, next_version, ext, padding)
+            full_path = os.path.join(path, file_name)
+            claim_path = full_path + CLAIM_EXT
+
+            trace_utils_module.count("file_ops")
+            try:
+                fd = os.open(claim_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0))
+            except FileExistsError:
+                VersionIndex.invalidate(path)
+                time.sleep(random.uniform(0, 0.01 * (attempt + 1)))
+                continue
+            except OSError as e:
+                logging.error(f"[VersionUtils] Failed to create claim '{claim_path}': {e}")
+                return None
+
+            try:
+                os.write(fd, claim_body)
+            finally:
+                os.close(fd)
+            VersionIndex.invalidate(path)
+
+            reservation = VersionReservation(full_path, file_name, version_str, claim_path)
+            if os.path.exists(full_path):
+                # Written by a publisher that did not claim it first
+                reservation.release()
+                continue
+            return reservation
+
+        logging.error(f"[VersionUtils] Could not reserve a version in '{path}' after {max_attempts} attempts.")
+        return None
+
 
 def main():
     path = r"E:\projects\showreel_2025\publish\da\modeling\character\ma"
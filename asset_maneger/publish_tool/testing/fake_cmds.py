@@ -0,0 +1,492 @@
+# File: asset_manager/publish_tool/testing/fake_cmds.py
+"""
+In-memory stand-in for the subset of maya.cmds used by publish_tool.
+
+Lets AssetSceneUtils run outside Maya:
+
+    from publish_tool.testing.fake_cmds import FakeSceneAdapter
+    from publish_tool.core.asset_scene_utils import AssetSceneUtils
+
+    adapter = FakeSceneAdapter()
+    AssetSceneUtils.set_scene_adapter(adapter)
+    AssetSceneUtils.create_new_asset("mod", "prop", "tree", "me", "me")
+    print(adapter.cmds.calls)
+
+Every command call is counted in `FakeCmds.calls`, which makes the number
+of command round-trips of an operation measurable.
+
+Code that imports maya.cmds itself can run on the same fake after
+install_fake_maya():
+
+    cmds = install_fake_maya()
+    import maya.cmds
+    maya.cmds.createNode("network")   # counted in cmds.calls
+"""
+
+import base64
+import builtins
+import collections
+import json
+import os
+import sys
+import time
+import types
+import uuid as uuid_module
+
+from publish_tool.core.scene_adapter import SceneAdapterBase
+
+FAKE_NODE_PREFIX = "//fake-node: "
+
+# 16x12 grey JPEG written by playblast, so preview consumers can decode it
+FAKE_PREVIEW_JPEG = base64.b64decode(
+    "/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDABALDA4MChAODQ4SERATGCgaGBYWGDEjJR0oOjM9PDkzODdASFxOQERXRTc4UG1R"
+    "V19iZ2hnPk1xeXBkeFxlZ2P/2wBDARESEhgVGC8aGi9jQjhCY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2NjY2Nj"
+    "Y2NjY2NjY2NjY2NjY2P/wAARCAAMABADASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAA"
+    "AgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6"
+    "Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXG"
+    "x8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREA"
+    "AgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5"
+    "OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPE"
+    "xcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwDPooooA//Z"
+)
+
+
+class FakeCmds:
+    """
+    Minimal maya.cmds replacement backed by a dict of nodes.
+    """
+
+    def __init__(self, maya_version="2023"):
+        self.maya_version = maya_version
+        self.calls = collections.Counter()
+        self.listeners = []
+        self.nodes = collections.OrderedDict()
+        self.scene_name = ""
+        self.saved_files = {}
+        self.current_time = 1.0
+        self.undo_name = ""
+        self.modified = False
+        self.selection = []
+
+    # -- helpers ---------------------------------------------------------
+
+    def _count(self, name):
+        self.calls[name] += 1
+
+    def _emit(self, event, node_type=None, node_uuid=None):
+        for listener in list(self.listeners):
+            listener(event, node_type, node_uuid)
+
+    def _split_plug(self, plug):
+        node, _, attr = plug.partition(".")
+        if node not in self.nodes:
+            raise RuntimeError(f"No object matches name: {plug}")
+        return self.nodes[node], attr
+
+    def _unique_name(self, name):
+        if name not in self.nodes:
+            return name
+        index = 1
+        while f"{name}{index}" in self.nodes:
+            index += 1
+        return f"{name}{index}"
+
+    def _resolve(self, name):
+        if name in self.nodes:
+            return name
+        for node_name, node in self.nodes.items():
+            if node["uuid"] == name:
+                return node_name
+        return None
+
+    def reset_calls(self):
+        self.calls.clear()
+
+    # -- node commands ---------------------------------------------------
+
+    def ls(self, *names, type=None, uuid=False, **kwargs):
+        self._count("ls")
+        if names:
+            flat = []
+            for name in names:
+                flat.extend(name if isinstance(name, (list, tuple)) else [name])
+            result = [n for n in (self._resolve(name) for name in flat if name) if n]
+        else:
+            result = list(self.nodes)
+        if type:
+            result = [n for n in result if self.nodes[n]["type"] == type]
+        if uuid:
+            return [self.nodes[n]["uuid"] for n in result]
+        return result
+
+    def objExists(self, name):
+        self._count("objExists")
+        return self._resolve(name.partition(".")[0]) is not None
+
+    def createNode(self, node_type, name=None, **kwargs):
+        self._count("createNode")
+        node_name = self._unique_name(name or f"{node_type}1")
+        self.nodes[node_name] = {
+            "type": node_type,
+            "uuid": str(uuid_module.uuid4()).upper(),
+            "attrs": collections.OrderedDict(),
+            "locked": False
+        }
+        self.undo_name = f"createNode {node_name}"
+        self.modified = True
+        self._emit("node_added", node_type, self.nodes[node_name]["uuid"])
+        return node_name
+
+    def delete(self, *names, **kwargs):
+        self._count("delete")
+        for name in names:
+            node_name = self._resolve(name)
+            if not node_name:
+                raise RuntimeError(f"No object matches name: {name}")
+            if self.nodes[node_name]["locked"]:
+                raise RuntimeError(f"Cannot delete locked node '{node_name}'.")
+            node = self.nodes.pop(node_name)
+            self.modified = True
+            self._emit("node_removed", node["type"], node["uuid"])
+
+    def rename(self, name, new_name, **kwargs):
+        self._count("rename")
+        node_name = self._resolve(name)
+        if self.nodes[node_name]["locked"]:
+            raise RuntimeError(f"Cannot rename locked node '{node_name}'.")
+        new_name = self._unique_name(new_name)
+        self.nodes = collections.OrderedDict(
+            (new_name if key == node_name else key, value) for key, value in self.nodes.items()
+        )
+        self._emit("node_changed", self.nodes[new_name]["type"], self.nodes[new_name]["uuid"])
+        return new_name
+
+    def lockNode(self, *names, query=False, lock=None, **kwargs):
+        self._count("lockNode")
+        query = query or kwargs.get("q", False)
+        node_names = [self._resolve(n) for n in names]
+        if query:
+            return [self.nodes[n]["locked"] for n in node_names]
+        for node_name in node_names:
+            self.nodes[node_name]["locked"] = bool(lock)
+
+    def select(self, *names, **kwargs):
+        self._count("select")
+        self.selection = list(names)
+
+    def addAttr(self, node, longName=None, dataType=None, **kwargs):
+        self._count("addAttr")
+        node_data = self.nodes[self._resolve(node)]
+        if node_data["locked"]:
+            raise RuntimeError(f"Cannot add attributes to locked node '{node}'.")
+        if longName in node_data["attrs"]:
+            raise RuntimeError(f"Attribute '{longName}' already exists on '{node}'.")
+        node_data["attrs"][longName] = {"value": None, "type": dataType, "locked": False}
+        self._emit("node_changed", node_data["type"], node_data["uuid"])
+
+    def attributeQuery(self, attr, node=None, exists=False, **kwargs):
+        self._count("attributeQuery")
+        return attr in self.nodes[self._resolve(node)]["attrs"]
+
+    def listAttr(self, node, userDefined=False, **kwargs):
+        self._count("listAttr")
+        attrs = list(self.nodes[self._resolve(node)]["attrs"])
+        return attrs or None
+
+    def setAttr(self, plug, *values, type=None, lock=None, **kwargs):
+        self._count("setAttr")
+        node_data, attr = self._split_plug(plug)
+        if attr not in node_data["attrs"]:
+            raise RuntimeError(f"No attribute '{attr}' on '{plug}'.")
+        attr_data = node_data["attrs"][attr]
+        if values:
+            if attr_data["locked"]:
+                raise RuntimeError(f"The attribute '{plug}' is locked or connected and cannot be modified.")
+            attr_data["value"] = values[0]
+            self.undo_name = f"setAttr {plug}"
+            self.modified = True
+            self._emit("node_changed", node_data["type"], node_data["uuid"])
+        if lock is not None:
+            attr_data["locked"] = bool(lock)
+
+    def getAttr(self, plug, lock=False, **kwargs):
+        self._count("getAttr")
+        node_data, attr = self._split_plug(plug)
+        if attr not in node_data["attrs"]:
+            raise RuntimeError(f"No attribute '{attr}' on '{plug}'.")
+        if lock:
+            return node_data["attrs"][attr]["locked"]
+        return node_data["attrs"][attr]["value"]
+
+    def listConnections(self, plug, **kwargs):
+        self._count("listConnections")
+        self._split_plug(plug)
+        # Fake scenes have no connections
+        return None
+
+    def polyEvaluate(self, node, boundingBox2d=False, **kwargs):
+        """
+        Reads counts from attributes of the same name (vertex, face, uvcoord;
+        0 when absent). UVs always span the 0-1 tile.
+        """
+        self._count("polyEvaluate")
+        if boundingBox2d:
+            return ((0.0, 1.0), (0.0, 1.0))
+        attrs = self.nodes[self._resolve(node)]["attrs"]
+        flags = [flag for flag in ("vertex", "edge", "face", "uvcoord") if kwargs.get(flag)]
+        counts = {flag: int(attrs[flag]["value"] or 0) if flag in attrs else 0 for flag in flags}
+        return counts if len(counts) > 1 else counts[flags[0]]
+
+    def polyUVSet(self, node, query=False, allUVSets=False, **kwargs):
+        self._count("polyUVSet")
+        return ["map1"]
+
+    # -- scene commands --------------------------------------------------
+
+    def about(self, version=False, **kwargs):
+        self._count("about")
+        return self.maya_version
+
+    def error(self, message):
+        raise RuntimeError(message)
+
+    def file(self, *args, query=False, sceneName=False, rename=None, save=False, new=False,
+             open=False, modified=False, force=False, **kwargs):
+        self._count("file")
+        query = query or kwargs.get("q", False)
+        if query:
+            if sceneName:
+                return self.scene_name
+            if modified:
+                return self.modified
+            return None
+        if new:
+            self.nodes.clear()
+            self.scene_name = ""
+            self.undo_name = ""
+            self.modified = False
+            self._emit("after_new")
+            return None
+        if open:
+            self.load_scene(args[0])
+            return args[0]
+        if rename:
+            self.scene_name = rename
+            return rename
+        if save:
+            self.save_scene(self.scene_name)
+            self.saved_files[self.scene_name] = len(self.nodes)
+            self.modified = False
+            return self.scene_name
+        return None
+
+    def save_scene(self, path):
+        """
+        Writes the fake scene as a mayaAscii-looking text file that load_scene can read back.
+
+        Like a real save, the header and the fileInfo UUID change on every save.
+        """
+        with builtins.open(path, "w") as f:
+            f.write("//Maya ASCII scene (fake)\n")
+            f.write(f"//Name: {os.path.basename(path)}\n")
+            f.write(f"//Last modified: {time.ctime()}\n")
+            f.write(f'requires maya "{self.maya_version}";\n')
+            f.write(f'fileInfo "UUID" "{uuid_module.uuid4()}";\n')
+            for node_name, node in self.nodes.items():
+                f.write(f'createNode {node["type"]} -n "{node_name}";\n')
+                f.write(f'\trename -uid "{node["uuid"]}";\n')
+                for attr, attr_data in node["attrs"].items():
+                    f.write(f'\tsetAttr ".{attr}" -type "string" {json.dumps(attr_data["value"])};\n')
+                f.write(f"{FAKE_NODE_PREFIX}{json.dumps({'name': node_name, 'node': node})}\n")
+
+    def load_scene(self, path):
+        self.nodes.clear()
+        with builtins.open(path) as f:
+            for line in f:
+                if line.startswith(FAKE_NODE_PREFIX):
+                    record = json.loads(line[len(FAKE_NODE_PREFIX):])
+                    self.nodes[record["name"]] = record["node"]
+        self.scene_name = path
+        self.undo_name = ""
+        self.modified = False
+        self._emit("after_new")
+
+    def currentTime(self, *args, query=False, **kwargs):
+        self._count("currentTime")
+        query = query or kwargs.get("q", False)
+        if query:
+            return self.current_time
+        self.current_time = float(args[0])
+        return self.current_time
+
+    def undoInfo(self, query=False, state=False, undoName=False, redoName=False, **kwargs):
+        self._count("undoInfo")
+        query = query or kwargs.get("q", False)
+        if state:
+            return True
+        if undoName:
+            return self.undo_name
+        return ""
+
+    def playblast(self, completeFilename=None, **kwargs):
+        self._count("playblast")
+        with open(completeFilename, "wb") as f:
+            f.write(FAKE_PREVIEW_JPEG)
+        return completeFilename
+
+    def getPanel(self, withFocus=False, typeOf=None, visiblePanels=False, **kwargs):
+        self._count("getPanel")
+        if typeOf:
+            return "modelPanel"
+        if visiblePanels:
+            return ["modelPanel4"]
+        return "modelPanel4"
+
+    def modelPanel(self, panel, query=False, camera=False, **kwargs):
+        self._count("modelPanel")
+        query = query or kwargs.get("q", False)
+        return "persp"
+
+    def xform(self, node, query=False, matrix=False, worldSpace=False, **kwargs):
+        self._count("xform")
+        query = query or kwargs.get("q", False)
+        return [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+
+class FakeSceneAdapter(SceneAdapterBase):
+    """
+    Scene adapter backed by FakeCmds; see scene_adapter.MayaSceneAdapter.
+
+    Scene changes made through the fake (file new, node creation, deletion,
+    renames and attribute edits) fire the registered callbacks synchronously,
+    like the OpenMaya messages do in Maya.
+    """
+
+    def __init__(self, cmds=None):
+        self.cmds = cmds or FakeCmds()
+        self._callbacks = {}
+        self._next_id = 1
+
+    def add_invalidation_callbacks(self, callback):
+        def listener(event, node_type, node_uuid):
+            if event == "after_new" or (event != "node_changed" and node_type == "network"):
+                callback()
+
+        return [self._add_listener(listener)]
+
+    def add_node_change_callbacks(self, node_types, callback):
+        node_types = frozenset(node_types)
+
+        def listener(event, node_type, node_uuid):
+            if event == "after_new":
+                callback(None)
+            elif node_type in node_types:
+                callback(node_uuid)
+
+        return [self._add_listener(listener)]
+
+    def _add_listener(self, listener):
+        callback_id = self._next_id
+        self._next_id += 1
+        self._callbacks[callback_id] = listener
+        self.cmds.listeners.append(listener)
+        return callback_id
+
+    def remove_callbacks(self, callback_ids):
+        for callback_id in callback_ids or []:
+            listener = self._callbacks.pop(callback_id, None)
+            if listener in self.cmds.listeners:
+                self.cmds.listeners.remove(listener)
+
+
+def fake_dcc_adapter():
+    """
+    Adapter factory for headless tools, e.g. `batch_publish.py --adapter
+    publish_tool.testing.fake_cmds:fake_dcc_adapter`.
+    """
+    return FakeSceneAdapter()
+
+
+def write_fake_scene(path, asset_name, asset_type="prop", department="modeling", creator="fake_user", extra_nodes=0):
+    """
+    Writes a fake scene file with an asset metadata node, readable by FakeCmds.
+
+    Returns:
+        str: The scene path.
+    """
+    from publish_tool.core.asset_scene_utils import AssetSceneUtils
+
+    adapter = FakeSceneAdapter()
+    previous = AssetSceneUtils._scene_adapter
+    AssetSceneUtils.set_scene_adapter(adapter)
+    try:
+        for _ in range(extra_nodes):
+            adapter.cmds.createNode("transform")
+        AssetSceneUtils.create_new_asset(department, asset_type, asset_name, creator, creator)
+        adapter.cmds.save_scene(path)
+    finally:
+        if previous is not None:
+            AssetSceneUtils.set_scene_adapter(previous)
+        else:
+            adapter.remove_callbacks(AssetSceneUtils._callback_ids)
+            AssetSceneUtils._scene_adapter = None
+            AssetSceneUtils.invalidate_metadata_node_cache()
+    return path
+
+
+def install_fake_maya(cmds=None):
+    """
+    Registers in-memory `maya` and `maya.cmds` modules backed by FakeCmds and
+    points AssetSceneUtils at a FakeSceneAdapter over the same instance, so
+    AssetSceneUtils, AssetPublisherLogic and `import maya.cmds` work without
+    Maya (benchmarks, Linux CI).
+
+    OpenMaya is not emulated, which is why the scene adapter is swapped too
+    instead of letting MayaSceneAdapter import it.
+
+    Args:
+        cmds (FakeCmds or None): Instance to install; a new one by default.
+
+    Returns:
+        FakeCmds: The installed instance.
+
+    Raises:
+        RuntimeError: If the real maya package is already imported.
+    """
+    from publish_tool.core.asset_scene_utils import AssetSceneUtils
+
+    existing = sys.modules.get("maya")
+    if existing is not None and not getattr(existing, "__fake__", False):
+        raise RuntimeError("The real maya package is loaded; refusing to replace maya.cmds.")
+
+    cmds = cmds or FakeCmds()
+    maya_module = types.ModuleType("maya")
+    maya_module.__path__ = []
+    maya_module.__fake__ = True
+    cmds_module = types.ModuleType("maya.cmds")
+    cmds_module.__fake__ = True
+    cmds_module.__getattr__ = lambda name: getattr(cmds, name)
+    maya_module.cmds = cmds_module
+    sys.modules["maya"] = maya_module
+    sys.modules["maya.cmds"] = cmds_module
+
+    AssetSceneUtils.set_scene_adapter(FakeSceneAdapter(cmds))
+    AssetSceneUtils.invalidate_metadata_node_cache()
+    return cmds
+
+
+def uninstall_fake_maya():
+    """
+    Removes the modules registered by install_fake_maya and resets the scene adapter.
+    """
+    from publish_tool.core.asset_scene_utils import AssetSceneUtils
+
+    if getattr(sys.modules.get("maya"), "__fake__", False):
+        sys.modules.pop("maya.cmds", None)
+        sys.modules.pop("maya", None)
+    adapter = AssetSceneUtils._scene_adapter
+    if isinstance(adapter, FakeSceneAdapter):
+        adapter.remove_callbacks(AssetSceneUtils._callback_ids)
+        AssetSceneUtils._scene_adapter = None
+        AssetSceneUtils._callback_ids = []
+        AssetSceneUtils.invalidate_metadata_node_cache()
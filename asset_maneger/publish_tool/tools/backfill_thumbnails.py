@@ -0,0 +1,126 @@
+# File: asset_manager/publish_tool/tools/backfill_thumbnails.py
+"""
+Generates thumbnail pyramids and preview atlases for existing publishes
+(see core/thumbnail_utils.py).
+
+Walks <project_root>/publish/<asset_type>/<asset_name>/<department>/data/preview_image,
+writes the small and medium thumbnails of every preview over a thread pool
+(skipping ones that are up to date unless --force), then rewrites the
+atlas of every asset that has previews.
+
+Usage:
+    python backfill_thumbnails.py --project-root E:/ --project-name grow --workers 16
+    mayapy backfill_thumbnails.py --type character --force
+
+Uses Pillow when it is installed, otherwise PySide2 (e.g. under mayapy).
+"""
+
+import argparse
+import collections
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+import publish_tool.core.thumbnail_utils as thumbnail_utils
+
+
+def _subdirs(path):
+    try:
+        with os.scandir(path) as entries:
+            return sorted(e.name for e in entries if e.is_dir() and not e.name.startswith("."))
+    except OSError:
+        return []
+
+
+def find_previews(project_root, asset_type=None):
+    """
+    Yields (asset_type, asset_name, department, version, preview_path) for every preview image.
+    """
+    publish_root = os.path.join(project_root, "publish")
+    for type_name in _subdirs(publish_root):
+        if asset_type and type_name != asset_type:
+            continue
+        for asset_name in _subdirs(os.path.join(publish_root, type_name)):
+            for department in _subdirs(os.path.join(publish_root, type_name, asset_name)):
+                preview_dir = os.path.join(publish_root, type_name, asset_name, department, "data", "preview_image")
+                try:
+                    with os.scandir(preview_dir) as entries:
+                        names = sorted(e.name for e in entries if e.is_file())
+                except OSError:
+                    continue
+                for name in names:
+                    version = thumbnail_utils.preview_version(name)
+                    if version:
+                        yield type_name, asset_name, department, version, os.path.join(preview_dir, name)
+
+
+def backfill(project_root, asset_type=None, workers=8, force=False):
+    start = time.perf_counter()
+    previews = list(find_previews(project_root, asset_type))
+
+    def build(preview):
+        return preview, thumbnail_utils.build_pyramid(preview[4], force=force)
+
+    by_asset = collections.defaultdict(list)
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for preview, pyramid in pool.map(build, previews):
+            if not pyramid:
+                failed += 1
+                continue
+            type_name, asset_name, department, version, _ = preview
+            _, data, size = pyramid[thumbnail_utils.ATLAS_LEVEL]
+            by_asset[(type_name, asset_name)].append({
+                "department": department,
+                "version": version,
+                "data": data,
+                "width": size[0] if size else None,
+                "height": size[1] if size else None
+            })
+
+        def write_atlas(item):
+            (type_name, asset_name), thumbnails = item
+            atlas = thumbnail_utils.PreviewAtlas(thumbnail_utils.atlas_path(project_root, type_name, asset_name))
+            # Thumbnails skipped as up to date have no size; keep the one already in the atlas
+            existing = atlas.load()
+            for thumbnail in thumbnails:
+                previous = existing.get((thumbnail["department"], thumbnail["version"]))
+                if thumbnail["width"] is None and previous:
+                    thumbnail["width"], thumbnail["height"] = previous.get("width"), previous.get("height")
+            return atlas.update(thumbnails, replace_all=True)
+
+        atlases = sum(1 for ok in pool.map(write_atlas, by_asset.items()) if ok)
+
+    return {
+        "previews": len(previews),
+        "failed": failed,
+        "atlases": atlases,
+        "seconds": round(time.perf_counter() - start, 3)
+    }
+
+
+def main(argv=None):
+    import project_config as config
+    config_data = getattr(config, "CONFIG_DATA", {})
+
+    parser = argparse.ArgumentParser(description="Generate thumbnail pyramids and preview atlases for existing publishes.")
+    parser.add_argument("--project-root", default=config_data.get("project_path", "N/A"))
+    parser.add_argument("--project-name", default=config_data.get("project_name", ""))
+    parser.add_argument("--type", dest="asset_type", help="Only this asset type.")
+    parser.add_argument("--workers", type=int, default=min(32, (os.cpu_count() or 1) * 2))
+    parser.add_argument("--force", action="store_true", help="Rebuild thumbnails that are up to date.")
+    args = parser.parse_args(argv)
+
+    result = backfill(os.path.join(args.project_root, args.project_name), args.asset_type, args.workers, args.force)
+    print(f"{result['previews']} previews, {result['failed']} failed, "
+          f"{result['atlases']} atlases written in {result['seconds']}s")
+    return 0 if not result["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
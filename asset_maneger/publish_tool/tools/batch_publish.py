@@ -0,0 +1,266 @@
+# File: asset_manager/publish_tool/tools/batch_publish.py
+"""
+Headless batch publish.
+
+Publishes many scene files without the UI, fanning the scenes out over a
+pool of worker processes. Each worker opens its scenes through a scene
+adapter and runs the same publish steps as AssetPublisherUI (see
+AssetPublisherLogic.publish_headless), then a per-scene summary with step
+timings is printed.
+
+Usage (inside Maya's interpreter):
+    mayapy batch_publish.py "E:/work/props/**/*.ma" --department modeling --comment "Model fix sweep" --workers 4
+
+Usage (Linux, fake DCC):
+    python batch_publish.py /tmp/scenes/*.ma --comment "dry run" --project-root /tmp/projects \\
+        --adapter publish_tool.testing.fake_cmds:fake_dcc_adapter
+
+Scene arguments may be files, glob patterns, or @list.txt files with one path per line.
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+DEFAULT_ADAPTER = "publish_tool.tools.batch_publish:maya_standalone_adapter"
+
+_worker_state = {}
+
+
+def maya_standalone_adapter():
+    """
+    Adapter factory that boots Maya standalone in the worker process.
+    """
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    from publish_tool.core.scene_adapter import MayaSceneAdapter
+    return MayaSceneAdapter()
+
+
+def load_adapter_factory(spec):
+    """
+    Resolves a 'module:callable' adapter factory spec.
+    """
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Adapter spec must look like 'module:callable', got '{spec}'.")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def init_worker(adapter_spec, project_root, project_name, storage_options=None):
+    """
+    Process pool initializer: installs the scene adapter once per worker.
+    """
+    from publish_tool.core.asset_scene_utils import AssetSceneUtils
+
+    logging.basicConfig(level=logging.WARNING, format='[%(levelname)s] %(message)s')
+    AssetSceneUtils.set_scene_adapter(load_adapter_factory(adapter_spec)())
+    _worker_state.update(project_root=project_root, project_name=project_name, storage_options=storage_options or {})
+
+
+def publish_scene(job):
+    """
+    Opens one scene and publishes it. Never raises; failures are reported in the result.
+
+    Args:
+        job (tuple): (scene_path, comment, department_name, with_preview)
+
+    Returns:
+        dict: Per-job summary with status, version, error and step timings.
+    """
+    from publish_tool.core.asset_scene_utils import AssetSceneUtils
+    from publish_tool.core.publisher_logic import AssetPublisherLogic
+
+    scene_path, comment, department_name, with_preview = job
+    result = {
+        "scene": scene_path,
+        "ok": False,
+        "version": None,
+        "file_path": None,
+        "error": None,
+        "metadata_only": False,
+        "storage": None,
+        "original_size": None,
+        "stored_size": None,
+        "steps": {},
+        "seconds": 0.0,
+        "pid": os.getpid()
+    }
+    start = time.perf_counter()
+
+    def record_step(index, total, name, seconds):
+        result["steps"][name] = round(seconds, 4)
+
+    try:
+        open_start = time.perf_counter()
+        AssetSceneUtils.get_scene_adapter().cmds.file(scene_path, open=True, force=True)
+        record_step(0, 0, "Open scene", time.perf_counter() - open_start)
+
+        logic = AssetPublisherLogic(
+            _worker_state["project_root"],
+            _worker_state["project_name"],
+            **_worker_state["storage_options"]
+        )
+        ok, context, error = logic.publish_headless(
+            comment, department_name, with_preview=with_preview, on_step_finished=record_step
+        )
+        result.update(
+            ok=ok,
+            version=logic.version if ok else None,
+            file_path=context.get("full_publish_path"),
+            metadata_only=bool(context.get("metadata_only")),
+            storage=context.get("storage"),
+            original_size=context.get("original_size"),
+            stored_size=context.get("stored_size"),
+            trace=context["trace"].summary() if context.get("trace") else None,
+            error=error
+        )
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def expand_scenes(patterns):
+    """
+    Expands files, glob patterns and @list files into an ordered, de-duplicated list of paths.
+    """
+    scenes = []
+    for pattern in patterns:
+        if pattern.startswith("@"):
+            with open(pattern[1:]) as f:
+                candidates = [line.strip() for line in f if line.strip()]
+        elif glob.has_magic(pattern):
+            candidates = sorted(glob.glob(pattern, recursive=True))
+        else:
+            candidates = [pattern]
+        for candidate in candidates:
+            path = os.path.abspath(candidate)
+            if path not in scenes:
+                scenes.append(path)
+    return scenes
+
+
+def run_batch(scenes, comment, department_name, workers=4, adapter_spec=DEFAULT_ADAPTER,
+              project_root="N/A", project_name="", with_preview=True, storage_options=None):
+    """
+    Publishes every scene and returns the per-job results in input order.
+
+    storage_options are AssetPublisherLogic keyword arguments, see
+    publisher_logic.storage_options_from_config.
+
+    With workers <= 1 the scenes are published in the calling process.
+    """
+    jobs = [(scene, comment, department_name, with_preview) for scene in scenes]
+    init_args = (adapter_spec, project_root, project_name, storage_options)
+
+    if workers <= 1:
+        init_worker(*init_args)
+        return [publish_scene(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=init_args) as pool:
+        return list(pool.map(publish_scene, jobs))
+
+
+def format_summary(results, elapsed):
+    lines = []
+    name_width = max([len(os.path.basename(r["scene"])) for r in results] + [5])
+    for r in results:
+        status = "OK  " if r["ok"] else "FAIL"
+        detail = r["version"] if r["ok"] else r["error"]
+        if r.get("metadata_only"):
+            detail = f"{detail} (unchanged, metadata only)"
+        slowest = max(r["steps"].items(), key=lambda item: item[1]) if r["steps"] else ("-", 0)
+        lines.append(
+            f"{status} {os.path.basename(r['scene']):<{name_width}} {r['seconds']:>8.2f}s  "
+            f"slowest: {slowest[0]} ({slowest[1]:.2f}s)  {detail}"
+        )
+    failed = sum(1 for r in results if not r["ok"])
+    lines.append(f"{len(results) - failed}/{len(results)} published in {elapsed:.2f}s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import project_config as config
+    from publish_tool.core.publisher_logic import storage_options_from_config
+    config_data = getattr(config, "CONFIG_DATA", {})
+
+    parser = argparse.ArgumentParser(description="Publish scene files headless over a process pool.")
+    parser.add_argument("scenes", nargs="+", help="Scene files, glob patterns or @list files.")
+    parser.add_argument("--comment", required=True)
+    parser.add_argument("--department", default="modeling", help="modeling, rigging or texturing.")
+    parser.add_argument("--workers", type=int, default=max(1, min(4, os.cpu_count() or 1)))
+    parser.add_argument("--adapter", default=DEFAULT_ADAPTER, help="Scene adapter factory as 'module:callable'.")
+    parser.add_argument("--project-root", default=config_data.get("project_path", "N/A"))
+    parser.add_argument("--project-name", default=config_data.get("project_name", ""))
+    parser.add_argument("--no-preview", action="store_true", help="Skip the playblast preview steps.")
+    parser.add_argument("--summary-json", help="Write the per-job results to this JSON file.")
+    storage_defaults = storage_options_from_config(config_data)
+    parser.add_argument("--content-store", action=argparse.BooleanOptionalAction,
+                        default=storage_defaults["use_content_store"],
+                        help="Deduplicate published scenes through the project content store.")
+    parser.add_argument("--delta-chain", action=argparse.BooleanOptionalAction,
+                        default=storage_defaults["use_delta_chain"],
+                        help="Store published scenes as keyframes and deltas.")
+    parser.add_argument("--keyframe-interval", type=int, default=storage_defaults["delta_keyframe_interval"],
+                        help="Every n-th version of a delta chain is stored in full.")
+    parser.add_argument("--compression",
+                        help="Compress published scenes, e.g. zlib, lzma:9 or none. "
+                             "Overrides compression and department_compression from project_config.")
+    parser.add_argument("--gather-dependencies", action=argparse.BooleanOptionalAction,
+                        default=storage_defaults["gather_dependencies"],
+                        help="Copy textures and references into the publish and repath the scene.")
+    parser.add_argument("--validate", action=argparse.BooleanOptionalAction, default=True,
+                        help="Run the validators from project_config before each publish.")
+    parser.add_argument("--profile", action=argparse.BooleanOptionalAction,
+                        default=storage_defaults["profile_publish"],
+                        help="Save a cProfile/tracemalloc profile next to every publish.")
+    args = parser.parse_args(argv)
+
+    scenes = expand_scenes(args.scenes)
+    if not scenes:
+        print("No scene files matched.")
+        return 1
+
+    start = time.perf_counter()
+    results = run_batch(
+        scenes, args.comment, args.department,
+        workers=args.workers,
+        adapter_spec=args.adapter,
+        project_root=args.project_root,
+        project_name=args.project_name,
+        with_preview=not args.no_preview,
+        storage_options={
+            "use_content_store": args.content_store,
+            "use_delta_chain": args.delta_chain,
+            "delta_keyframe_interval": args.keyframe_interval,
+            "compression": args.compression if args.compression else storage_defaults["compression"],
+            "department_compression": {} if args.compression else storage_defaults["department_compression"],
+            "gather_dependencies": args.gather_dependencies,
+            "validators": storage_defaults["validators"] if args.validate else {},
+            "profile_publish": args.profile
+        }
+    )
+    elapsed = time.perf_counter() - start
+
+    print(format_summary(results, elapsed))
+    if args.summary_json:
+        with open(args.summary_json, "w") as f:
+            json.dump({"elapsed": round(elapsed, 4), "jobs": results}, f, indent=4)
+
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+# File: asset_manager/publish_tool/tools/content_store_report.py
+"""
+Space-savings report for a publish tree.
+
+Walks <project_root>/publish, hashes every file once (files already
+hardlinked together are hashed once) and reports:
+
+- logical bytes: the sum of all file sizes,
+- on disk: after the hardlinks that already exist (e.g. content store publishes),
+- deduplicated: if every identical file were stored once,
+- scene deduplicated: if scenes that differ only in save-time noise
+  (see ContentStore.digest_file) were stored once as well.
+
+Works on any existing tree; nothing is modified.
+
+Usage:
+    python content_store_report.py --project-root E:/ --project-name grow --top 10
+"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+from publish_tool.core.content_store import ContentStore
+
+
+def scan_files(publish_root, extensions=None):
+    """
+    Yields (path, asset_key, stat_result) for every file under publish_root.
+    asset_key is '<asset_type>/<asset_name>'.
+    """
+    for dir_path, dir_names, file_names in os.walk(publish_root):
+        dir_names[:] = [d for d in dir_names if not d.startswith(".")]
+        relative = os.path.relpath(dir_path, publish_root).replace("\\", "/").split("/")
+        asset_key = "/".join(relative[:2]) if len(relative) >= 2 else "-"
+        for file_name in file_names:
+            if file_name.endswith((".tmp", ".claim")):
+                continue
+            if extensions and os.path.splitext(file_name)[1].lower() not in extensions:
+                continue
+            path = os.path.join(dir_path, file_name)
+            try:
+                yield path, asset_key, os.stat(path)
+            except OSError:
+                continue
+
+
+def build_report(project_root, extensions=None, workers=8):
+    start = time.perf_counter()
+    files = list(scan_files(os.path.join(project_root, "publish"), extensions))
+
+    # Hash each inode once
+    inodes = {}
+    for path, _, st in files:
+        inodes.setdefault((st.st_dev, st.st_ino), path)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        digests = dict(zip(inodes, pool.map(ContentStore.digest_file, inodes.values())))
+
+    logical = 0
+    on_disk = {}
+    by_digest = {}
+    by_scene = {}
+    assets = collections.defaultdict(lambda: {"files": 0, "logical": 0, "digests": {}})
+    for path, asset_key, st in files:
+        inode = (st.st_dev, st.st_ino)
+        digest, scene_digest = digests[inode]
+        logical += st.st_size
+        on_disk[inode] = st.st_size
+        by_digest[digest] = st.st_size
+        by_scene.setdefault(scene_digest, st.st_size)
+
+        asset = assets[asset_key]
+        asset["files"] += 1
+        asset["logical"] += st.st_size
+        asset["digests"][digest] = st.st_size
+
+    asset_rows = []
+    for asset_key, asset in assets.items():
+        unique = sum(asset["digests"].values())
+        asset_rows.append({
+            "asset": asset_key,
+            "files": asset["files"],
+            "logical_bytes": asset["logical"],
+            "deduplicated_bytes": unique,
+            "savings_bytes": asset["logical"] - unique
+        })
+    asset_rows.sort(key=lambda row: row["savings_bytes"], reverse=True)
+
+    return {
+        "project_root": project_root,
+        "files": len(files),
+        "unique_contents": len(by_digest),
+        "logical_bytes": logical,
+        "on_disk_bytes": sum(on_disk.values()),
+        "deduplicated_bytes": sum(by_digest.values()),
+        "scene_deduplicated_bytes": sum(by_scene.values()),
+        "seconds": round(time.perf_counter() - start, 3),
+        "assets": asset_rows
+    }
+
+
+def format_bytes(count):
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if abs(count) < 1024 or unit == "TB":
+            return f"{count:.1f} {unit}" if unit != "B" else f"{count} B"
+        count /= 1024.0
+
+
+def format_report(report, top=10):
+    logical = report["logical_bytes"] or 1
+
+    def line(label, value):
+        return f"  {label:<22} {format_bytes(value):>12}  ({value * 100.0 / logical:5.1f}% of logical)"
+
+    lines = [
+        f"{report['files']} files, {report['unique_contents']} unique contents, scanned in {report['seconds']}s",
+        line("logical", report["logical_bytes"]),
+        line("on disk", report["on_disk_bytes"]),
+        line("deduplicated", report["deduplicated_bytes"]),
+        line("scene deduplicated", report["scene_deduplicated_bytes"]),
+    ]
+    rows = [row for row in report["assets"][:top] if row["savings_bytes"] > 0]
+    if rows:
+        lines.append(f"Top {len(rows)} assets by savings:")
+        for row in rows:
+            lines.append(f"  {row['asset']:<40} {row['files']:>6} files  saves {format_bytes(row['savings_bytes'])}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import project_config as config
+    config_data = getattr(config, "CONFIG_DATA", {})
+
+    parser = argparse.ArgumentParser(description="Report how much space deduplicating a publish tree saves.")
+    parser.add_argument("--project-root", default=config_data.get("project_path", "N/A"))
+    parser.add_argument("--project-name", default=config_data.get("project_name", ""))
+    parser.add_argument("--ext", nargs="*", help="Only these extensions, e.g. .ma .abc")
+    parser.add_argument("--workers", type=int, default=8, help="Hashing threads.")
+    parser.add_argument("--top", type=int, default=10, help="Assets to list by savings.")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON.")
+    args = parser.parse_args(argv)
+
+    extensions = {e.lower() if e.startswith(".") else f".{e.lower()}" for e in args.ext} if args.ext else None
+    report = build_report(os.path.join(args.project_root, args.project_name), extensions, args.workers)
+    print(json.dumps(report, indent=4) if args.json else format_report(report, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
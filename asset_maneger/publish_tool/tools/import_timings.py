@@ -0,0 +1,78 @@
+# File: asset_manager/publish_tool/tools/import_timings.py
+"""
+Measures the import cost of publish_tool modules in a fresh interpreter.
+
+Runs `<python> -X importtime -c "import <module>"` and prints the total
+time and the slowest modules (cumulative, including their own imports).
+
+Usage:
+    python import_timings.py publish_tool publish_tool.core.publisher_logic
+    mayapy import_timings.py publish_tool.asset_maneger_ui --top 25
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def measure(module_name, python=sys.executable):
+    """
+    Returns [(cumulative_us, self_us, imported_module)] for one import, in import order.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ASSET_MGR_ROOT, env.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module_name}"],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+
+    rows = []
+    errors = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # header line
+        rows.append((int(fields[1]), int(fields[0]), fields[2].rstrip()))
+
+    if process.returncode != 0:
+        raise RuntimeError("\n".join(errors[-5:]) or f"import {module_name} failed")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure publish_tool import times.")
+    parser.add_argument("modules", nargs="*", default=["publish_tool"])
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list.")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to measure, e.g. mayapy.")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for module_name in args.modules:
+        try:
+            rows = measure(module_name, args.python)
+        except RuntimeError as e:
+            print(f"{module_name}: import failed\n{e}")
+            status = 1
+            continue
+
+        # The requested module is the last top-level entry
+        total = next((cumulative for cumulative, _, name in reversed(rows) if name.strip() == module_name), 0)
+        print(f"{module_name}: {total / 1000:.1f} ms, {len(rows)} modules imported")
+        for cumulative, own, name in sorted(rows, reverse=True)[:args.top]:
+            print(f"  {cumulative / 1000:>8.2f} ms  (self {own / 1000:>6.2f})  {name.strip()}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
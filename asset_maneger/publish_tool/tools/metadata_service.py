@@ -0,0 +1,69 @@
+# File: asset_manager/publish_tool/tools/metadata_service.py
+"""
+Runs and controls the workstation's metadata service (see core/metadata_service.py).
+
+Usage:
+    python metadata_service.py serve      # foreground; start it at login, once per machine
+    python metadata_service.py status
+    python metadata_service.py stop
+
+Maya and mayapy sessions find the service through
+~/.pip_dev/services/<project>_<hash>.json and use direct I/O when it is
+not running. Project root and name default to project_config.CONFIG_DATA.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+import publish_tool.core.metadata_service as metadata_service_module
+
+
+def main(argv=None):
+    import project_config as config
+    config_data = getattr(config, "CONFIG_DATA", {})
+
+    parser = argparse.ArgumentParser(description="Run or control the local metadata cache service.")
+    parser.add_argument("command", choices=["serve", "status", "stop"])
+    parser.add_argument("--project-root", default=config_data.get("project_path", "N/A"))
+    parser.add_argument("--project-name", default=config_data.get("project_name", ""))
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on; a free one by default.")
+    parser.add_argument("--no-watch", action="store_true", help="Do not watch the publish tree for changes.")
+    args = parser.parse_args(argv)
+
+    project_root = os.path.join(args.project_root, args.project_name)
+    client = metadata_service_module.MetadataClient(project_root)
+    info = client.ping()
+
+    if args.command == "serve":
+        if info:
+            print(f"A metadata service already runs for '{project_root}' (pid {info['pid']}).")
+            return 1
+        logging.basicConfig(level=logging.INFO)
+        service = metadata_service_module.MetadataService(project_root, port=args.port, watch=not args.no_watch)
+        try:
+            service.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if not info:
+        print(f"No metadata service for '{project_root}'.")
+        return 1
+    if args.command == "status":
+        print(json.dumps(dict(client.stats(), pid=info["pid"],
+                              service_file=metadata_service_module.service_file_path(project_root)), indent=4))
+    else:
+        client.stop_service()
+        print(f"Stopped the metadata service (pid {info['pid']}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# File: asset_manager/publish_tool/tools/publish_catalog.py
+"""
+Refreshes and queries the project publish catalog (see core/catalog.py).
+
+Usage:
+    python publish_catalog.py refresh
+    python publish_catalog.py rebuild
+    python publish_catalog.py latest --type character --department rig
+    python publish_catalog.py versions tree --department mod
+    python publish_catalog.py since "2025-06-01 00:00:00"
+    python publish_catalog.py publisher jdoe
+    python publish_catalog.py storage --department mod
+
+Project root and name default to project_config.CONFIG_DATA.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+from publish_tool.core.catalog import PublishCatalog
+
+
+def format_rows(rows):
+    lines = []
+    for row in rows:
+        lines.append(
+            f"{row['asset_type']:<12} {row['asset_name']:<24} {row['department']:<6} "
+            f"{row['version'] or '-':<6} {row['publish_date'] or '-':<20} {row['publisher'] or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def format_storage_rows(rows):
+    lines = []
+    for row in rows:
+        ratio = row["stored_size"] / row["original_size"] if row["original_size"] else 1.0
+        lines.append(
+            f"{row['department']:<6} {row['storage']:<9} {row['versions']:>7} versions "
+            f"{row['original_size'] / 1024 ** 2:>12.1f} MB -> {row['stored_size'] / 1024 ** 2:>10.1f} MB  ({ratio:.3f})"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import project_config as config
+    config_data = getattr(config, "CONFIG_DATA", {})
+
+    parser = argparse.ArgumentParser(description="Refresh and query the project publish catalog.")
+    parser.add_argument("--project-root", default=config_data.get("project_path", "N/A"))
+    parser.add_argument("--project-name", default=config_data.get("project_name", ""))
+    parser.add_argument("--db", help="Catalog file; defaults to the local per-project catalog.")
+    parser.add_argument("--no-refresh", action="store_true", help="Query without refreshing first.")
+    parser.add_argument("--json", action="store_true", help="Print rows as JSON.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("refresh", help="Reindex changed metadata folders.")
+    commands.add_parser("rebuild", help="Drop the catalog and index everything again.")
+
+    latest = commands.add_parser("latest", help="Latest version of every asset.")
+    latest.add_argument("--type", dest="asset_type")
+    latest.add_argument("--department")
+
+    versions = commands.add_parser("versions", help="Every version of one asset.")
+    versions.add_argument("asset_name")
+    versions.add_argument("--department")
+    versions.add_argument("--type", dest="asset_type")
+
+    since = commands.add_parser("since", help="Versions published at or after a date.")
+    since.add_argument("timestamp", help="'YYYY-MM-DD HH:MM:SS'")
+    since.add_argument("--department")
+
+    publisher = commands.add_parser("publisher", help="Versions published by one user.")
+    publisher.add_argument("publisher")
+    publisher.add_argument("--since")
+
+    storage = commands.add_parser("storage", help="Original and stored bytes per department and storage mode.")
+    storage.add_argument("--department")
+
+    args = parser.parse_args(argv)
+
+    project_root = os.path.join(args.project_root, args.project_name)
+    catalog = PublishCatalog(project_root, db_path=args.db)
+
+    if args.command == "rebuild":
+        print(catalog.rebuild())
+        return 0
+    if args.command == "refresh" or not args.no_refresh:
+        stats = catalog.refresh()
+        if args.command == "refresh":
+            print(stats)
+            return 0
+
+    start = time.perf_counter()
+    if args.command == "latest":
+        rows = catalog.latest_versions(asset_type=args.asset_type, department=args.department)
+    elif args.command == "versions":
+        rows = catalog.get_versions(args.asset_name, department=args.department, asset_type=args.asset_type)
+    elif args.command == "since":
+        rows = catalog.published_since(args.timestamp, department=args.department)
+    elif args.command == "storage":
+        rows = catalog.storage_summary(department=args.department)
+    else:
+        rows = catalog.find_by_publisher(args.publisher, since=args.since)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(rows, indent=4))
+    else:
+        print(format_storage_rows(rows) if args.command == "storage" else format_rows(rows))
+        print(f"{len(rows)} rows in {elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# File: asset_manager/publish_tool/tools/publish_traces.py
+"""
+Reports on the publish trace events in ~/.pip_dev/traces/publish_events.jsonl
+(see core/trace_utils.py).
+
+    python publish_traces.py steps                 # time per step and op over all publishes
+    python publish_traces.py slowest --top 10      # slowest publishes and their slowest step
+    python publish_traces.py show <trace_id>       # every span of one publish
+
+Profiles saved with profile_publish / --profile open with the standard library:
+
+    python -m pstats E:/grow/publish/prop/tree/mod/data/profile/tree_mod_v004.prof
+"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+import publish_tool.core.trace_utils as trace_utils
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def span_stats(events, department=None):
+    """
+    Returns [(kind, name, count, mean, p50, p95, max)] over all spans, slowest p95 first.
+    """
+    traces = {e["trace_id"] for e in events if e["event"] == "trace"
+              and (not department or e.get("department") == department)}
+    seconds = collections.defaultdict(list)
+    for event in events:
+        if event["event"] == "span" and event["trace_id"] in traces:
+            seconds[(event["kind"], event["name"])].append(event["seconds"])
+    rows = [
+        (kind, name, len(values), sum(values) / len(values),
+         percentile(values, 0.5), percentile(values, 0.95), max(values))
+        for (kind, name), values in seconds.items()
+    ]
+    return sorted(rows, key=lambda row: (row[0] != "step", -row[5]))
+
+
+def format_span_stats(rows):
+    lines = [f"{'kind':<5} {'name':<44} {'count':>6} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}"]
+    for kind, name, count, mean, p50, p95, slowest in rows:
+        lines.append(f"{kind:<5} {name:<44} {count:>6} {mean:>8.3f} {p50:>8.3f} {p95:>8.3f} {slowest:>8.3f}")
+    return "\n".join(lines)
+
+
+def format_slowest(events, top):
+    traces = sorted((e for e in events if e["event"] == "trace"), key=lambda e: e["seconds"], reverse=True)
+    lines = []
+    for trace in traces[:top]:
+        steps = trace.get("steps") or {}
+        slowest = max(steps.items(), key=lambda item: item[1]) if steps else ("-", 0.0)
+        label = f"{trace.get('asset_name', '?')} {trace.get('department', '?')} {trace.get('version', '?')}"
+        lines.append(f"{trace['trace_id']}  {trace['seconds']:>8.3f}s  {trace.get('status', '?'):<9} "
+                     f"{label:<32} slowest: {slowest[0]} ({slowest[1]:.3f}s)")
+    return "\n".join(lines) or "No traces recorded."
+
+
+def format_trace(events, trace_id):
+    spans = sorted((e for e in events if e["event"] == "span" and e["trace_id"] == trace_id),
+                   key=lambda e: e["start"])
+    closing = next((e for e in events if e["event"] == "trace" and e["trace_id"] == trace_id), None)
+    if closing is None:
+        return f"No trace '{trace_id}'."
+    lines = []
+    for span in spans:
+        indent = "  " if span["kind"] != "step" else ""
+        lines.append(f"{span['start']:>9.3f}  {span['seconds']:>8.3f}s  {indent}{span['name']}  [{span['thread']}]")
+    lines.append(f"counters: {json.dumps(closing.get('counters', {}))}")
+    if closing.get("profile"):
+        lines.append(f"profile: {closing['profile']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report on recorded publish traces.")
+    parser.add_argument("--log", help=f"Event log, defaults to {trace_utils.default_log_path()}.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    steps = commands.add_parser("steps", help="Time per step and op over all publishes.")
+    steps.add_argument("--department", help="Only publishes of this department code, e.g. mod.")
+    slowest = commands.add_parser("slowest", help="Slowest publishes.")
+    slowest.add_argument("--top", type=int, default=10)
+    show = commands.add_parser("show", help="Every span of one publish.")
+    show.add_argument("trace_id")
+    args = parser.parse_args(argv)
+
+    events = trace_utils.read_events(args.log)
+    if args.command == "steps":
+        print(format_span_stats(span_stats(events, args.department)))
+    elif args.command == "slowest":
+        print(format_slowest(events, args.top))
+    else:
+        print(format_trace(events, args.trace_id))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
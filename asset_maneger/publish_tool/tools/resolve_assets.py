@@ -0,0 +1,70 @@
+# File: asset_manager/publish_tool/tools/resolve_assets.py
+"""
+Resolves asset URIs to published files (see core/asset_resolver.py).
+
+Usage:
+    python resolve_assets.py asset://character/hero/rig asset://prop/tree/mod@v003
+    python resolve_assets.py --file set_dressing.txt --materialize
+    python resolve_assets.py --file set_dressing.txt --json
+
+--file reads one URI per line ('#' starts a comment). Project root and name
+default to project_config.CONFIG_DATA.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+from publish_tool.core.asset_resolver import AssetResolver
+
+
+def read_uris(path):
+    with open(path) as f:
+        return [line.split("#", 1)[0].strip() for line in f if line.split("#", 1)[0].strip()]
+
+
+def main(argv=None):
+    import project_config as config
+    config_data = getattr(config, "CONFIG_DATA", {})
+
+    parser = argparse.ArgumentParser(description="Resolve asset URIs to published files.")
+    parser.add_argument("uris", nargs="*", help="asset://<type>/<name>/<department>[@<version>]")
+    parser.add_argument("--file", help="Text file with one URI per line.")
+    parser.add_argument("--project-root", default=config_data.get("project_path", "N/A"))
+    parser.add_argument("--project-name", default=config_data.get("project_name", ""))
+    parser.add_argument("--materialize", action="store_true",
+                        help="Return plain local files (decompressed or rebuilt from delta chains).")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--json", action="store_true", help="Print the history record of every URI as JSON.")
+    args = parser.parse_args(argv)
+
+    uris = args.uris + (read_uris(args.file) if args.file else [])
+    if not uris:
+        parser.error("No asset URIs given.")
+
+    resolver = AssetResolver(os.path.join(args.project_root, args.project_name))
+    start = time.perf_counter()
+    if args.materialize:
+        results = resolver.materialize_many(uris, workers=args.workers)
+    else:
+        results = resolver.resolve_many(uris, workers=args.workers, with_records=args.json)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+    else:
+        for uri, path in results.items():
+            print(f"{uri:<48} {path or 'NOT FOUND'}")
+        missing = sum(1 for path in results.values() if path is None)
+        print(f"{len(results)} URIs, {missing} not found, in {elapsed * 1000:.1f} ms")
+    return 1 if any(value is None for value in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# File: asset_manager/publish_tool/tools/stress_version_reservation.py
+"""
+Stress test for VersionUtils.reserve_version.
+
+Runs many publisher processes against one local directory. Each publisher
+repeatedly claims a version, writes the versioned file and releases the
+claim; a share of them "crash" and leave their claim behind. The run fails
+if two publishers ever received the same version or if any abandoned claim
+blocked progress after the timeout.
+
+Usage:
+    python stress_version_reservation.py --processes 48 --publishes 10
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+from publish_tool.core.version_utils import VersionUtils, CLAIM_EXT
+
+
+def run_publisher(args):
+    """
+    Publishes `publishes` versions and returns the list of file names written.
+    Every `abandon_every`-th reservation is left unreleased to simulate a crash.
+    """
+    path, worker_id, publishes, abandon_every, stale_timeout = args
+    written = []
+    for index in range(publishes):
+        reservation = VersionUtils.reserve_version(
+            path, "stress", "mod", stale_timeout=stale_timeout, max_attempts=500
+        )
+        if reservation is None:
+            raise RuntimeError(f"Publisher {worker_id} could not reserve a version.")
+
+        if abandon_every and (index + 1) % abandon_every == 0:
+            continue
+
+        with open(reservation.full_path, "x") as f:
+            f.write(f"{worker_id}:{index}\n")
+        reservation.release()
+        written.append(reservation.file_name)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent version reservation stress test.")
+    parser.add_argument("--processes", type=int, default=48)
+    parser.add_argument("--publishes", type=int, default=10, help="Publishes per process.")
+    parser.add_argument("--abandon-every", type=int, default=7, help="Abandon every Nth claim (0 disables).")
+    parser.add_argument("--stale-timeout", type=float, default=5.0,
+                        help="Claim expiry in seconds; must exceed how long a live publisher holds a claim.")
+    parser.add_argument("--path", help="Directory to publish into (default: a new temp dir).")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR, format='[%(levelname)s] %(message)s')
+    path = args.path or tempfile.mkdtemp(prefix="version_stress_")
+    os.makedirs(path, exist_ok=True)
+
+    jobs = [
+        (path, worker_id, args.publishes, args.abandon_every, args.stale_timeout)
+        for worker_id in range(args.processes)
+    ]
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as pool:
+        results = pool.map(run_publisher, jobs)
+    elapsed = time.perf_counter() - start
+
+    written = [name for names in results for name in names]
+    duplicates = len(written) - len(set(written))
+    on_disk = sorted(f for f in os.listdir(path) if f.endswith(".ma"))
+    owners_ok = all(len(open(os.path.join(path, f)).read().splitlines()) == 1 for f in on_disk)
+
+    # Abandoned claims must expire so the next publisher does not skip past them
+    time.sleep(args.stale_timeout)
+    follow_up = VersionUtils.reserve_version(path, "stress", "mod", stale_timeout=args.stale_timeout)
+    if follow_up:
+        follow_up.release()
+    latest_written = max(int(f.rsplit("_v", 1)[1][:-3]) for f in on_disk) if on_disk else 0
+    expected_next = latest_written + 1
+    leftover_claims = [f for f in os.listdir(path) if f.endswith(CLAIM_EXT)]
+
+    print(f"Directory:         {path}")
+    print(f"Publishers:        {args.processes} x {args.publishes}")
+    print(f"Files written:     {len(written)} in {elapsed:.2f}s")
+    print(f"Duplicate claims:  {duplicates}")
+    print(f"Single owner:      {owners_ok}")
+    print(f"Next after expiry: {follow_up.version_str if follow_up else None} (expected v{expected_next:03d})")
+    print(f"Leftover claims:   {len(leftover_claims)}")
+
+    ok = (
+        duplicates == 0
+        and owners_ok
+        and len(on_disk) == len(written)
+        and follow_up is not None
+        and follow_up.version_str == f"v{expected_next:03d}"
+    )
+    print("PASSED" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
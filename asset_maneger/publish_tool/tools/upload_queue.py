@@ -0,0 +1,81 @@
+# File: asset_manager/publish_tool/tools/upload_queue.py
+"""
+Inspects and drains the local publish upload queue (see core/upload_queue.py).
+
+Jobs are left in the staging dir when Maya closes before an upload
+finished; the Asset Publisher resumes them when it opens, or run:
+
+    python upload_queue.py status
+    python upload_queue.py resume          # upload pending jobs and wait
+    python upload_queue.py retry           # failed jobs too
+    python upload_queue.py discard <job_id>
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ASSET_MGR_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ASSET_MGR_ROOT not in sys.path:
+    sys.path.insert(0, ASSET_MGR_ROOT)
+
+from publish_tool.core.upload_queue import UploadJob, UploadQueue
+
+
+def load_jobs(staging_dir):
+    jobs = []
+    if os.path.isdir(staging_dir):
+        for name in sorted(os.listdir(staging_dir)):
+            job = UploadJob.load(os.path.join(staging_dir, name))
+            if job is not None:
+                jobs.append(job.to_dict())
+    return jobs
+
+
+def format_jobs(jobs):
+    lines = []
+    for job in jobs:
+        done = sum(1 for f in job["files"] if f["done"])
+        size = sum(f["size"] for f in job["files"])
+        targets = ", ".join(os.path.basename(f["target"]) for f in job["files"])
+        lines.append(f"{job['id']}  {job['state']:<9} {done}/{len(job['files'])} files  "
+                     f"{size / 1024 ** 2:8.1f} MB  {targets}")
+        if job.get("error"):
+            lines.append(f"    {job['error']}")
+    return "\n".join(lines) or "No staged uploads."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and drain the publish upload queue.")
+    parser.add_argument("--staging-dir", help="Defaults to ~/.pip_dev/staging.")
+    parser.add_argument("--json", action="store_true", help="Print jobs as JSON.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="List staged jobs.")
+    commands.add_parser("resume", help="Upload pending jobs and wait for them.")
+    commands.add_parser("retry", help="Upload pending and failed jobs and wait for them.")
+    discard = commands.add_parser("discard", help="Delete a job that is not uploading.")
+    discard.add_argument("job_id")
+    args = parser.parse_args(argv)
+
+    uploads = UploadQueue.instance(args.staging_dir)
+    if args.command in ("resume", "retry"):
+        start = time.perf_counter()
+        count = uploads.resume()
+        if args.command == "retry":
+            count += uploads.retry_failed()
+        uploads.wait()
+        print(f"{count} job(s) processed in {time.perf_counter() - start:.1f}s")
+    elif args.command == "discard":
+        if not uploads.discard(args.job_id):
+            print(f"No discardable job '{args.job_id}'.")
+            return 1
+
+    jobs = load_jobs(uploads.staging_dir)
+    print(json.dumps(jobs, indent=4) if args.json else format_jobs(jobs))
+    return 0 if all(job["state"] != "failed" for job in jobs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
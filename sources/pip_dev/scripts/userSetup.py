@@ -1,30 +1,55 @@
 import sys
 import os
-import maya.utils
+import time
+
+
+def _find_script_dir():
+    """
+    Returns the folder holding this userSetup.py.
+
+    Maya normally runs userSetup.py with __file__ set; if it is missing the
+    running code object still knows its file name. Scanning sys.path is the
+    last resort, because it stats every entry at startup.
+    """
+    try:
+        return os.path.dirname(os.path.abspath(__file__))
+    except NameError:
+        pass
+
+    code_file = sys._getframe().f_code.co_filename
+    if code_file and os.path.basename(code_file) == "userSetup.py":
+        return os.path.dirname(os.path.abspath(code_file))
 
-def setup_pip_dev():
-    script_dir = None
-    # Find the directory of the current script in sys.path
     for path in sys.path:
-        script_path = os.path.join(path, "userSetup.py")
-        if os.path.exists(script_path):
-            script_dir = path
-            break
+        if os.path.exists(os.path.join(path, "userSetup.py")):
+            return path
+    return None
+
+
+def setup_pip_dev():
+    start = time.perf_counter()
 
-    if script_dir:
-        # Calculate root_path relative to the script_dir
+    # PIP_DEV_ROOT skips the lookup entirely
+    root_path = os.environ.get("PIP_DEV_ROOT")
+    if not root_path:
+        script_dir = _find_script_dir()
+        if not script_dir:
+            print("[pip_dev] ❌ Could not determine userSetup.py directory")
+            return
         # Go up three levels from scripts to pip_dev (scripts -> pip_dev -> sources -> pip_dev root)
         root_path = os.path.abspath(os.path.join(script_dir, "../../../"))
-        asset_maneger_path = os.path.join(root_path, "asset_maneger")
 
-        if os.path.isdir(asset_maneger_path) and asset_maneger_path not in sys.path:
-            sys.path.append(asset_maneger_path)
-            print(f"[pip_dev] ✅ Added path: {asset_maneger_path}")
-        else:
-            print(f"[pip_dev] ❌ Could not add path: {asset_maneger_path}")
+    asset_maneger_path = os.path.join(root_path, "asset_maneger")
 
+    if asset_maneger_path in sys.path:
+        return
+    if os.path.isdir(asset_maneger_path):
+        sys.path.append(asset_maneger_path)
+        print(f"[pip_dev] ✅ Added path: {asset_maneger_path} ({(time.perf_counter() - start) * 1000:.1f} ms)")
     else:
-        print("[pip_dev] ❌ Could not determine userSetup.py directory in sys.path")
+        print(f"[pip_dev] ❌ Could not add path: {asset_maneger_path}")
 
 
-maya.utils.executeDeferred(setup_pip_dev)
+# Only touches sys.path, so it runs right away instead of deferred;
+# publish_tool itself is imported on first use (publish_tool.show()).
+setup_pip_dev()